@@ -5,15 +5,18 @@ Python ABC notation tools
 __version__ = "0.1.0.dev2"
 
 from .note import Key, Note
-from .parse import Tune, _load_abcjs_if_in_jupyter
+from .parse import ParsePool, Tune, _load_abcjs_if_in_jupyter
 from .pitch import Pitch, PitchClass
+from .tunebook import scan_headers
 
 __all__ = (
     "Key",
     "Note",
+    "ParsePool",
     "Pitch",
     "PitchClass",
     "Tune",
+    "scan_headers",
 )
 
 _load_abcjs_if_in_jupyter()
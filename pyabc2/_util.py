@@ -1,7 +1,28 @@
 """Internal utilities."""
 
+import itertools
 import logging
+import queue
 import sys
+from collections import deque
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Deque,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    TypeVar,
+    Union,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    import concurrent.futures
+    import multiprocessing.pool
+
+T = TypeVar("T")
+R = TypeVar("R")
 
 
 def get_logger(name: str) -> logging.Logger:
@@ -17,3 +38,92 @@ def get_logger(name: str) -> logging.Logger:
     logger.addHandler(sh)
 
     return logger
+
+
+def _map_chunk(func: Callable[[T], R], chunk: List[T]) -> List[R]:
+    return [func(x) for x in chunk]
+
+
+class _ChunkError(NamedTuple):
+    error: BaseException
+
+
+def imap_chunked(
+    pool: Union["multiprocessing.pool.Pool", "concurrent.futures.Executor"],
+    func: Callable[[T], R],
+    iterable: Iterable[T],
+    *,
+    chunksize: int = 64,
+    ordered: bool = True,
+    max_in_flight: int = 2,
+) -> Iterator[R]:
+    """Like ``pool.imap`` (or ``pool.imap_unordered`` if not `ordered`),
+    but `iterable` is consumed lazily, with at most `max_in_flight` chunks
+    submitted to the pool and not yet yielded at any time,
+    so memory usage is bounded even if the consumer is slow.
+    `pool` can also be a :class:`concurrent.futures.Executor`.
+    """
+    import concurrent.futures
+
+    if chunksize < 1:
+        raise ValueError("`chunksize` must be at least 1")
+    if max_in_flight < 1:
+        raise ValueError("`max_in_flight` must be at least 1")
+
+    it = iter(iterable)
+    chunks = iter(lambda: list(itertools.islice(it, chunksize)), [])
+    done: "queue.SimpleQueue[Union[List[R], _ChunkError]]" = queue.SimpleQueue()
+
+    if isinstance(pool, concurrent.futures.Executor):
+        executor = pool
+
+        def submit(chunk: List[T]) -> Callable[[], List[R]]:
+            return executor.submit(_map_chunk, func, chunk).result
+
+        def put_result(fut: "concurrent.futures.Future[List[R]]") -> None:
+            e = fut.exception()
+            done.put(fut.result() if e is None else _ChunkError(e))
+
+        def submit_cb(chunk: List[T]) -> None:
+            executor.submit(_map_chunk, func, chunk).add_done_callback(put_result)
+
+    else:
+        mp_pool = pool
+
+        def submit(chunk: List[T]) -> Callable[[], List[R]]:
+            return mp_pool.apply_async(_map_chunk, (func, chunk)).get
+
+        def submit_cb(chunk: List[T]) -> None:
+            mp_pool.apply_async(
+                _map_chunk,
+                (func, chunk),
+                callback=done.put,
+                error_callback=lambda e: done.put(_ChunkError(e)),
+            )
+
+    if ordered:
+        pending: Deque[Callable[[], List[R]]] = deque()
+        for chunk in chunks:
+            pending.append(submit(chunk))
+            if len(pending) >= max_in_flight:
+                yield from pending.popleft()()
+        while pending:
+            yield from pending.popleft()()
+    else:
+
+        def get() -> List[R]:
+            res = done.get()
+            if isinstance(res, _ChunkError):
+                raise res.error
+            return res
+
+        n_pending = 0
+        for chunk in chunks:
+            submit_cb(chunk)
+            n_pending += 1
+            if n_pending >= max_in_flight:
+                yield from get()
+                n_pending -= 1
+        while n_pending:
+            yield from get()
+            n_pending -= 1
@@ -4,7 +4,8 @@ Key (e.g., G, Em, Ador)
 # https://github.com/campagnola/pyabc/blob/4c22a70a0f40ff82f608ffc19a1ca51a153f8c24/pyabc.py#L94
 import re
 import warnings
-from typing import Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Dict, FrozenSet, List, Mapping, NamedTuple, Optional, Tuple
 
 from .pitch import PitchClass
 
@@ -228,12 +229,40 @@ SHARP_ORDER = list("FCGDAEB")
 FLAT_ORDER = list("BEADGCF")
 
 
+class _KeyTables(NamedTuple):
+    key_signature: Tuple[str, ...]
+    accidentals: Mapping[str, str]
+    scale: Tuple[PitchClass, ...]
+    scale_names: FrozenSet[str]
+
+
+_KEY_CACHE: Dict[Tuple[type, str, str], "Key"] = {}
+"""Interned keys, by class, tonic name, and mode abbreviation."""
+
+_EQUIV_MODES = {"ion": "maj", "aeo": "min"}
+"""Mode abbreviations sharing the key tables of the equivalent major/minor."""
+
+_KEY_NAME_CACHE: Dict[Tuple[type, str], "Key"] = {}
+"""Interned keys, by class and key name."""
+
+
 class Key:
-    """Key, including mode."""
+    """Key, including mode.
+
+    Keys are immutable and interned,
+    so creating a key with the same tonic and mode again returns the same object.
+    Key signature, accidentals, and scale are computed once per key.
+    """
+
+    __slots__ = ("tonic", "_mode", "_tables")
+
+    tonic: PitchClass
+    _mode: str
+    _tables: Optional[_KeyTables]
 
     # TODO: maybe should move name to a .from_name for consistency with Pitch(Class)
-    def __init__(
-        self,
+    def __new__(
+        cls,
         name: Optional[str] = None,
         *,
         tonic: Optional[str] = None,
@@ -252,14 +281,77 @@ class Key:
         """
         if name is not None:
             assert tonic is None and mode is None, "pass either `name` or `tonic`+`mode`"
-            # Handle occasional `K:` line used to indicate default key (C) and tune start
-            if name == "":
-                name = "C"
-            self.tonic, self._mode = Key.parse_key(name)
+            self = _KEY_NAME_CACHE.get((cls, name))
+            if self is None:
+                # Handle occasional `K:` line used to indicate default key (C) and tune start
+                tonic_pc, mode_ = Key.parse_key(name if name != "" else "C")
+                self = cls._get(tonic_pc.name, mode_)
+                _KEY_NAME_CACHE[(cls, name)] = self
         else:
             assert tonic is not None and mode is not None, "pass either `name` or `tonic`+`mode`"
-            self.tonic = PitchClass.from_name(tonic)
-            self._mode = _validate_and_normalize_mode_name(mode)
+            self = cls._get(tonic, _validate_and_normalize_mode_name(mode))
+
+        return self
+
+    @classmethod
+    def _get(cls, tonic: str, mode: str) -> "Key":
+        """Get interned key by tonic name and mode abbreviation, creating it if necessary."""
+        self = _KEY_CACHE.get((cls, tonic, mode))
+        if self is None:
+            self = object.__new__(cls)
+            object.__setattr__(self, "tonic", PitchClass.from_name(tonic))
+            object.__setattr__(self, "_mode", mode)
+            object.__setattr__(self, "_tables", None)
+            _KEY_CACHE[(cls, tonic, mode)] = self
+
+        return self
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __reduce__(self):
+        # Recreate through the intern table instead of copying state
+        return (type(self)._get, (self.tonic.name, self._mode))
+
+    def _get_tables(self) -> _KeyTables:
+        """Key signature, accidentals, and scale, computed on first use
+        (shared by equivalent modes, e.g. major/ionian)."""
+        tables = self._tables
+        if tables is not None:
+            return tables
+
+        equiv = _EQUIV_MODES.get(self._mode)
+        if equiv is not None:
+            tables = type(self)._get(self.tonic.name, equiv)._get_tables()
+            object.__setattr__(self, "_tables", tables)
+            return tables
+
+        # Determine number of sharps/flats for this key by first converting
+        # to Ionian, then doing the key lookup.
+        key = self.relative_major
+        num_acc = IONIAN_SHARPFLAT_COUNT[key.tonic.name]
+
+        sig = []
+        # Sharps or flats?
+        if num_acc > 0:
+            for i in range(num_acc):
+                sig.append(SHARP_ORDER[i] + "#")
+        else:
+            for i in range(-num_acc):
+                sig.append(FLAT_ORDER[i] + "b")
+
+        accidentals = {s[0]: s[1:] for s in sig}
+        scale = tuple(PitchClass.from_name(n + accidentals.get(n, "")) for n in self._letters)
+
+        tables = _KeyTables(
+            key_signature=tuple(sig),
+            accidentals=MappingProxyType(accidentals),
+            scale=scale,
+            scale_names=frozenset(pc.name for pc in scale),
+        )
+        object.__setattr__(self, "_tables", tables)
+
+        return tables
 
     @property
     def mode(self) -> str:
@@ -299,28 +391,14 @@ class Key:
         List of accidentals that should be displayed in the key
         signature for the given key description.
         """
-        # Determine number of sharps/flats for this key by first converting
-        # to Ionian, then doing the key lookup.
-        key = self.relative_major
-        num_acc = IONIAN_SHARPFLAT_COUNT[key.tonic.name]
-
-        sig = []
-        # Sharps or flats?
-        if num_acc > 0:
-            for i in range(num_acc):
-                sig.append(SHARP_ORDER[i] + "#")
-        else:
-            for i in range(-num_acc):
-                sig.append(FLAT_ORDER[i] + "b")
-
-        return sig
+        return list(self._get_tables().key_signature)
 
     @property
-    def accidentals(self) -> Dict[str, str]:
-        """A dictionary of accidentals in the key signature,
+    def accidentals(self) -> Mapping[str, str]:
+        """A (read-only) dictionary of accidentals in the key signature,
         mapping natural note names to the accidental applied.
         """
-        return {p: a for p, a in self.key_signature}  # type: ignore[misc, has-type]
+        return self._get_tables().accidentals
 
     def relative(self, mode: str, *, match_acc: bool = False) -> "Key":
         mode = _validate_and_normalize_mode_name(mode)
@@ -385,9 +463,12 @@ class Key:
     @property
     def scale(self) -> List[PitchClass]:
         """Notes (pitch classes) of the scale."""
-        nats = self._letters
-        notes = [n + self.accidentals.get(n, "") for n in nats]
-        return [PitchClass.from_name(n) for n in notes]
+        return list(self._get_tables().scale)
+
+    @property
+    def _scale_names(self) -> FrozenSet[str]:
+        """Names of the notes of the scale."""
+        return self._get_tables().scale_names
 
     def print_scale(self) -> None:
         print(" ".join(f"{str(pc):2}" for pc in self.scale))
@@ -438,11 +519,33 @@ class Key:
         return f"Key(tonic={self.tonic.name}, mode={self.mode!r})"
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if isinstance(other, Key):
             return self.tonic == other.tonic and _mode_is_equiv(self._mode, other._mode)
         else:
             return NotImplemented
 
+    def __hash__(self):
+        return hash((self.tonic.value, MODE_VALUES[self._mode]))
+
+
+def _warm_key_cache() -> None:
+    """Create the keys for all tonic and mode combinations, with their tables."""
+    from .pitch import NICE_C_CHROMATIC_NOTES
+
+    for tonic in NICE_C_CHROMATIC_NOTES:
+        for mode in MODE_VALUES:
+            key = Key(tonic=tonic, mode=mode)
+            try:
+                key._get_tables()
+            except KeyError:
+                # Relative major not in `IONIAN_SHARPFLAT_COUNT`, e.g. C# Lydian
+                pass
+
+
+_warm_key_cache()
+
 
 # class ContextualizedPitchClass(PitchClass):
 #     """A pitch class that knows how it fits in a scale (key/mode),
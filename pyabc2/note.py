@@ -1,13 +1,21 @@
 """
 Note class (pitch + duration)
 """
+import functools
+import itertools
 import re
+import sys
+from array import array
+from collections.abc import Sequence
 from fractions import Fraction
-from typing import Optional
+from typing import TYPE_CHECKING, Dict, Iterable, Iterator, List, Optional, Tuple, Union, overload
 
 from .key import Key
 from .pitch import ACCIDENTAL_DVALUES, Pitch, pitch_class_value
 
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy
+
 _S_RE_NOTE = (
     r"(?P<acc>\^|\^\^|=|_|__)?"
     r"(?P<note>[a-gA-G])"
@@ -56,14 +64,202 @@ _DEFAULT_KEY = Key("Cmaj")
 _DEFAULT_UNIT_DURATION = Fraction("1/8")
 
 
+def _decode_abc_match(
+    m: re.Match,
+    *,
+    key: Key = _DEFAULT_KEY,
+    octave_base: int = _DEFAULT_OCTAVE_BASE,
+    unit_duration: Fraction = _DEFAULT_UNIT_DURATION,
+) -> Tuple[int, Fraction, Optional[str], int]:
+    """Decode ABC note regex match into
+    (value, duration, class name if explicitly spelled with accidentals, octave).
+    """
+    g = m.groupdict()
+
+    note = g["note"]
+    octave_marks = g["oct"]
+    acc_marks = g["acc"]
+
+    octave = _octave_from_abc_parts(note, octave_marks, base=octave_base)
+    nat_class_name = note.upper()
+
+    if acc_marks is not None:
+        acc_ascii = acc_marks
+        for a, b in _ACCIDENTAL_ABC_TO_ASCII.items():
+            acc_ascii = acc_ascii.replace(a, b)
+    else:
+        acc_ascii = ""
+
+    # Compute value
+    dvalue_acc = 0 if acc_marks is None else acc_marks.count("^") - acc_marks.count("_")
+    if acc_marks is None:
+        # Only bring in key signature if no accidental marks
+        dvalue_key = (
+            0
+            if nat_class_name not in key.accidentals
+            else ACCIDENTAL_DVALUES[key.accidentals[nat_class_name]]
+        )
+    else:
+        dvalue_key = 0
+    value = pitch_class_value(nat_class_name) + 12 * octave + dvalue_acc + dvalue_key
+
+    # Determine duration (relative to the unit duration)
+    sla = g["slash"]
+    num = g["num"]
+    den = g["den"]
+    if sla is not None:
+        # raise ValueError("only whole multiples of L supported at this time")
+        if num is None and den is None:
+            # Special case: `/` as shorthand for 1/2 and can be multiple
+            rel_num, rel_den = 1, 2 ** sla.count("/")
+        elif num is not None and den is not None:
+            # We have both numerator and denominator
+            assert (
+                sla == "/"
+            ), "there should only be one `/` when using both numerator and denominator"
+            rel_num, rel_den = int(num), int(den)
+        elif den is not None:
+            # When only denominator, numerator 1 is assumed
+            assert sla == "/", "there should only be one `/` when only denominator is used"
+            rel_num, rel_den = 1, int(den)
+        elif num is not None:
+            # When only numerator, denominator 2 is assumed
+            assert sla == "/", "there should be only one `/` when only numerator is used"
+            # ^ Not 100% sure about this though
+            rel_num, rel_den = int(num), 2
+        else:
+            raise ValueError(f"invalid relative duration spec. in {m.group(0)!r}")
+            # (Shouldn't ever get here.)
+    else:
+        rel_num, rel_den = int(num) if num is not None else 1, 1
+
+    duration = Fraction(rel_num * unit_duration.numerator, rel_den * unit_duration.denominator)
+
+    class_name = nat_class_name + acc_ascii if acc_marks is not None else None
+
+    return value, duration, class_name, octave
+
+
+TICKS_PER_WHOLE = 1920
+"""A good choice of integer ticks per whole note for representing note durations.
+Divisible by 2**7 (down to 128th notes) as well as 3 and 5 (for triplets and quintuplets).
+"""
+
+_NOTE_CACHE_SIZE = 2**14
+
+
+@functools.lru_cache(maxsize=_NOTE_CACHE_SIZE)
+def _decode_abc_note(
+    abc: str,
+    key_id: Tuple[str, str],
+    unit_duration: Fraction,
+    octave_base: int,
+    ticks_per_whole: Optional[int] = None,
+) -> Tuple[int, Union[Fraction, int], Optional[str], int]:
+    """Memoized decoding of a single ABC note token,
+    with the key identified by tonic name and mode abbreviation.
+    (Different keys can compare equal, e.g. G# minor and Ab minor,
+    but have different accidentals.)
+    If `ticks_per_whole` is set, the duration is returned as integer ticks.
+    """
+    m = _RE_NOTE.fullmatch(abc)
+    if m is None:
+        raise ValueError(f"invalid ABC note specification {abc!r}")
+
+    value, duration, class_name, octave = _decode_abc_match(
+        m, key=Key._get(*key_id), octave_base=octave_base, unit_duration=unit_duration
+    )
+    if ticks_per_whole is None:
+        return value, duration, class_name, octave
+
+    return value, _duration_to_ticks(duration, ticks_per_whole), class_name, octave
+
+
+def _duration_to_ticks(duration: Fraction, ticks_per_whole: int) -> int:
+    ticks = duration * ticks_per_whole
+    if ticks.denominator != 1:
+        raise ValueError(
+            f"duration {duration} can't be represented with {ticks_per_whole} ticks per whole note"
+        )
+
+    return ticks.numerator
+
+
+def note_cache_info():
+    """Hit/miss statistics for the cache of decoded ABC note tokens
+    used when parsing tunes.
+    """
+    return _decode_abc_note.cache_info()
+
+
+def clear_note_cache() -> None:
+    """Clear the cache of decoded ABC note tokens, resetting the statistics."""
+    _decode_abc_note.cache_clear()
+
+
 class Note(Pitch):
-    """A note has a pitch and a duration."""
+    """A note has a pitch and a duration.
+
+    Unlike pitches, notes are not shared, so their value can be changed.
+    """
+
+    __slots__ = ("duration",)
+
+    duration: Fraction
+    """Note duration. By default, 1/8, an eighth note."""
 
-    def __init__(self, value: int, duration: Fraction = _DEFAULT_UNIT_DURATION):
-        super().__init__(value)
+    def __new__(cls, value: int, duration: Fraction = _DEFAULT_UNIT_DURATION):
+        return cls._new(value, duration)
 
-        self.duration = duration
-        """Note duration. By default, 1/8, an eighth note."""
+    @property
+    def value(self) -> int:
+        """Chromatic note value relative to C0."""
+        return self._value
+
+    @value.setter
+    def value(self, value: int) -> None:
+        self._value = value
+        self._name_cache = None
+
+    @classmethod
+    def _new(  # type: ignore[override]
+        cls,
+        value: int,
+        duration: Fraction = _DEFAULT_UNIT_DURATION,
+        class_name: Optional[str] = None,
+        octave: Optional[int] = None,
+    ) -> "Note":
+        """Create new instance, bypassing ``__init__``."""
+        note = super()._new(value, class_name, octave)
+        note.duration = duration  # type: ignore[attr-defined]
+
+        return note  # type: ignore[return-value]
+
+    def __reduce__(self):
+        d = self.duration
+        return (
+            type(self)._from_parts,
+            (
+                self.value,
+                d.numerator,
+                d.denominator,
+                self._spelled_class_name,
+                self._spelled_octave,
+            ),
+        )
+
+    @classmethod
+    def _from_parts(
+        cls,
+        value: int,
+        duration_num: int,
+        duration_den: int,
+        class_name: Optional[str],
+        octave: Optional[int],
+    ) -> "Note":
+        """Create from the form used for pickling
+        (avoiding the string round trip of pickled :class:`~fractions.Fraction`)."""
+        return cls._new(value, Fraction(duration_num, duration_den), class_name, octave)
 
     def __str__(self):
         return f"{self.name}_{self.duration}"
@@ -122,71 +318,11 @@ class Note(Pitch):
             raise ValueError("invalid ABC note specification")
             # TODO: would be nice to have the input string in this error message
 
-        g = m.groupdict()
-
-        note = g["note"]
-        octave_marks = g["oct"]
-        acc_marks = g["acc"]
-
-        octave = _octave_from_abc_parts(note, octave_marks, base=octave_base)
-        nat_class_name = note.upper()
-
-        if acc_marks is not None:
-            acc_ascii = acc_marks
-            for a, b in _ACCIDENTAL_ABC_TO_ASCII.items():
-                acc_ascii = acc_ascii.replace(a, b)
-        else:
-            acc_ascii = ""
-
-        # Compute value
-        dvalue_acc = 0 if acc_marks is None else acc_marks.count("^") - acc_marks.count("_")
-        if acc_marks is None:
-            # Only bring in key signature if no accidental marks
-            dvalue_key = (
-                0
-                if nat_class_name not in key.accidentals
-                else ACCIDENTAL_DVALUES[key.accidentals[nat_class_name]]
-            )
-        else:
-            dvalue_key = 0
-        value = pitch_class_value(nat_class_name) + 12 * octave + dvalue_acc + dvalue_key
-
-        # Determine duration
-        sla = g["slash"]
-        num = g["num"]
-        den = g["den"]
-        if sla is not None:
-            # raise ValueError("only whole multiples of L supported at this time")
-            if num is None and den is None:
-                # Special case: `/` as shorthand for 1/2 and can be multiple
-                relative_duration = Fraction("1/2") ** sla.count("/")
-            elif num is not None and den is not None:
-                # We have both numerator and denominator
-                assert (
-                    sla == "/"
-                ), "there should only be one `/` when using both numerator and denominator"
-                relative_duration = Fraction(f"{num}/{den}")
-            elif den is not None:
-                # When only denominator, numerator 1 is assumed
-                assert sla == "/", "there should only be one `/` when only denominator is used"
-                relative_duration = Fraction(f"1/{den}")
-            elif num is not None:
-                # When only numerator, denominator 2 is assumed
-                assert sla == "/", "there should be only one `/` when only numerator is used"
-                # ^ Not 100% sure about this though
-                relative_duration = Fraction(f"{num}/2")
-            else:
-                raise ValueError(f"invalid relative duration spec. in {m.group(0)!r}")
-                # (Shouldn't ever get here.)
-        else:
-            relative_duration = Fraction(num) if num is not None else Fraction(1)
-
-        note = cls(value, relative_duration * unit_duration)
-        if acc_marks is not None:
-            note._class_name = nat_class_name + acc_ascii
-        note._octave = octave
+        value, duration, class_name, octave = _decode_abc_match(
+            m, key=key, octave_base=octave_base, unit_duration=unit_duration
+        )
 
-        return note
+        return cls._new(value, duration, class_name, octave)
 
     def to_abc(
         self,
@@ -212,7 +348,7 @@ class Note(Pitch):
         assert acc in {"", "^", "_", "="}
         if acc in {"^", "_"} and note_nat in key.accidentals:
             acc = ""
-        if acc == "=" and note_nat in [str(pc) for pc in key.scale]:
+        if acc == "=" and note_nat in key._scale_names:
             acc = ""
 
         # Lowercase letter if in 2nd octave or more
@@ -240,17 +376,10 @@ class Note(Pitch):
 
     @classmethod
     def from_pitch(cls, p: Pitch, *, duration: Fraction = _DEFAULT_UNIT_DURATION) -> "Note":
-        note = cls(p.value, duration)
-        note._class_name = p._class_name
-        note._octave = p._octave
-
-        return note
+        return cls._new(p.value, duration, p._class_name, p._octave)
 
     def to_pitch(self) -> Pitch:
-        p = Pitch(self.value)
-        p._class_name = self._class_name
-
-        return p
+        return Pitch._new(self.value, self._class_name)
 
     @classmethod
     def from_name(cls):
@@ -271,3 +400,385 @@ class Note(Pitch):
     @classmethod
     def from_class_value(cls):
         raise NotImplementedError
+
+
+def _gen_spellings() -> List[Optional[str]]:
+    spellings: List[Optional[str]] = [None]
+    for nat in "CDEFGAB":
+        for acc in ["", "#", "##", "b", "bb", "="]:
+            spellings.append(nat + acc)
+
+    return spellings
+
+
+_SPELLINGS = _gen_spellings()
+"""Pitch class names that notes can be explicitly spelled with.
+Index 0 (`None`) is used for notes without an explicit spelling."""
+
+_SPELLING_CODES = {s: i for i, s in enumerate(_SPELLINGS)}
+
+
+class NoteArray:
+    """Columnar storage for a sequence of notes grouped into measures,
+    with one compact array per note attribute.
+    :class:`Note` objects are only created on demand (e.g., indexing or iterating).
+
+    Measures are stored once, as written.
+    The order in which they are played (with repeats expanded) is recorded in :attr:`play_order`.
+    Indexing, iterating, etc. give the notes as written;
+    use :meth:`iter_played` and :meth:`played_index` for the notes in play order.
+    """
+
+    def __init__(self, ticks_per_whole: Optional[int] = None) -> None:
+        """
+        Parameters
+        ----------
+        ticks_per_whole
+            Store note durations as integer ticks, with this many per whole note
+            (e.g., :const:`TICKS_PER_WHOLE`), instead of as exact fractions.
+        """
+        self.ticks_per_whole = ticks_per_whole
+        """Integer ticks per whole note, if durations are stored as ticks."""
+
+        self.value = array("h")
+        """Chromatic note values relative to C0."""
+
+        self.duration_num = array("i")
+        """Note duration numerators."""
+
+        self.duration_den = array("i")
+        """Note duration denominators."""
+
+        self.duration_ticks = array("i")
+        """Note durations in integer ticks (only if :attr:`ticks_per_whole` is set)."""
+
+        self.octave = array("b")
+        """Note octaves."""
+
+        self.spelling = array("b")
+        """Codes for the pitch class names of explicitly spelled notes (0 if not)."""
+
+        self.measure = array("i")
+        """Index of the measure that each note is in."""
+
+        self.measure_starts = array("i", [0])
+        """Index of the first note of each measure, plus the total number of notes at the end."""
+
+        self.play_order = array("i")
+        """Index of the (written) measure for each measure in play order."""
+
+    def _append(
+        self, value: int, duration: Union[Fraction, int], class_name: Optional[str], octave: int
+    ) -> None:
+        """Add note to the current (last) measure.
+        `duration` should be in ticks if :attr:`ticks_per_whole` is set.
+        """
+        self.value.append(value)
+        if self.ticks_per_whole is None:
+            self.duration_num.append(duration.numerator)
+            self.duration_den.append(duration.denominator)
+        else:
+            self.duration_ticks.append(duration)  # type: ignore[arg-type]
+        self.octave.append(octave)
+        self.spelling.append(_SPELLING_CODES[class_name])
+        self.measure.append(len(self.measure_starts) - 1)
+
+    def _end_measure(self) -> None:
+        """Mark the current measure as complete, starting a new one,
+        and add it to the play order.
+        """
+        self.play_order.append(len(self.measure_starts) - 1)
+        self.measure_starts.append(len(self.value))
+
+    def _repeat_measures(self, start: int, stop: Optional[int] = None) -> int:
+        """Play again the measures from play-order position `start` (inclusive) to `stop` (exclusive).
+        No notes are copied; only :attr:`play_order` is extended.
+        Returns the number of measures added to the play order.
+        """
+        order = self.play_order
+        n_played = len(order)
+        if stop is None or stop > n_played:
+            stop = n_played
+        if start >= stop:
+            return 0
+
+        order.extend(order[start:stop])
+
+        return stop - start
+
+    def _set_play_order(self, order: Iterable[int]) -> None:
+        """Replace the play order (e.g., when arranging parts)."""
+        self.play_order = array("i", order)
+
+    @classmethod
+    def from_measures(
+        cls, measures: Iterable[Iterable[Note]], *, ticks_per_whole: Optional[int] = None
+    ) -> "NoteArray":
+        """Create from a sequence of measures, each a sequence of notes."""
+        na = cls(ticks_per_whole)
+        for measure in measures:
+            for note in measure:
+                if ticks_per_whole is None:
+                    duration: Union[Fraction, int] = note.duration
+                else:
+                    duration = _duration_to_ticks(note.duration, ticks_per_whole)
+                na._append(note.value, duration, note._class_name, note.octave)
+            na._end_measure()
+
+        return na
+
+    @property
+    def n_measures(self) -> int:
+        """Number of measures, as written."""
+        return len(self.measure_starts) - 1
+
+    @property
+    def n_played_measures(self) -> int:
+        """Number of measures in play order (repeats expanded)."""
+        return len(self.play_order)
+
+    def __len__(self) -> int:
+        return len(self.value)
+
+    def _duration(self, i: int) -> Fraction:
+        if self.ticks_per_whole is None:
+            return Fraction(self.duration_num[i], self.duration_den[i])
+        else:
+            return Fraction(self.duration_ticks[i], self.ticks_per_whole)
+
+    def _note(self, i: int) -> Note:
+        return Note._new(
+            self.value[i], self._duration(i), _SPELLINGS[self.spelling[i]], self.octave[i]
+        )
+
+    def __getitem__(self, i: int) -> Note:
+        n = len(self.value)
+        if not -n <= i < n:
+            raise IndexError("note index out of range")
+
+        return self._note(i % n)
+
+    def __iter__(self) -> Iterator[Note]:
+        return (self._note(i) for i in range(len(self.value)))
+
+    def measure_notes(self, i: int) -> List[Note]:
+        """Notes of measure `i`."""
+        starts = self.measure_starts
+        n = len(starts) - 1
+        if not -n <= i < n:
+            raise IndexError("measure index out of range")
+        i %= n
+
+        return [self._note(j) for j in range(starts[i], starts[i + 1])]
+
+    def played_index(self) -> array:
+        """Indices of the notes in play order (repeats expanded).
+        For example, with NumPy, ``np.frombuffer(na.value, dtype="h")[na.played_index()]``
+        gives the note values as played.
+        """
+        starts = self.measure_starts
+        index = array("i")
+        for i in self.play_order:
+            index.extend(range(starts[i], starts[i + 1]))
+
+        return index
+
+    def iter_played(self) -> Iterator[Note]:
+        """Iterate over the notes in play order (repeats expanded)."""
+        starts = self.measure_starts
+        for i in self.play_order:
+            for j in range(starts[i], starts[i + 1]):
+                yield self._note(j)
+
+    @property
+    def durations(self) -> List[Fraction]:
+        """Note durations."""
+        if self.ticks_per_whole is None:
+            return [Fraction(a, b) for a, b in zip(self.duration_num, self.duration_den)]
+        else:
+            return [Fraction(t, self.ticks_per_whole) for t in self.duration_ticks]
+
+    def _require_ticks(self) -> int:
+        if self.ticks_per_whole is None:
+            raise ValueError("durations not stored as ticks. Use `ticks_per_whole`.")
+
+        return self.ticks_per_whole
+
+    def measure_ticks(self) -> List[int]:
+        """Total duration of each measure, in ticks."""
+        self._require_ticks()
+        ticks = self.duration_ticks
+        starts = self.measure_starts
+
+        return [sum(ticks[a:b]) for a, b in zip(starts[:-1], starts[1:])]
+
+    def offset_ticks(self) -> List[int]:
+        """Time of the start of each note relative to the start of the first, in ticks."""
+        self._require_ticks()
+
+        return list(itertools.accumulate(self.duration_ticks[:-1], initial=0))[: len(self)]
+
+    def measure_durations(self) -> List[Fraction]:
+        """Total duration of each measure."""
+        if self.ticks_per_whole is None:
+            durations = self.durations
+            starts = self.measure_starts
+            return [sum(durations[a:b], Fraction(0)) for a, b in zip(starts[:-1], starts[1:])]
+        else:
+            return [Fraction(t, self.ticks_per_whole) for t in self.measure_ticks()]
+
+    def offsets(self) -> List[Fraction]:
+        """Time of the start of each note relative to the start of the first."""
+        if self.ticks_per_whole is None:
+            return list(itertools.accumulate(self.durations[:-1], initial=Fraction(0)))[: len(self)]
+        else:
+            return [Fraction(t, self.ticks_per_whole) for t in self.offset_ticks()]
+
+    @property
+    def nbytes(self) -> int:
+        """Total size of the arrays in bytes."""
+        cols = [
+            self.value,
+            self.duration_num,
+            self.duration_den,
+            self.duration_ticks,
+            self.octave,
+            self.spelling,
+            self.measure,
+            self.measure_starts,
+            self.play_order,
+        ]
+        return sum(len(col) * col.itemsize for col in cols)
+
+    def to_numpy(self) -> Dict[str, "numpy.ndarray"]:
+        """Dict. of NumPy arrays (requires NumPy).
+        The arrays share memory with this instance.
+        """
+        import numpy as np
+
+        cols = {"value": self.value}
+        if self.ticks_per_whole is None:
+            cols.update(duration_num=self.duration_num, duration_den=self.duration_den)
+        else:
+            cols.update(duration_ticks=self.duration_ticks)
+        cols.update(octave=self.octave, spelling=self.spelling, measure=self.measure)
+
+        return {name: np.asarray(col) for name, col in cols.items()}
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(n_notes={len(self)}, n_measures={self.n_measures})"
+
+    _PACKED_COLUMNS = (
+        "value",
+        "duration_num",
+        "duration_den",
+        "duration_ticks",
+        "octave",
+        "spelling",
+        "measure",
+        "measure_starts",
+        "play_order",
+    )
+
+    def __reduce__(self):
+        # All columns packed into a single bytes object
+        cols = [getattr(self, name) for name in self._PACKED_COLUMNS]
+        return (
+            type(self)._from_packed,
+            (
+                self.ticks_per_whole,
+                sys.byteorder,
+                [len(col) for col in cols],
+                b"".join(col.tobytes() for col in cols),
+            ),
+        )
+
+    @classmethod
+    def _from_buffers(
+        cls, columns: Dict[str, memoryview], *, ticks_per_whole: Optional[int] = None
+    ) -> "NoteArray":
+        """Create with (read-only) views of existing memory as the columns
+        (e.g., shared memory), instead of arrays.
+        `columns` should be typed memoryviews for the :attr:`_PACKED_COLUMNS`.
+        """
+        na = cls(ticks_per_whole)
+        for name in cls._PACKED_COLUMNS:
+            setattr(na, name, columns[name])
+
+        return na
+
+    @classmethod
+    def _from_packed(
+        cls, ticks_per_whole: Optional[int], byteorder: str, lengths: List[int], data: bytes
+    ) -> "NoteArray":
+        """Create from the packed form used for pickling."""
+        na = cls(ticks_per_whole)
+        buf = memoryview(data)
+        i = 0
+        for name, n in zip(cls._PACKED_COLUMNS, lengths):
+            col = array(getattr(na, name).typecode)
+            nbytes = n * col.itemsize
+            col.frombytes(buf[i : i + nbytes])
+            if byteorder != sys.byteorder:
+                col.byteswap()
+            setattr(na, name, col)
+            i += nbytes
+
+        return na
+
+    def __eq__(self, other):
+        if not isinstance(other, NoteArray):
+            return NotImplemented
+
+        return (
+            self.value == other.value
+            and self.durations == other.durations
+            and self.measure_starts == other.measure_starts
+            and self.play_order == other.play_order
+        )
+
+
+class _Measures(Sequence):
+    """Read-only list-like view of the measures of a :class:`NoteArray`,
+    each a list of :class:`Note`.
+    Measures are as written unless `order` (e.g., :attr:`NoteArray.play_order`) is given.
+    """
+
+    def __init__(self, notes: NoteArray, order: Optional[Sequence[int]] = None) -> None:
+        self._notes = notes
+        self._order = order
+
+    def __len__(self) -> int:
+        if self._order is None:
+            return self._notes.n_measures
+        else:
+            return len(self._order)
+
+    def _measure_notes(self, i: int) -> List[Note]:
+        if self._order is None:
+            return self._notes.measure_notes(i)
+        else:
+            return self._notes.measure_notes(self._order[i])
+
+    @overload
+    def __getitem__(self, i: int) -> List[Note]:
+        ...
+
+    @overload
+    def __getitem__(self, i: slice) -> List[List[Note]]:
+        ...
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self._measure_notes(j) for j in range(*i.indices(len(self)))]
+
+        return self._measure_notes(i)
+
+    def __eq__(self, other):
+        if not isinstance(other, Sequence):
+            return NotImplemented
+
+        return list(self) == list(other)
+
+    def __repr__(self) -> str:
+        return repr(list(self))
@@ -1,11 +1,39 @@
 """
 ABC parsing/info
 """
+import contextlib
+import os
 import re
-from typing import Dict, Iterator, List, NamedTuple, Optional
-
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+    Union,
+)
+
+from ._util import R, T, imap_chunked
 from .key import Key
-from .note import _RE_NOTE, Note
+from .note import (
+    _DEFAULT_OCTAVE_BASE,
+    _DEFAULT_UNIT_DURATION,
+    _RE_NOTE,
+    _S_RE_NOTE,
+    Note,
+    NoteArray,
+    _decode_abc_note,
+    _Measures,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    import concurrent.futures
+    import multiprocessing.pool
 
 
 class InfoField(NamedTuple):
@@ -164,40 +192,180 @@ def _load_abcjs_if_in_jupyter() -> None:
         print("abcjs loaded")
 
 
-def _find_first_chord(s: str) -> Optional[str]:
-    """Search for first chord spec in an ABC body portion.
+_S_RE_NOTE_ANON = re.sub(r"\?P<\w+>", "?:", _S_RE_NOTE)
+"""Note regex without named groups, for embedding multiple times."""
+
+_TOKEN_PATTERNS = [
+    # Comment (rest of line), unless escaped (`\%`). Also catches `%%` directives.
+    ("comment", r"(?<!\\)%[^\n]*"),
+    # Inline field, e.g. `[M:3/4]`, or field line in the body, e.g. `P:B`, `w:...`
+    ("field", r"\[[A-Za-z]:[^\]\n]*\]|^[ \t]*[A-Za-z+]:(?![|:])[^\n]*"),
+    # https://abcnotation.com/wiki/abc:standard:v2.1#decorations
+    ("decoration", r"![^!\s|]+!|\+[^+\s|]+\+|[.~HLMOPSTuv]"),
+    # Chord symbol or text annotation, e.g. `"Am"`, `"^text"`
+    ("annotation", r'"[^"\n]*"'),
+    # https://abcnotation.com/wiki/abc:standard:v2.1#chords_and_unisons
+    ("chord", rf"\[(?:{_S_RE_NOTE_ANON})+\]"),
+    # https://abcnotation.com/wiki/abc:standard:v2.1#variant_endings
+    ("ending", r"\[[1-9][0-9,\-]*|(?<=\|)[1-9][0-9,\-]*"),
+    ("repeat", r":+\[?\|+\]?:*|\[?\|+\]?:+|::+"),
+    ("bar", r"\[?\|+\]?"),
+    # https://abcnotation.com/wiki/abc:standard:v2.1#duplets_triplets_quadruplets_etc
+    ("tuplet", r"\([2-9](?::[0-9]*){0,2}"),
+    ("note", _S_RE_NOTE),
+    ("rest", r"[zxZX][0-9]*/*[0-9]*"),
+    ("space", r"\s*\n|\s+"),
+    # Anything else (slurs, ties, broken rhythm marks, grace note braces, ...)
+    ("other", r"."),
+]
+
+_RE_TOKEN = re.compile(
+    "|".join(f"({pattern})" for _, pattern in _TOKEN_PATTERNS), flags=re.MULTILINE
+)
+
+
+def _gen_token_kind_table() -> Dict[int, str]:
+    # Map the index of each top-level group to its token kind,
+    # accounting for the named groups nested inside some of the patterns
+    kinds = {}
+    i = 1
+    for kind, pattern in _TOKEN_PATTERNS:
+        kinds[i] = kind
+        i += 1 + re.compile(pattern).groups
+
+    return kinds
+
+
+_TOKEN_KINDS = _gen_token_kind_table()
+"""Dict. mapping top-level group index in the tokenizer regex to token kind."""
+
+
+class Token(NamedTuple):
+    kind: str
+    """Token type, e.g. `note`, `bar`, `repeat`, `ending`, `chord`, `space`, ..."""
+
+    text: str
+    """Token text."""
+
+    start: int
+    """Index of the start of the token in the source string."""
+
 
-    https://abcnotation.com/wiki/abc:standard:v2.1#chords_and_unisons
+def tokenize(s: str) -> Iterator[Token]:
+    """Split an ABC tune body into typed tokens in a single pass.
+
+    Every character of `s` is part of exactly one token.
     """
-    from .note import _S_RE_NOTE
-
-    # `{2,}` (2 or more) doesn't seem to work,
-    # so we look for one or more and then count notes after
-    m = re.search(rf"\[({_S_RE_NOTE})+\]", s)
-    if m is None:
-        return None
-
-    # Here, we have a potential chord (may only have one note, which we want to reject)
-    # NOTE: did see some single notes inside `[]` in The Session data
-    c = m.group()
-    assert c.startswith("[") and c.endswith("]")
-    n = len(_RE_NOTE.findall(c))  # TODO: maybe just letter count would be suff.
-    if n >= 2:
-        return c
-    else:
-        return None
+    for m in _RE_TOKEN.finditer(s):
+        yield Token(_TOKEN_KINDS[m.lastindex], m.group(), m.start())  # type: ignore[index]
+
+
+def _expand_parts(s: str) -> List[str]:
+    """Expand the play order of a header parts (``P:``) field,
+    e.g. ``(AB)2C`` -> ``['A', 'B', 'A', 'B', 'C']``.
+    """
+    # https://abcnotation.com/wiki/abc:standard:v2.1#pparts
+    stack: List[List[str]] = [[]]
+    last: List[str] = []
+    for m in re.finditer(r"([A-Z])|(\()|(\))|([0-9]+)", s):
+        letter, open_, close, num = m.groups()
+        if letter:
+            last = [letter]
+            stack[-1].append(letter)
+        elif open_:
+            stack.append([])
+        elif close:
+            if len(stack) > 1:
+                last = stack.pop()
+                stack[-1].extend(last)
+        else:
+            stack[-1].extend(last * (int(num) - 1))
+
+    return [label for group in stack for label in group]
+
+
+def _arrange_parts(
+    order: Sequence[int], parts: List[Tuple[str, int]], labels: List[str]
+) -> List[int]:
+    """Arrange the measure play `order` of the tune body into `labels` part order.
+    `parts` gives the part labels found in the body and their start positions in `order`.
+    Measures before the first part are played once, first.
+    """
+    sections: Dict[str, List[int]] = {}
+    stops = [start for _, start in parts[1:]] + [len(order)]
+    for (label, start), stop in zip(parts, stops):
+        sections.setdefault(label, []).extend(order[start:stop])
+
+    new_order = list(order[: parts[0][1]])
+    for label in labels:
+        new_order.extend(sections.get(label, []))
+
+    return new_order
+
+
+def _line_at(s: str, i: int) -> str:
+    """The line of `s` that contains index `i`."""
+    a = s.rfind("\n", 0, i) + 1
+    b = s.find("\n", i)
+    return s[a:] if b == -1 else s[a:b]
+
+
+def _header_lines(lines: List[str]) -> Tuple[List[str], int]:
+    """Info field lines of the tune header (comments removed, continuations joined),
+    and the number of `lines` up to and including the ``K:`` line (all if none)."""
+    # https://github.com/campagnola/pyabc/blob/4c22a70a0f40ff82f608ffc19a1ca51a153f8c24/pyabc.py#L520
+    header_lines: List[str] = []
+    for i, line in enumerate(lines):
+        line = re.split(r"([^\\]|^)%", line)[0]
+        line = line.strip()
+        if line == "":
+            continue
+        if line[0] in INFO_FIELDS and line[1] == ":":
+            header_lines.append(line)
+            if line[0] == "K":  # is K always last??
+                return header_lines, i + 1
+        elif line[:2] == "+:":
+            header_lines[-1] += " " + line[2:]
+
+    return header_lines, len(lines)
+
+
+def _header_dict(header_lines: List[str]) -> Dict[str, str]:
+    """Tune header info, keyed by field name,
+    with repeated fields numbered (e.g., ``tune title 2``)."""
+    h: Dict[str, str] = {}
+    for line in header_lines:
+        key = line[0]
+        data = line[2:].strip()
+        field_name = INFO_FIELDS[key].name
+        n_field = sum(field_name in k for k in h.keys())
+        if n_field == 0:
+            h[field_name] = data
+        else:
+            h[f"{field_name} {n_field+1}"] = data
+
+    return h
 
 
 # TODO: maybe should go in a tune module
 class Tune:
     """Tune."""
 
-    def __init__(self, abc: str):
+    def __init__(self, abc: str, *, lazy: bool = False, ticks_per_whole: Optional[int] = None):
         """
         Parameters
         ----------
         abc
             String of a single ABC tune.
+        lazy
+            Only parse the header initially,
+            deferring parsing of the tune body until the notes
+            (e.g., :attr:`measures`, :attr:`notes_array`) are first accessed.
+            Note that this means that body parsing errors are also deferred.
+        ticks_per_whole
+            Store note durations as integer ticks, with this many per whole note
+            (e.g., :const:`pyabc2.note.TICKS_PER_WHOLE`), instead of as exact fractions.
+            Durations that can't be represented raise an error.
         """
         self.abc = abc
         """Original ABC string."""
@@ -220,88 +388,118 @@ class Tune:
         self.url: Optional[str] = None
         """Revelant URL for this particular tune/setting."""
 
-        self.measures: List[List[Note]]
+        self._body_start: int
+        self._notes: Optional[NoteArray] = None
+        self._ticks_per_whole = ticks_per_whole
 
         self._parse_abc()
 
+        if not lazy:
+            self._notes = self._extract_measures(self._body)
+
     def _parse_abc(self) -> None:
-        # https://github.com/campagnola/pyabc/blob/4c22a70a0f40ff82f608ffc19a1ca51a153f8c24/pyabc.py#L520
-        header_lines = []
-        tune_lines = []
-        in_tune = False
-        for line in self.abc.split("\n"):
-            line = re.split(r"([^\\]|^)%", line)[0]
-            line = line.strip()
-            if line == "":
-                continue
-            if in_tune:
-                tune_lines.append(line)
-            else:
-                if line[0] in INFO_FIELDS and line[1] == ":":
-                    header_lines.append(line)
-                    if line[0] == "K":  # is K always last??
-                        in_tune = True
-                elif line[:2] == "+:":
-                    header_lines[-1] += " " + line[2:]
+        lines = self.abc.split("\n")
+        header_lines, n = _header_lines(lines)
 
         self._parse_abc_header_lines(header_lines)
-        self._extract_measures(tune_lines)
+        self._body_start = sum(len(line) + 1 for line in lines[:n])
+
+    @property
+    def _body(self) -> str:
+        """The ABC after the header."""
+        return self.abc[self._body_start :]
 
     def _parse_abc_header_lines(self, header_lines: List[str]) -> None:
-        h: Dict[str, str] = {}
-        for line in header_lines:
-            key = line[0]
-            data = line[2:].strip()
-            field_name = INFO_FIELDS[key].name
-            n_field = sum(field_name in k for k in h.keys())
-            if n_field == 0:
-                h[field_name] = data
-            else:
-                h[f"{field_name} {n_field+1}"] = data
+        self._set_header(_header_dict(header_lines))
 
+    def _set_header(self, h: Dict[str, str]) -> None:
         self.header = h
         self.title = h.get("tune title", None)
         self.titles = [v for k, v in h.items() if "tune title" in k]
         self.type = h.get("rhythm", "?")  # TODO: guess from L/M ?
         self.key = Key(h.get("key", "C"))
 
-    def _extract_measures(self, tune_lines: List[str]) -> None:
-        # 0. Lines
+    @property
+    def notes_array(self) -> NoteArray:
+        """Notes of the tune in columnar form, as written,
+        with the order in which the measures are played in :attr:`NoteArray.play_order`.
+        """
+        if self._notes is None:
+            self._notes = self._extract_measures(self._body)
+
+        return self._notes
+
+    @property
+    def measures(self) -> Sequence[List[Note]]:
+        """Notes of the tune, grouped into measures, with repeats expanded.
+
+        This is a read-only view of :attr:`notes_array`:
+        the measure lists and :class:`Note` objects are created on each access,
+        so changes made to them are not kept.
+        To work with modified notes, copy them first, e.g. ``measures = list(tune.measures)``.
+        """
+        notes = self.notes_array
+
+        return _Measures(notes, notes.play_order)
+
+    @property
+    def written_measures(self) -> Sequence[List[Note]]:
+        """Notes of the tune, grouped into measures, as written (each measure once).
+        This is a read-only view of :attr:`notes_array` (see :attr:`measures`).
+        """
+        return _Measures(self.notes_array)
+
+    def _extract_measures(self, body: str) -> NoteArray:
+        # Single pass through the body tokens, building measures as bar lines are found.
+        # Line breaks are not bar lines, so a measure can continue onto the next line.
         i_measure = i_measure_repeat = i_ending = 0
-        measures = []
-        for line in tune_lines:
-            # Check for chords (not currently supporting)
-            # https://abcnotation.com/wiki/abc:standard:v2.1#chords_and_unisons
-            # TODO: replace chords by one of the notes?
-            first_chord = _find_first_chord(line)
-            has_chord = first_chord is not None
-            if has_chord:
-                raise ValueError(
-                    "chords currently not supported, " f"but found {first_chord!r} in line {line!r}"
+        ticks_per_whole = self._ticks_per_whole
+        notes = NoteArray(ticks_per_whole)
+        in_measure = False  # whether the current measure has any notes/rests yet
+        parts: List[Tuple[str, int]] = []  # part labels and their start positions in play order
+        key_id = (self.key.tonic.name, self.key._mode)
+        unit_duration = _DEFAULT_UNIT_DURATION
+        octave_base = _DEFAULT_OCTAVE_BASE
+        for m in _RE_TOKEN.finditer(body):
+            kind = _TOKEN_KINDS[m.lastindex]  # type: ignore[index]
+
+            if kind == "note":
+                # TODO: deal with `>` and `<` dotted rhythm modifiers between notes
+                # https://abcnotation.com/wiki/abc:standard:v2.1#broken_rhythm
+                notes._append(
+                    *_decode_abc_note(
+                        m.group(), key_id, unit_duration, octave_base, ticks_per_whole
+                    )
                 )
+                in_measure = True
 
-            if line.startswith("|:"):
-                # Left repeat detected -- new starting measure for a repeated section
-                i_measure_repeat = i_measure
+            elif kind == "bar" or kind == "repeat":
+                sep = m.group()
 
-            # 1. In line, find measures
-            for m_measure in re.finditer(r"([^\|\:\]]+)(\:?\|+\:?)", line):
-                # TODO: breaks up measures that use general tuplet syntax (with `:`)
-                # https://abcnotation.com/wiki/abc:standard:v2.1#duplets_triplets_quadruplets_etc
-                # TODO: within-line meter changes (e.g. `|M:3/2 ...`) also have `:`
-                # Maybe could just remove `:` from the the search and lstrip it from `within_measure`
-                within_measure, right_sep = m_measure.groups()
+                if in_measure:
+                    # TODO: check for inline meter change; validate measure beat count?
+                    notes._end_measure()
+                    in_measure = False
+                    i_measure += 1
 
-                if right_sep.endswith(":"):
-                    # Left repeat detected within line
-                    i_measure_repeat = i_measure + 1
+                if sep.startswith(":"):
+                    # Right repeat detected -- extend tune from the last left repeat
+                    if i_ending:
+                        i_measure += notes._repeat_measures(i_measure_repeat, i_ending)
+                        i_ending = 0  # reset
+                    else:
+                        i_measure += notes._repeat_measures(i_measure_repeat)
 
-                if within_measure.startswith(("1", "[1", " [1")):
-                    i_ending = i_measure
+                if sep.endswith(":"):
+                    # Left repeat detected -- new starting measure for a repeated section
+                    i_measure_repeat = i_measure
 
+            elif kind == "ending":
                 # TODO: other specs can indicate more than 2 endings (comma-sep list and range notations)
                 # https://abcnotation.com/wiki/abc:standard:v2.1#variant_endings
-                if within_measure.startswith(("3", "[3", " [3")):
+                # Lists like `[1,3` are treated as their first ending
+                nums = [int(x) for x in re.findall(r"[0-9]+", m.group())]
+                if nums[0] >= 3:
                     # NOTE: can catch incorrect triplet `3(ABC)` at start of measure
                     # Also have seen `3ABC` at start of tune or line
                     # Triplets should be written like `(3ABC` (no closing paren)
@@ -309,44 +507,55 @@ class Tune:
                     # Could look for these cases and fix them?
                     raise ValueError(
                         "3 or more endings not currently supported, "
-                        f"but measure {within_measure!r} starts with one of {'3', '[3', ' [3'}, "
-                        f"found in line {line!r}"
+                        f"but found ending {m.group()!r} "
+                        f"in line {_line_at(body, m.start())!r}"
                     )
+                if nums[0] == 1:
+                    i_ending = i_measure
 
-                # TODO: check for inline meter change; validate measure beat count?
-
-                measure = []
-
-                # 2. In measure, find note groups ("beams")
-                # Currently not doing anything with note group, but may want to in the future
-                for note_group in within_measure.split(" "):
-                    # TODO: deal with `>` and `<` dotted rhythm modifiers between notes
-                    # https://abcnotation.com/wiki/abc:standard:v2.1#broken_rhythm
-
-                    # 3. In note group, find notes
-                    for m_note in _RE_NOTE.finditer(note_group):
-                        # TODO: parse/store rests, maybe have an additional iterator for "rhythmic elements" or something
-
-                        if m_note is None:
-                            raise ValueError(f"no notes in this note group? {note_group!r}")
-
-                        measure.append(Note._from_abc_match(m_note, key=self.key))
-
-                measures.append(measure)
-
-                if right_sep.startswith(":"):
-                    # Right repeat detected -- extend tune from the last left repeat
-                    if i_ending:
-                        repeated = measures[i_measure_repeat:i_ending]
-                        i_ending = 0  # reset
-                    else:
-                        repeated = measures[i_measure_repeat:]
-                    measures.extend(repeated)
-                    i_measure += len(repeated)
-
-                i_measure += 1
-
-        self.measures = measures
+            elif kind == "chord":
+                # Chords not currently supported
+                # NOTE: did see some single notes inside `[]` in The Session data
+                # TODO: replace chords by one of the notes?
+                c = m.group()
+                chord_notes = list(_RE_NOTE.finditer(c))
+                if len(chord_notes) >= 2:
+                    raise ValueError(
+                        "chords currently not supported, "
+                        f"but found {c!r} in line {_line_at(body, m.start())!r}"
+                    )
+                notes._append(
+                    *_decode_abc_note(
+                        chord_notes[0].group(), key_id, unit_duration, octave_base, ticks_per_whole
+                    )
+                )
+                in_measure = True
+
+            elif kind == "rest":
+                # TODO: parse/store rests, maybe have an additional iterator for "rhythmic elements" or something
+                in_measure = True
+
+            elif kind == "field":
+                field = m.group().strip().lstrip("[").rstrip("]")
+                if field.startswith("P:"):
+                    # New part -- starts a new measure (and repeated section)
+                    if in_measure:
+                        notes._end_measure()
+                        in_measure = False
+                        i_measure += 1
+                    parts.append((field[2:].strip()[:1], i_measure))
+                    i_measure_repeat = i_measure
+
+        if in_measure:
+            # Last measure, with no closing bar line
+            notes._end_measure()
+
+        if parts and "parts" in self.header:
+            notes._set_play_order(
+                _arrange_parts(notes.play_order, parts, _expand_parts(self.header["parts"]))
+            )
+
+        return notes
 
     def __repr__(self):
         return (
@@ -363,6 +572,49 @@ class Tune:
     def __hash__(self):
         return hash(self.abc)
 
+    _STATE_ATTRS = frozenset(
+        ["abc", "header", "title", "titles", "type", "key", "url", "_body_start", "_notes"]
+        + ["_ticks_per_whole"]
+    )
+
+    def __reduce__(self):
+        # Title, type, and key are derived from the header,
+        # the body is a slice of the ABC, and the notes are packed (see `NoteArray.__reduce__`)
+        extra = {k: v for k, v in self.__dict__.items() if k not in self._STATE_ATTRS}
+        return (
+            type(self)._from_state,
+            (
+                self.abc,
+                self.header,
+                self.url,
+                self._body_start,
+                self._notes,
+                self._ticks_per_whole,
+            ),
+            extra or None,
+        )
+
+    @classmethod
+    def _from_state(
+        cls,
+        abc: str,
+        header: Dict[str, str],
+        url: Optional[str],
+        body_start: int,
+        notes: Optional[NoteArray],
+        ticks_per_whole: Optional[int],
+    ) -> "Tune":
+        """Create from the form used for pickling, without parsing."""
+        tune = cls.__new__(cls)
+        tune.abc = abc
+        tune._set_header(header)
+        tune.url = url
+        tune._body_start = body_start
+        tune._notes = notes
+        tune._ticks_per_whole = ticks_per_whole
+
+        return tune
+
     def _repr_html_(self):
         import uuid
 
@@ -395,4 +647,233 @@ class Tune:
 
     def iter_notes(self) -> Iterator[Note]:
         """Iterator (generator) for `Note`s of the tune."""
-        return (n for m in self.measures for n in m)
+        return self.notes_array.iter_played()
+
+
+def _warm_caches() -> None:
+    """Fill the note-decoding cache with the plain notes of the most common keys."""
+    unit_duration = _DEFAULT_UNIT_DURATION
+    octave_base = _DEFAULT_OCTAVE_BASE
+    for tonic in ["C", "D", "E", "G", "A", "F", "Bb"]:
+        for mode in ["maj", "min", "dor", "mix"]:
+            key_id = (tonic, mode)
+            for letter in "CDEFGABcdefgab":
+                for length in ["", "2", "3", "/"]:
+                    _decode_abc_note(letter + length, key_id, unit_duration, octave_base)
+
+
+class ParsePool:
+    """Reusable pool of worker processes for parsing tunes.
+
+    Loaders accept one (e.g., ``the_session.load(pool=pool)``),
+    so that the workers are started once and their caches stay warm across calls.
+    The workers are started on first use.
+
+    Use as a context manager, or call :meth:`close` when done.
+    """
+
+    def __init__(self, num_workers: Optional[int] = None, *, context: Optional[str] = None):
+        """
+        Parameters
+        ----------
+        num_workers
+            Number of worker processes. Default: number of CPUs.
+        context
+            Multiprocessing start method (``'fork'``, ``'spawn'``, or ``'forkserver'``).
+            Default: the platform default.
+            With ``'forkserver'``, PyABC2 is preloaded in the server,
+            so the workers don't need to import it.
+        """
+        import multiprocessing
+
+        self.num_workers: int = num_workers or os.cpu_count() or 1
+        """Number of worker processes."""
+
+        self._ctx = multiprocessing.get_context(context)
+        self._pool: Optional["multiprocessing.pool.Pool"] = None
+
+    @property
+    def pool(self) -> "multiprocessing.pool.Pool":
+        """The underlying :class:`multiprocessing.pool.Pool` (started if necessary)."""
+        if self._pool is None:
+            if os.name != "nt":
+                from multiprocessing import resource_tracker
+
+                # Start the tracker first so that the workers share it
+                # (needed for the shared-memory transfer of parsed notes)
+                resource_tracker.ensure_running()
+
+            if self._ctx.get_start_method() == "forkserver":
+                self._ctx.set_forkserver_preload(["pyabc2"])
+
+            self._pool = self._ctx.Pool(self.num_workers, initializer=_warm_caches)
+
+        return self._pool
+
+    def imap(
+        self,
+        func: Callable[[T], R],
+        iterable: Iterable[T],
+        *,
+        chunksize: int = 64,
+        ordered: bool = True,
+    ) -> Iterator[R]:
+        """Apply `func` to the items of `iterable` in the workers,
+        with a bounded number of chunks in flight (see :func:`pyabc2._util.imap_chunked`)."""
+        return imap_chunked(
+            self.pool,
+            func,
+            iterable,
+            chunksize=chunksize,
+            ordered=ordered,
+            max_in_flight=2 * self.num_workers,
+        )
+
+    def close(self) -> None:
+        """Stop the worker processes."""
+        if self._pool is not None:
+            self._pool.terminate()
+            self._pool.join()
+            self._pool = None
+
+    def __enter__(self) -> "ParsePool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(num_workers={self.num_workers})"
+
+
+@contextlib.contextmanager
+def _maybe_pool(pool: Optional[ParsePool], num_workers: int) -> Iterator[ParsePool]:
+    """Use `pool` if given (leaving it running), else a temporary pool with `num_workers`."""
+    if pool is not None:
+        yield pool
+    else:
+        with ParsePool(num_workers) as pool_:
+            yield pool_
+
+
+def _try_parse(
+    abc: str, *, lazy: bool = False, ticks_per_whole: Optional[int] = None
+) -> Union[Tune, Exception]:
+    try:
+        return Tune(abc, lazy=lazy, ticks_per_whole=ticks_per_whole)
+    except Exception as e:
+        return e
+
+
+_ON_ERROR_OPTIONS = {"raise", "return", "skip"}
+
+_EXECUTOR_OPTIONS = {"serial", "thread", "process"}
+
+
+def parse_many(
+    abcs: Iterable[str],
+    *,
+    executor: Union[str, ParsePool, "concurrent.futures.Executor"] = "serial",
+    workers: Optional[int] = None,
+    chunksize: int = 64,
+    on_error: str = "raise",
+    lazy: bool = False,
+    ticks_per_whole: Optional[int] = None,
+    shared_memory: bool = False,
+) -> Iterator[Union[Tune, Exception]]:
+    """Parse many ABC tune strings, in input order.
+
+    The input is consumed lazily, with a bounded amount of work in flight.
+
+    Parameters
+    ----------
+    abcs
+        ABC strings, each of a single tune.
+    executor
+        ``'serial'`` (in this thread),
+        ``'thread'`` (a temporary thread pool),
+        ``'process'`` (a temporary :class:`ParsePool`),
+        or an existing :class:`ParsePool` or :class:`concurrent.futures.Executor` to use.
+        Note that with ``'thread'`` (or a thread pool executor) parsing is limited by the GIL.
+    workers
+        Number of threads/processes for the temporary pools.
+        Default: based on the number of CPUs.
+    chunksize
+        Number of tunes sent to a worker at a time.
+    on_error
+        What to do when a tune fails to parse:
+        ``'raise'`` the error, ``'return'`` (yield) the exception in place of the tune,
+        or ``'skip'`` it.
+    lazy, ticks_per_whole
+        Passed to :class:`Tune`.
+    shared_memory
+        With a process executor, have the workers write the parsed note data to shared memory
+        instead of pickling the tunes back.
+        The tunes' :attr:`~Tune.notes_array` columns are then read-only views of that memory.
+    """
+    import concurrent.futures
+    import functools
+
+    if on_error not in _ON_ERROR_OPTIONS:
+        raise ValueError(f"invalid `on_error` {on_error!r}. Valid options: {_ON_ERROR_OPTIONS}.")
+    if isinstance(executor, str) and executor not in _EXECUTOR_OPTIONS:
+        raise ValueError(
+            f"invalid `executor` {executor!r}. "
+            f"Valid options: {_EXECUTOR_OPTIONS}, a `ParsePool`, or a `concurrent.futures.Executor`."
+        )
+    if shared_memory:
+        if lazy:
+            raise ValueError("`shared_memory` can't be used with `lazy`")
+        if not (executor == "process" or isinstance(executor, ParsePool)):
+            raise ValueError("`shared_memory` requires a process executor")
+
+    def results() -> Iterator[Union[Tune, Exception]]:
+        parse_one = functools.partial(_try_parse, lazy=lazy, ticks_per_whole=ticks_per_whole)
+
+        if shared_memory:
+            from .sources._shm import parse_shared
+
+            pool = executor if isinstance(executor, ParsePool) else None
+            yield from parse_shared(
+                abcs,
+                num_workers=workers or os.cpu_count() or 1,
+                chunksize=chunksize,
+                ticks_per_whole=ticks_per_whole,
+                pool=pool,
+            )
+
+        elif executor == "serial":
+            yield from map(parse_one, abcs)
+
+        elif executor == "thread":
+            n_threads = workers or min(32, (os.cpu_count() or 1) + 4)
+            with concurrent.futures.ThreadPoolExecutor(n_threads) as ex:
+                yield from imap_chunked(
+                    ex, parse_one, abcs, chunksize=chunksize, max_in_flight=2 * n_threads
+                )
+
+        elif executor == "process" or isinstance(executor, ParsePool):
+            pool = executor if isinstance(executor, ParsePool) else None
+            with _maybe_pool(pool, workers or os.cpu_count() or 1) as pool_:
+                yield from pool_.imap(parse_one, abcs, chunksize=chunksize)
+
+        else:
+            assert isinstance(executor, concurrent.futures.Executor)
+            yield from imap_chunked(
+                executor,
+                parse_one,
+                abcs,
+                chunksize=chunksize,
+                max_in_flight=2 * (workers or os.cpu_count() or 1),
+            )
+
+    def handle_errors(results: Iterator[Union[Tune, Exception]]):
+        for res in results:
+            if isinstance(res, Exception):
+                if on_error == "raise":
+                    raise res
+                elif on_error == "skip":
+                    continue
+            yield res
+
+    return handle_errors(results())
@@ -6,7 +6,7 @@ import functools
 import re
 import warnings
 from fractions import Fraction
-from typing import TYPE_CHECKING, Dict, Optional
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
 
 if TYPE_CHECKING:
     from .key import Key
@@ -145,19 +145,48 @@ def _to_roman(n: int) -> str:
 class PitchClass:
     """Pitch without octave.
     Value as integer chromatic distance from C.
+
+    Pitch classes should be treated as immutable,
+    since instances are shared (e.g., all ``PitchClass(0)`` are the same object).
     """
 
-    def __init__(self, value: int):
+    __slots__ = ("_value", "_name")
+
+    _value: int
+    _name: Optional[str]
+
+    def __new__(cls, value: int):
         """
         Parameters
         ----------
         value
             Chromatic note value relative to C.
         """
-        self.value: int = value % 12
+        if cls is PitchClass:
+            return _PITCH_CLASSES[value % 12]
+
+        return cls._new(value)
+
+    @classmethod
+    def _new(cls, value: int, name: Optional[str] = None) -> "PitchClass":
+        """Create new instance (not shared)."""
+        pc = object.__new__(cls)
+        pc._value = value % 12
+        pc._name = name
+
+        return pc
+
+    @property
+    def value(self) -> int:
         """Pitch class value, as integer chromatic distance from the C (0--11)."""
+        return self._value
 
-        self._name: Optional[str] = None
+    def __reduce__(self):
+        if type(self) is PitchClass and self._name is None:
+            # Shared instance
+            return (PitchClass, (self.value,))
+
+        return (type(self)._new, (self.value, self._name))
 
     @property
     def name(self) -> str:
@@ -224,12 +253,14 @@ class PitchClass:
 
     @classmethod
     def from_name(cls, name: str) -> "PitchClass":
-        _validate_pitch_class_name(name)
+        pc = _PITCH_CLASS_NAME_CACHE.get((cls, name))
+        if pc is None:
+            _validate_pitch_class_name(name)
 
-        value = pitch_class_value(name, mod=True)
+            value = pitch_class_value(name, mod=True)
 
-        pc = cls(value)
-        pc._name = name
+            pc = cls._new(value, name)
+            _PITCH_CLASS_NAME_CACHE[(cls, name)] = pc
 
         return pc
 
@@ -400,10 +431,7 @@ class PitchClass:
         return s
 
     def to_pitch(self, octave: int) -> "Pitch":
-        p = Pitch.from_class_value(self.value, octave)
-        p._class_name = self._name
-
-        return p
+        return Pitch._new(self.value + octave * 12, self._name)
 
     def __eq__(self, other):
         if not isinstance(other, type(self)):
@@ -449,22 +477,70 @@ class PitchClass:
 class Pitch:
     """A pitch with value relative to C0.
     Note names are expressed in the context of C major.
+
+    Pitches should be treated as immutable,
+    since instances are shared (e.g., all ``Pitch(60)`` are the same object);
+    spelled pitches (e.g., from :meth:`from_name`) are separate instances.
     """
 
+    __slots__ = ("_value", "_spelled_class_name", "_spelled_octave", "_name_cache")
+
+    _value: int
+    _spelled_class_name: Optional[str]
+    _spelled_octave: Optional[int]
+    _name_cache: Optional[str]
+
     # https://github.com/campagnola/pyabc/blob/4c22a70a0f40ff82f608ffc19a1ca51a153f8c24/pyabc.py#L204-L293
-    def __init__(self, value: int):
+    def __new__(cls, value: int):
         """
         Parameters
         ----------
         value
             Chromatic note value relative to C0.
         """
+        if cls is Pitch and 0 <= value < len(_PITCHES):
+            return _PITCHES[value]
 
-        self.value = value
+        return cls._new(value)
+
+    @classmethod
+    def _new(
+        cls, value: int, class_name: Optional[str] = None, octave: Optional[int] = None
+    ) -> "Pitch":
+        """Create new instance (not shared)."""
+        p = object.__new__(cls)
+        p._value = value
+        p._spelled_class_name = class_name
+        p._spelled_octave = octave
+        p._name_cache = None
+
+        return p
+
+    def __reduce__(self):
+        if (
+            type(self) is Pitch
+            and self._spelled_class_name is None
+            and self._spelled_octave is None
+        ):
+            # Shared instance, if in range
+            return (Pitch, (self.value,))
+
+        return (type(self)._new, (self.value, self._spelled_class_name, self._spelled_octave))
+
+    @property
+    def value(self) -> int:
         """Chromatic note value relative to C0."""
+        return self._value
 
-        self._class_name: Optional[str] = None
-        self._octave: Optional[int] = None
+    @property
+    def _class_name(self) -> Optional[str]:
+        """Explicitly set pitch class name, if any."""
+        return self._spelled_class_name
+
+    @property
+    def _octave(self) -> Optional[int]:
+        """Explicitly set octave, if any."""
+        return self._spelled_octave
 
     @property
     def class_value(self) -> int:
@@ -474,25 +550,31 @@ class Pitch:
     @property
     def octave(self) -> int:
         """Octave number (e.g., A4/A440 is in octave 4)."""
-        if self._octave is None:
+        octave = self._spelled_octave
+        if octave is None:
             return self.value // 12
         else:
-            return self._octave
+            return octave
 
     @property
     def class_name(self) -> str:
         """Note name (pitch class)."""
-        if self._class_name is None:
-            return NICE_C_CHROMATIC_NOTES[self.class_value]
+        class_name = self._spelled_class_name
+        if class_name is None:
+            return NICE_C_CHROMATIC_NOTES[self.value % 12]
         else:
-            return self._class_name
+            return class_name
 
     @property
     def name(self) -> str:
         """Note name with octave, e.g., C4, Bb2.
         (ASCII scientific pitch notation.)
         """
-        return f"{self.class_name}{self.octave}"
+        name = self._name_cache
+        if name is None:
+            name = self._name_cache = f"{self.class_name}{self.octave}"
+
+        return name
 
     def __str__(self):
         return self.name
@@ -612,13 +694,9 @@ class Pitch:
 
         class_value = pitch_class_value(class_name)
 
-        p = cls.from_class_value(class_value, octave)
         # Preserve "non-standard" pitch class name input like Cb,
         # which also affects the value since the octave is set by the natural note name.
-        p._class_name = class_name
-        p._octave = octave
-
-        return p
+        return cls._new(class_value + octave * 12, class_name, octave)
 
     @classmethod
     def from_class_value(cls, value: int, octave: int) -> "Pitch":
@@ -630,10 +708,7 @@ class Pitch:
 
     @classmethod
     def from_pitch_class(cls, pc: PitchClass, octave: int) -> "Pitch":
-        p = cls(pc.value + octave * 12)
-        p._class_name = pc._name
-
-        return p
+        return cls._new(pc.value + octave * 12, pc._name)
 
     def to_pitch_class(self) -> PitchClass:
         # Preserve explicit name if set
@@ -648,11 +723,7 @@ class Pitch:
         if duration is None:
             duration = _DEFAULT_UNIT_DURATION
 
-        note = Note(self.value, duration=duration)
-        note._class_name = self._class_name
-        note._octave = self._octave
-
-        return note
+        return Note._new(self.value, duration, self._class_name, self._octave)
 
     def __eq__(self, other):
         # Only for other Pitch instances
@@ -703,6 +774,16 @@ class Pitch:
 # TODO: make the note types hashable
 
 
+_PITCH_CLASSES = [PitchClass._new(v) for v in range(12)]
+"""Shared instances for the unspelled pitch classes."""
+
+_PITCH_CLASS_NAME_CACHE: Dict[Tuple[type, str], PitchClass] = {}
+"""Shared instances for spelled pitch classes, by class and name."""
+
+_PITCHES = [Pitch._new(v) for v in range(128)]
+"""Shared instances for the unspelled pitches C0 to G10."""
+
+
 # https://en.wikipedia.org/wiki/File:Main_intervals_from_C.png
 MAIN_INTERVAL_SHORT_NAMES = [
     "P1",  # aka "U"
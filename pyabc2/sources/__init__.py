@@ -1,7 +1,8 @@
 """
 Sources of ABC
 """
-from typing import Optional
+import contextlib
+from typing import Any, Iterable, List, Optional, Union
 
 from ..parse import Tune
 
@@ -64,12 +65,16 @@ def load_example(title: Optional[str] = None) -> Tune:
     return Tune(load_example_abc(title))
 
 
-def load_url(url: str) -> Tune:
+def load_url(url: str, *, session: Any = None, cache_ttl: Optional[float] = None) -> Tune:
     """Load tune from ABC corresponding to `url`.
 
     Currently these URL types are supported:
     - Norbeck (``norbeck.nu/abc/``)
     - The Session (``thesession.org``)
+
+    The page is requested with `session` (a :class:`requests.Session`) if provided,
+    and, if `cache_ttl` is set, the response cached on disk for `cache_ttl` seconds
+    (in the ``_http-cache`` directory of the source's data directory).
     """
     from urllib.parse import urlsplit
 
@@ -77,8 +82,59 @@ def load_url(url: str) -> Tune:
 
     res = urlsplit(url)
     if res.netloc in norbeck._URL_NETLOCS:
-        return norbeck.load_url(url)
+        return norbeck.load_url(url, session=session, cache_ttl=cache_ttl)
     elif res.netloc in the_session._URL_NETLOCS:
-        return the_session.load_url(url)
+        return the_session.load_url(url, session=session, cache_ttl=cache_ttl)
     else:
         raise NotImplementedError("loading URL from {res.netloc} not implemented.")
+
+
+def load_urls(
+    urls: Iterable[str],
+    *,
+    concurrency: int = 8,
+    session: Any = None,
+    cache_ttl: Optional[float] = None,
+    on_error: str = "raise",
+) -> List[Union[Tune, Exception]]:
+    """Load tunes from `urls` (see :func:`load_url`), requesting up to `concurrency` at a time
+    over a connection-pooled session (or `session` if provided).
+
+    Repeated URLs are only loaded once (giving the same :class:`~pyabc2.Tune`),
+    and The Session URLs for settings of the same tune share a single API request
+    (when the cache is used, see `cache_ttl`).
+
+    With ``on_error="return"``, the exception raised when loading a URL
+    is returned in its place instead of raised.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from ._http import pooled_session
+
+    if on_error not in {"raise", "return"}:
+        raise ValueError("`on_error` must be 'raise' or 'return'.")
+
+    urls = list(urls)
+    unique = list(dict.fromkeys(urls))
+
+    with contextlib.ExitStack() as stack:
+        if session is None:
+            session = stack.enter_context(pooled_session(concurrency))
+        executor = stack.enter_context(ThreadPoolExecutor(max(concurrency, 1)))
+        futures = {
+            url: executor.submit(load_url, url, session=session, cache_ttl=cache_ttl)
+            for url in unique
+        }
+
+        results: List[Union[Tune, Exception]] = []
+        for url in urls:
+            try:
+                results.append(futures[url].result())
+            except Exception as e:
+                if on_error == "raise":
+                    for future in futures.values():
+                        future.cancel()
+                    raise
+                results.append(e)
+
+    return results
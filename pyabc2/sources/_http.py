@@ -0,0 +1,290 @@
+"""
+Streaming, resumable, and conditional file downloads,
+and cached/pooled requests
+"""
+import contextlib
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from .._util import get_logger as _get_logger
+
+logger = _get_logger(__name__)
+
+_META_FN = "_downloads.json"
+"""Name of the file (in the download directory) storing the validators
+(ETag/Last-Modified) of the downloaded files."""
+
+_CHUNK_SIZE = 2**20
+
+_TIMEOUT = (5, 60)
+"""Connect and read (between bytes) timeouts, in seconds."""
+
+_meta_lock = threading.Lock()
+
+CACHE_DIRNAME = "_http-cache"
+"""Name of the on-disk response cache directory,
+within the data directory of the source (e.g. :const:`pyabc2.sources.the_session.SAVE_TO`)."""
+
+_key_locks = [threading.Lock() for _ in range(64)]
+"""Locks for the cache entries (by key hash)."""
+
+
+def _read_meta(d: Path) -> Dict[str, Dict[str, Any]]:
+    try:
+        with open(d / _META_FN, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def _update_meta(d: Path, fn: str, info: Dict[str, Any]) -> None:
+    """Set the download info for file `fn` in directory `d`."""
+    with _meta_lock:
+        meta = _read_meta(d)
+        meta[fn] = info
+        fp = d / _META_FN
+        fp_tmp = fp.with_suffix(".tmp")
+        with open(fp_tmp, "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=1)
+        os.replace(fp_tmp, fp)
+
+
+def _request_headers(url: str, fp: Path) -> Tuple[Dict[str, str], int, Dict[str, Any]]:
+    """Headers for (re)downloading `url` to `fp` (conditional, or resuming),
+    the resume offset, and the stored download info."""
+    fp_part = fp.with_name(fp.name + ".part")
+    info = _read_meta(fp.parent).get(fp.name, {})
+    if info.get("url") != url:
+        info = {}
+
+    # Ranges and validators must refer to the bytes as stored
+    headers = {"Accept-Encoding": "identity"}
+    offset = 0
+    if info.get("complete") and fp.is_file():
+        if info.get("etag"):
+            headers["If-None-Match"] = info["etag"]
+        if info.get("last_modified"):
+            headers["If-Modified-Since"] = info["last_modified"]
+    elif info and not info.get("complete") and fp_part.is_file():
+        validator = info.get("etag") or info.get("last_modified")
+        if validator:
+            offset = fp_part.stat().st_size
+            headers["Range"] = f"bytes={offset}-"
+            headers["If-Range"] = validator
+
+    return headers, offset, info
+
+
+def _start_download(
+    url: str,
+    fp: Path,
+    status: int,
+    headers: Any,
+    offset: int,
+    info: Dict[str, Any],
+) -> Tuple[str, Dict[str, Any]]:
+    """File mode for writing the response body to the ``.part`` file,
+    given the response `status` and `headers` (case-insensitive mapping),
+    and the download info (recorded as incomplete)."""
+    if status == 206:
+        start = headers.get("Content-Range", "").partition(" ")[2].partition("-")[0]
+        if start != str(offset):  # pragma: no cover
+            raise ValueError(
+                f"unexpected Content-Range {headers.get('Content-Range')!r} "
+                f"resuming {fp.name} from byte {offset}"
+            )
+        logger.debug(f"Resuming download of {fp.name} from byte {offset}.")
+        mode = "ab"
+    else:
+        info = {
+            "url": url,
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+        }
+        mode = "wb"
+
+    info["complete"] = False
+    _update_meta(fp.parent, fp.name, info)
+
+    return mode, info
+
+
+def _finish_download(fp: Path, info: Dict[str, Any]) -> None:
+    os.replace(fp.with_name(fp.name + ".part"), fp)
+    info["complete"] = True
+    _update_meta(fp.parent, fp.name, info)
+
+
+def _range_not_satisfiable(fp: Path, headers: Any, offset: int, info: Dict[str, Any]) -> bool:
+    """Handle a 416 response to resuming the download to `fp` from byte `offset`.
+    If the ``.part`` file is already complete (length from the Content-Range header),
+    the download is finished, otherwise the ``.part`` file is removed
+    (so the download can be restarted).
+    Returns whether the download was finished."""
+    fp_part = fp.with_name(fp.name + ".part")
+    length = headers.get("Content-Range", "").rpartition("/")[2]
+    if length.isdigit() and int(length) == offset:
+        logger.debug(f"{fp_part.name} already complete.")
+        _finish_download(fp, info)
+        return True
+
+    logger.debug(f"Can't resume download of {fp.name} from byte {offset}, restarting.")
+    if fp_part.exists():
+        fp_part.unlink()
+
+    return False
+
+
+def download(url: str, fp: Path, *, session: Any = None) -> bool:
+    """Download `url` to file `fp`, streaming to disk in chunks.
+
+    If `fp` was previously downloaded from `url`, the request is conditional
+    on the stored ETag/Last-Modified, so nothing is transferred if the file hasn't changed.
+    An interrupted download (``<name>.part`` file) is resumed with a range request
+    if the server supports it and the file hasn't changed in the meantime.
+
+    Returns whether the file was (re)downloaded.
+    """
+    import requests
+
+    fp = Path(fp)
+    headers, offset, info = _request_headers(url, fp)
+
+    s = session if session is not None else requests.Session()
+    try:
+        with s.get(url, headers=headers, stream=True, timeout=_TIMEOUT) as r:
+            if r.status_code == 304:
+                logger.debug(f"{fp.name} unchanged, not downloaded.")
+                return False
+            if r.status_code == 416 and offset:
+                if _range_not_satisfiable(fp, r.headers, offset, info):
+                    return True
+                return download(url, fp, session=s)
+            r.raise_for_status()
+
+            mode, info = _start_download(url, fp, r.status_code, r.headers, offset, info)
+            with open(fp.with_name(fp.name + ".part"), mode) as f:
+                for chunk in r.iter_content(chunk_size=_CHUNK_SIZE):
+                    f.write(chunk)
+    finally:
+        if session is None:
+            s.close()
+
+    _finish_download(fp, info)
+
+    return True
+
+
+def download_many(
+    items: Sequence[Tuple[str, Path]], *, max_workers: Optional[int] = None
+) -> List[bool]:
+    """Download the (URL, file path) `items` concurrently, in threads
+    (see :func:`download`). Returns whether each file was (re)downloaded."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    import requests
+
+    if max_workers is None:
+        max_workers = min(4, len(items))
+
+    if max_workers <= 1:
+        with requests.Session() as s:
+            return [download(url, fp, session=s) for url, fp in items]
+
+    with ThreadPoolExecutor(max_workers) as executor:
+        return list(executor.map(lambda item: download(*item), items))
+
+
+@contextlib.contextmanager
+def pooled_session(max_connections: int = 10) -> Iterator[Any]:
+    """:class:`requests.Session` keeping up to `max_connections` connections per host alive,
+    for making many requests, including from multiple threads."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    with requests.Session() as s:
+        adapter = HTTPAdapter(pool_connections=max_connections, pool_maxsize=max_connections)
+        s.mount("https://", adapter)
+        s.mount("http://", adapter)
+        yield s
+
+
+def _canonical_url(url: str) -> str:
+    """`url` with lower-case scheme and host, sorted query parameters, and no fragment."""
+    from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+    res = urlsplit(url)
+    query = urlencode(sorted(parse_qsl(res.query, keep_blank_values=True)))
+
+    return urlunsplit((res.scheme.lower(), res.netloc.lower(), res.path or "/", query, ""))
+
+
+def get_text(
+    url: str, *, session: Any = None, ttl: Optional[float] = None, cache_dir: Optional[Path] = None
+) -> str:
+    """GET `url` (with `session` if provided), returning the response text.
+
+    If `ttl` is set, responses are cached on disk (in `cache_dir`), keyed by the canonical URL,
+    and reused for `ttl` seconds.
+    Concurrent requests for the same URL then wait for the first instead of repeating it.
+    """
+    import requests
+
+    def get() -> str:
+        r = (session if session is not None else requests).get(url, timeout=_TIMEOUT)
+        r.raise_for_status()
+        return r.text
+
+    if ttl is None:
+        return get()
+    if cache_dir is None:
+        raise ValueError("`cache_dir` must be provided to use the cache.")
+
+    curl = _canonical_url(url)
+    with _key_locks[_cache_key(curl) % len(_key_locks)]:
+        text = _cache_read(curl, ttl, cache_dir)
+        if text is None:
+            text = get()
+            _cache_write(curl, text, cache_dir)
+
+    return text
+
+
+def _cache_key(curl: str) -> int:
+    import hashlib
+
+    return int(hashlib.sha256(curl.encode()).hexdigest()[:32], 16)
+
+
+def _cache_fp(curl: str, cache_dir: Path) -> Path:
+    return cache_dir / f"{_cache_key(curl):032x}.json"
+
+
+def _cache_read(curl: str, ttl: float, cache_dir: Path) -> Optional[str]:
+    """Cached response text for canonical URL `curl`, if cached less than `ttl` seconds ago."""
+    import time
+
+    try:
+        with open(_cache_fp(curl, cache_dir), "r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+
+    if cached["url"] == curl and time.time() - cached["time"] < ttl:
+        return cached["text"]
+
+    return None
+
+
+def _cache_write(curl: str, text: str, cache_dir: Path) -> None:
+    import time
+
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    fp = _cache_fp(curl, cache_dir)
+    fp_tmp = fp.with_suffix(f".{threading.get_ident()}.tmp")
+    with open(fp_tmp, "w", encoding="utf-8") as f:
+        json.dump({"url": curl, "time": time.time(), "text": text}, f)
+    os.replace(fp_tmp, fp)
@@ -0,0 +1,126 @@
+"""
+Selection of source entries by metadata, before any parsing
+"""
+import itertools
+import re
+from typing import (
+    Callable,
+    Collection,
+    Container,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Pattern,
+    Tuple,
+    TypeVar,
+    Union,
+)
+
+from ..key import Key
+
+T = TypeVar("T")
+
+_Meta = Dict[str, Optional[str]]
+"""Raw metadata of a source entry: ``type``, ``meter``, ``key``, ``id``, ``name``."""
+
+_StrOrStrs = Union[str, Collection[str]]
+
+
+def _as_set(x: _StrOrStrs) -> Collection[str]:
+    return {x} if isinstance(x, str) else set(x)
+
+
+def _predicate(
+    *,
+    type: Optional[_StrOrStrs] = None,
+    meter: Optional[_StrOrStrs] = None,
+    key: Optional[_StrOrStrs] = None,
+    ids: Optional[Container[int]] = None,
+    name: Optional[Union[str, Pattern[str]]] = None,
+) -> Optional[Callable[[_Meta], bool]]:
+    """Predicate on the raw metadata of an entry (None if no conditions)."""
+    conds: List[Callable[[_Meta], bool]] = []
+
+    if type is not None:
+        types = {t.lower() for t in _as_set(type)}
+        conds.append(lambda m: (m["type"] or "").lower() in types)
+
+    if meter is not None:
+        meters = _as_set(meter)
+        conds.append(lambda m: (m["meter"] or "").strip() in meters)
+
+    if key is not None:
+        keys = {Key(k) for k in _as_set(key)}
+
+        def key_ok(m: _Meta) -> bool:
+            try:
+                return Key(m["key"] or "") in keys
+            except Exception:
+                return False
+
+        conds.append(key_ok)
+
+    if ids is not None:
+        ids_ = ids
+
+        def id_ok(m: _Meta) -> bool:
+            id_ = m["id"] or ""
+            return id_.isdigit() and int(id_) in ids_
+
+        conds.append(id_ok)
+
+    if name is not None:
+        pattern = re.compile(name, flags=re.IGNORECASE) if isinstance(name, str) else name
+        conds.append(lambda m: pattern.search(m["name"] or "") is not None)
+
+    if not conds:
+        return None
+
+    return lambda m: all(cond(m) for cond in conds)
+
+
+def _sample(items: Iterable[T], k: int, *, seed: Optional[int] = None) -> List[T]:
+    """Random sample of (up to) `k` of `items`, in their original order,
+    from a single pass (reservoir sampling)."""
+    import random
+
+    if k < 0:
+        raise ValueError("sample size must be non-negative")
+
+    rng = random.Random(seed)
+    reservoir: List[Tuple[int, T]] = []
+    for i, item in enumerate(items):
+        if i < k:
+            reservoir.append((i, item))
+        else:
+            j = rng.randrange(i + 1)
+            if j < k:
+                reservoir[j] = (i, item)
+
+    return [item for _, item in sorted(reservoir, key=lambda t: t[0])]
+
+
+def _select(
+    items: Iterable[T],
+    meta: Callable[[T], _Meta],
+    *,
+    n: Optional[int] = None,
+    sample: Optional[int] = None,
+    seed: Optional[int] = None,
+    **conditions,
+) -> Iterator[T]:
+    """The `items` whose metadata match the `conditions` (see :func:`_predicate`),
+    then the first `n` of those, then a random `sample` of those (seeded by `seed`).
+    Lazy unless sampling."""
+    pred = _predicate(**conditions)
+    if pred is not None:
+        items = (item for item in items if pred(meta(item)))
+
+    items = itertools.islice(items, n)
+
+    if sample is not None:
+        return iter(_sample(items, sample, seed=seed))
+
+    return items
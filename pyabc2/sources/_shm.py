@@ -0,0 +1,197 @@
+"""
+Parallel parsing with the note data transferred through shared memory
+"""
+import functools
+import itertools
+import os
+from collections import deque
+from multiprocessing import shared_memory
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+from ..note import NoteArray
+from ..parse import ParsePool, Tune, _maybe_pool
+
+_COLUMNS = NoteArray._PACKED_COLUMNS
+
+_ITEMSIZES = {name: getattr(NoteArray(), name).itemsize for name in _COLUMNS}
+
+_TYPECODES = {name: getattr(NoteArray(), name).typecode for name in _COLUMNS}
+
+_ALIGN = 8
+"""Byte alignment of the column blocks in a segment."""
+
+_TuneMeta = Tuple[Dict[str, str], int, List[int]]
+"""Header, body start index, and note array column lengths, of a parsed tune."""
+
+
+def _layout(lengths: List[List[int]]) -> Tuple[Dict[str, int], int]:
+    """Start of each column block (all tunes' data for that column) and total size, in bytes,
+    given the column lengths of each tune."""
+    starts = {}
+    size = 0
+    for j, name in enumerate(_COLUMNS):
+        size = -(-size // _ALIGN) * _ALIGN
+        starts[name] = size
+        size += sum(tune_lengths[j] for tune_lengths in lengths) * _ITEMSIZES[name]
+
+    return starts, size
+
+
+def _parse_chunk(
+    abcs: List[str], *, ticks_per_whole: Optional[int] = None
+) -> Tuple[Optional[str], List[Union[_TuneMeta, Exception]]]:
+    """Parse tunes, writing their note data to a new shared memory segment.
+    Returns the name of the segment (None if no data) and, for each tune,
+    its metadata or the exception raised when parsing it.
+    """
+    results: List[Union[_TuneMeta, Exception]] = []
+    arrays: List[NoteArray] = []
+    for abc in abcs:
+        try:
+            tune = Tune(abc, ticks_per_whole=ticks_per_whole)
+        except Exception as e:
+            results.append(e)
+            continue
+
+        na = tune.notes_array
+        arrays.append(na)
+        results.append((tune.header, tune._body_start, [len(getattr(na, c)) for c in _COLUMNS]))
+
+    starts, size = _layout([meta[2] for meta in results if not isinstance(meta, Exception)])
+    if size == 0:
+        return None, results
+
+    shm = shared_memory.SharedMemory(create=True, size=size)
+    try:
+        buf = shm.buf
+        assert buf is not None
+        for name in _COLUMNS:
+            i = starts[name]
+            for na in arrays:
+                b = getattr(na, name).tobytes()
+                buf[i : i + len(b)] = b
+                i += len(b)
+        del buf
+    finally:
+        shm.close()
+
+    return shm.name, results
+
+
+def _take_mapping(shm: shared_memory.SharedMemory) -> Optional[memoryview]:
+    """Read-only buffer of the mapping of `shm`, taken over from it,
+    so that closing `shm` doesn't fail because of the views (and leave the descriptor open).
+    None if not possible, since this relies on the internals of :class:`SharedMemory`."""
+    import mmap
+
+    mm = getattr(shm, "_mmap", None)
+    view = getattr(shm, "_buf", None)
+    if not isinstance(mm, mmap.mmap) or not isinstance(view, memoryview):  # pragma: no cover
+        return None
+
+    buf = memoryview(mm).toreadonly()
+    view.release()
+    shm._buf = shm._mmap = None  # type: ignore[attr-defined]
+
+    return buf
+
+
+def _attach(name: str) -> memoryview:
+    """Read-only buffer of the shared memory segment `name`.
+
+    The segment is unlinked, and its file descriptor closed, right away,
+    so the memory is freed (unmapped) as soon as the buffer views are released.
+    If the mapping can't be taken over (see :func:`_take_mapping`),
+    the data is copied instead.
+    """
+    shm = shared_memory.SharedMemory(name=name)
+    try:
+        if os.name != "nt":
+            shm.unlink()
+
+        buf = _take_mapping(shm)
+        if buf is None:
+            assert shm.buf is not None
+            buf = memoryview(bytes(shm.buf))
+    finally:
+        shm.close()
+
+    return buf
+
+
+def _load_chunk(
+    name: Optional[str],
+    abcs: List[str],
+    results: List[Union[_TuneMeta, Exception]],
+    *,
+    ticks_per_whole: Optional[int] = None,
+) -> Iterator[Union[Tune, Exception]]:
+    """Tunes from the results of :func:`_parse_chunk`,
+    their note arrays being views of the shared memory."""
+    metas = [meta for meta in results if not isinstance(meta, Exception)]
+    starts, _ = _layout([meta[2] for meta in metas])
+    buf = _attach(name) if name is not None else memoryview(b"")
+
+    offsets = dict(starts)
+    for abc, res in zip(abcs, results):
+        if isinstance(res, Exception):
+            yield res
+            continue
+
+        header, body_start, lengths = res
+        cols = {}
+        for col_name, n in zip(_COLUMNS, lengths):
+            i = offsets[col_name]
+            nbytes = n * _ITEMSIZES[col_name]
+            cols[col_name] = buf[i : i + nbytes].cast(_TYPECODES[col_name])
+            offsets[col_name] = i + nbytes
+
+        notes = NoteArray._from_buffers(cols, ticks_per_whole=ticks_per_whole)
+        yield Tune._from_state(abc, header, None, body_start, notes, ticks_per_whole)
+
+
+def parse_shared(
+    abcs: Iterable[str],
+    *,
+    num_workers: int = 2,
+    chunksize: int = 64,
+    ticks_per_whole: Optional[int] = None,
+    pool: Optional[ParsePool] = None,
+) -> Iterator[Union[Tune, Exception]]:
+    """Parse tunes in `num_workers` worker processes (or those of `pool`),
+    transferring the note data back through shared memory
+    instead of pickling it.
+
+    Yields, in order, a :class:`~pyabc2.Tune` for each ABC string
+    (its :attr:`~pyabc2.Tune.notes_array` columns being read-only views of the shared memory)
+    or the exception raised when parsing it.
+    """
+    it = iter(abcs)
+    chunks = iter(lambda: list(itertools.islice(it, chunksize)), [])
+    sent: Deque[List[str]] = deque()
+    stopped = False
+
+    def track() -> Iterator[List[str]]:
+        for chunk in chunks:
+            if stopped:
+                return
+            sent.append(chunk)
+            yield chunk
+
+    # NOTE: `ParsePool` starts the resource tracker before the workers, so that they share it.
+    # Segments are then registered by the workers and unregistered when unlinked here,
+    # and any not received (e.g., worker error) are cleaned up at exit.
+    parse_chunk = functools.partial(_parse_chunk, ticks_per_whole=ticks_per_whole)
+    with _maybe_pool(pool, num_workers) as pool_:
+        chunk_results = pool_.imap(parse_chunk, track(), chunksize=1)
+        try:
+            for name, results in chunk_results:
+                yield from _load_chunk(
+                    name, sent.popleft(), results, ticks_per_whole=ticks_per_whole
+                )
+        finally:
+            # If stopped early, free the segments of the chunks already submitted
+            stopped = True
+            for name, _ in chunk_results:
+                if name is not None:
+                    _attach(name)
@@ -0,0 +1,422 @@
+"""
+asyncio versions of loading tunes from URLs and downloading files
+
+Requests are made with a minimal HTTP/1.1 client on asyncio streams,
+so no async HTTP library is required.
+Tune parsing (CPU-bound) and file access are run in an executor,
+so the event loop isn't blocked.
+
+Unlike the blocking (requests-based) loaders, the client doesn't use proxies
+(``HTTP_PROXY``/``HTTPS_PROXY`` environment variables):
+it connects to the server directly, warning if a proxy is configured for the URL.
+"""
+import asyncio
+import warnings
+import weakref
+from concurrent.futures import Executor
+from pathlib import Path
+from typing import AsyncIterator, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from ..parse import Tune
+from ._http import (
+    _CHUNK_SIZE,
+    _TIMEOUT,
+    CACHE_DIRNAME,
+    _cache_read,
+    _cache_write,
+    _canonical_url,
+    _finish_download,
+    _range_not_satisfiable,
+    _request_headers,
+    _start_download,
+)
+
+_MAX_REDIRECTS = 5
+
+_REDIRECT_STATUSES = {301, 302, 303, 307, 308}
+
+_inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, _InFlight]]" = (
+    weakref.WeakKeyDictionary()
+)
+"""In-flight requests of each event loop, by canonical URL."""
+
+
+class HTTPError(Exception):
+    """Unsuccessful HTTP response status."""
+
+    def __init__(self, status: int, url: str):
+        super().__init__(f"{status} error for URL {url}")
+        self.status = status
+        self.url = url
+
+
+class _Headers(Dict[str, str]):
+    """Response headers, with lower-case names, and case-insensitive lookup."""
+
+    def __contains__(self, key):
+        return super().__contains__(key.lower())
+
+    def __getitem__(self, key):
+        return super().__getitem__(key.lower())
+
+    def get(self, key, default=None):
+        return super().get(key.lower(), default)
+
+
+class _InFlight:
+    """Request (task) shared by the concurrent :func:`get_text` calls for a URL,
+    with the number of calls waiting for it."""
+
+    def __init__(self, task: "asyncio.Task[str]"):
+        self.task = task
+        self.waiters = 0
+
+
+class _Response:
+    """HTTP response, with the body not read yet."""
+
+    def __init__(
+        self,
+        url: str,
+        status: int,
+        headers: _Headers,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter,
+    ):
+        self.url = url
+        self.status = status
+        self.headers = headers
+        self._reader = reader
+        self._writer = writer
+
+    async def _readline(self) -> bytes:
+        return await asyncio.wait_for(self._reader.readline(), _TIMEOUT[1])
+
+    async def iter_body(self) -> AsyncIterator[bytes]:
+        """Chunks of the response body."""
+        reader = self._reader
+        read_timeout = _TIMEOUT[1]
+
+        if self.status in {204, 304}:
+            return
+
+        if "chunked" in self.headers.get("Transfer-Encoding", "").lower():
+            while True:
+                size = int((await self._readline()).split(b";")[0], 16)
+                if size == 0:
+                    # Trailers
+                    while (await self._readline()).strip():
+                        pass
+                    return
+                yield await asyncio.wait_for(reader.readexactly(size), read_timeout)
+                await asyncio.wait_for(reader.readexactly(2), read_timeout)
+
+        elif "Content-Length" in self.headers:
+            n = int(self.headers["content-length"])
+            while n > 0:
+                chunk = await asyncio.wait_for(reader.read(min(n, _CHUNK_SIZE)), read_timeout)
+                if not chunk:
+                    raise ConnectionError(f"connection closed before end of response ({self.url})")
+                n -= len(chunk)
+                yield chunk
+
+        else:
+            while True:
+                chunk = await asyncio.wait_for(reader.read(_CHUNK_SIZE), read_timeout)
+                if not chunk:
+                    return
+                yield chunk
+
+    async def text(self) -> str:
+        """Read the response body and decode it (charset from the content type, default UTF-8)."""
+        body = b"".join([chunk async for chunk in self.iter_body()])
+        charset = "utf-8"
+        for param in self.headers.get("Content-Type", "").split(";")[1:]:
+            name, _, value = param.strip().partition("=")
+            if name.lower() == "charset":
+                charset = value.strip('"')
+
+        return body.decode(charset, errors="replace")
+
+    async def aclose(self) -> None:
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except (OSError, asyncio.CancelledError):  # pragma: no cover
+            pass
+
+
+def _warn_if_proxied(scheme: str, host: str) -> None:
+    from urllib.request import getproxies, proxy_bypass
+
+    # (as the requests-based loaders determine the proxy)
+    if scheme in getproxies() and not proxy_bypass(host):
+        warnings.warn(
+            f"{scheme.upper()}_PROXY is set, but proxies aren't supported by `pyabc2.sources.aio`; "
+            f"connecting to {host} directly."
+        )
+
+
+async def _open(url: str, headers: Optional[Dict[str, str]] = None) -> _Response:
+    """Request `url` (GET), following redirects, and read the response status and headers."""
+    from urllib.parse import urljoin, urlsplit, urlunsplit
+
+    connect_timeout, read_timeout = _TIMEOUT
+    for _ in range(_MAX_REDIRECTS + 1):
+        res = urlsplit(url)
+        if res.scheme not in {"http", "https"} or res.hostname is None:
+            raise ValueError(f"unsupported URL {url!r}")
+        https = res.scheme == "https"
+        port = res.port or (443 if https else 80)
+        _warn_if_proxied(res.scheme, res.hostname)
+
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(res.hostname, port, ssl=True if https else None),
+            connect_timeout,
+        )
+        try:
+            request_headers = {
+                "Host": res.netloc,
+                "User-Agent": "pyabc2",
+                "Accept-Encoding": "identity",
+                "Connection": "close",
+            }
+            request_headers.update(headers or {})
+            target = urlunsplit(("", "", res.path or "/", res.query, ""))
+            lines = [f"GET {target} HTTP/1.1"] + [f"{k}: {v}" for k, v in request_headers.items()]
+            writer.write(("\r\n".join(lines) + "\r\n\r\n").encode("latin-1"))
+            await writer.drain()
+
+            status_line = await asyncio.wait_for(reader.readline(), read_timeout)
+            parts = status_line.split()
+            if len(parts) < 2 or not parts[1].isdigit():
+                raise ConnectionError(f"no valid HTTP response for URL {url}")
+            status = int(parts[1])
+            response_headers = _Headers()
+            while True:
+                line = await asyncio.wait_for(reader.readline(), read_timeout)
+                if not line.strip():
+                    break
+                name, _, value = line.decode("latin-1").partition(":")
+                response_headers[name.strip().lower()] = value.strip()
+        except BaseException:
+            writer.close()
+            raise
+
+        response = _Response(url, status, response_headers, reader, writer)
+        if status in _REDIRECT_STATUSES and "location" in response_headers:
+            await response.aclose()
+            url = urljoin(url, response_headers["location"])
+            continue
+
+        return response
+
+    raise HTTPError(status, url)
+
+
+async def _fetch_text(url: str, curl: str, ttl: Optional[float], cache_dir: Optional[Path]) -> str:
+    loop = asyncio.get_running_loop()
+
+    if ttl is not None and cache_dir is not None:
+        text = await loop.run_in_executor(None, _cache_read, curl, ttl, cache_dir)
+        if text is not None:
+            return text
+
+    response = await _open(url)
+    try:
+        if not 200 <= response.status < 300:
+            raise HTTPError(response.status, url)
+        text = await response.text()
+    finally:
+        await response.aclose()
+
+    if ttl is not None and cache_dir is not None:
+        await loop.run_in_executor(None, _cache_write, curl, text, cache_dir)
+
+    return text
+
+
+async def get_text(
+    url: str, *, ttl: Optional[float] = None, cache_dir: Optional[Path] = None
+) -> str:
+    """GET `url`, returning the response text.
+
+    Concurrent requests for the same (canonical) URL share a single request,
+    which is only cancelled if all of them are.
+    If `ttl` is set, responses are cached on disk (in `cache_dir`),
+    shared with the blocking loaders (see :func:`pyabc2.sources._http.get_text`),
+    and reused for `ttl` seconds.
+    """
+    if ttl is not None and cache_dir is None:
+        raise ValueError("`cache_dir` must be provided to use the cache.")
+
+    loop = asyncio.get_running_loop()
+    curl = _canonical_url(url)
+    inflight = _inflight.setdefault(loop, {})
+
+    request = inflight.get(curl)
+    if request is None:
+        request = inflight[curl] = _InFlight(
+            loop.create_task(_fetch_text(url, curl, ttl, cache_dir))
+        )
+        request.task.add_done_callback(lambda _: inflight.pop(curl))
+
+    request.waiters += 1
+    try:
+        return await asyncio.shield(request.task)
+    finally:
+        request.waiters -= 1
+        if request.waiters == 0 and not request.task.done():
+            request.task.cancel()
+
+
+async def load_url(
+    url: str, *, cache_ttl: Optional[float] = None, executor: Optional[Executor] = None
+) -> Tune:
+    """Load tune from ABC corresponding to `url` (see :func:`pyabc2.sources.load_url`).
+
+    The tune is parsed in `executor` (default: the event loop's default executor).
+    """
+    from urllib.parse import urlsplit
+
+    from . import norbeck, the_session
+
+    loop = asyncio.get_running_loop()
+
+    res = urlsplit(url)
+    if res.netloc in norbeck._URL_NETLOCS:
+        text = await get_text(
+            norbeck._page_url(url), ttl=cache_ttl, cache_dir=norbeck.SAVE_TO / CACHE_DIRNAME
+        )
+        return await loop.run_in_executor(executor, norbeck._page_to_tune, text)
+    elif res.netloc in the_session._URL_NETLOCS:
+        to_query, setting = the_session._api_query(url)
+        text = await get_text(
+            to_query, ttl=cache_ttl, cache_dir=the_session.SAVE_TO / CACHE_DIRNAME
+        )
+        return await loop.run_in_executor(executor, the_session._api_text_to_tune, text, setting)
+    else:
+        raise NotImplementedError(f"loading URL from {res.netloc} not implemented.")
+
+
+async def load_urls(
+    urls: Iterable[str],
+    *,
+    concurrency: int = 8,
+    cache_ttl: Optional[float] = None,
+    executor: Optional[Executor] = None,
+    on_error: str = "raise",
+) -> List[Union[Tune, Exception]]:
+    """Load tunes from `urls` (see :func:`load_url`), up to `concurrency` at a time.
+
+    Repeated URLs are only loaded once (giving the same :class:`~pyabc2.Tune`),
+    and The Session URLs for settings of the same tune share a single API request.
+
+    With ``on_error="return"``, the exception raised when loading a URL
+    is returned in its place instead of raised.
+    """
+    if on_error not in {"raise", "return"}:
+        raise ValueError("`on_error` must be 'raise' or 'return'.")
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def load_one(url: str) -> Tune:
+        async with semaphore:
+            return await load_url(url, cache_ttl=cache_ttl, executor=executor)
+
+    urls = list(urls)
+    tasks = {url: asyncio.ensure_future(load_one(url)) for url in dict.fromkeys(urls)}
+    if not tasks:
+        return []
+
+    try:
+        await asyncio.wait(
+            tasks.values(),
+            return_when=asyncio.FIRST_EXCEPTION if on_error == "raise" else asyncio.ALL_COMPLETED,
+        )
+    finally:
+        for task in tasks.values():
+            task.cancel()
+        # (so that the cancelled tasks are done before they are inspected)
+        await asyncio.gather(*tasks.values(), return_exceptions=True)
+
+    if on_error == "raise":
+        for task in tasks.values():
+            e = task.exception() if not task.cancelled() else None
+            if e is not None:
+                raise e
+
+    results: List[Union[Tune, Exception]] = []
+    for url in urls:
+        task = tasks[url]
+        e = task.exception()
+        if e is not None:
+            assert isinstance(e, Exception)
+            results.append(e)
+        else:
+            results.append(task.result())
+
+    return results
+
+
+async def download(url: str, fp: Union[str, Path]) -> bool:
+    """Download `url` to file `fp`, streaming to disk in chunks
+    (see :func:`pyabc2.sources._http.download` for the conditional and resume behavior,
+    which is shared with the blocking downloads).
+
+    Returns whether the file was (re)downloaded.
+    """
+    loop = asyncio.get_running_loop()
+    fp = Path(fp)
+
+    headers, offset, info = await loop.run_in_executor(None, _request_headers, url, fp)
+    response = await _open(url, headers)
+    try:
+        if response.status == 304:
+            return False
+        if response.status == 416 and offset:
+            if await loop.run_in_executor(
+                None, _range_not_satisfiable, fp, response.headers, offset, info
+            ):
+                return True
+            await response.aclose()
+            return await download(url, fp)
+        if not 200 <= response.status < 300:
+            raise HTTPError(response.status, url)
+
+        mode, info = await loop.run_in_executor(
+            None, _start_download, url, fp, response.status, response.headers, offset, info
+        )
+        n = 0
+        f = await loop.run_in_executor(None, open, fp.with_name(fp.name + ".part"), mode)
+        try:
+            async for chunk in response.iter_body():
+                await loop.run_in_executor(None, f.write, chunk)
+                n += len(chunk)
+        finally:
+            await loop.run_in_executor(None, f.close)
+    finally:
+        await response.aclose()
+
+    # (the .part file is kept, to resume from)
+    length = response.headers.get("Content-Length")
+    if length is not None and n != int(length):
+        raise ConnectionError(f"received {n} of {length} bytes for URL {url}")
+
+    await loop.run_in_executor(None, _finish_download, fp, info)
+
+    return True
+
+
+async def download_many(
+    items: Sequence[Tuple[str, Union[str, Path]]], *, concurrency: int = 4
+) -> List[bool]:
+    """Download the (URL, file path) `items` (see :func:`download`), up to `concurrency` at a time.
+    Returns whether each file was (re)downloaded."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def download_one(url: str, fp: Union[str, Path]) -> bool:
+        async with semaphore:
+            return await download(url, fp)
+
+    return list(await asyncio.gather(*(download_one(url, fp) for url, fp in items)))
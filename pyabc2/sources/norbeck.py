@@ -3,16 +3,20 @@ Henrik Norbeck's ABC Tunes
 
 https://www.norbeck.nu/abc/
 """
+import functools
 import logging
 import os
+import re
 import string
 import warnings
 from pathlib import Path
 from textwrap import indent
-from typing import List, Union
+from typing import Any, Collection, Container, Dict, Iterable, List, Optional, Pattern, Tuple, Union
 
 from .._util import get_logger as _get_logger
-from ..parse import Tune
+from ..parse import ParsePool, Tune, _header_dict, _header_lines, parse_many
+from ._http import CACHE_DIRNAME
+from ._select import _select
 
 logger = _get_logger(__name__)
 
@@ -56,46 +60,68 @@ _COMBINING_ACCENT_FROM_ASCII_SYM = {
 
 _URL_NETLOCS = {"norbeck.nu", "www.norbeck.nu"}
 
+_INDEX_FN = "index.json"
+
+_INDEX_VERSION = 2
+
 _EXPECTED_FAILURES = {
     "chords": {"hornpipes": [18], "reels": [685]},
 }
 
 
-def _get_paths_type(typ: str) -> List[Path]:
-    # Can't just glob since `sl*` also matches `slow`
+def _paths_by_type() -> Dict[str, List[Path]]:
+    """Sorted paths of the downloaded archive files for each tune type,
+    from a single listing of the directory."""
     import re
 
-    all_fps = SAVE_TO.glob("*.abc")  # TODO: could cache or be global?
-    pref = _TYPE_PREFIX[typ]
+    fps_type: Dict[str, List[Path]] = {typ: [] for typ in _TYPE_PREFIX}
+    for fp in sorted(SAVE_TO.glob("*.abc")):
+        # Can't just glob by prefix since `sl*` also matches `slow`
+        m = re.fullmatch(r"([a-z]+)[0-9]+\.abc", fp.name)
+        if m is not None and m.group(1) in _TYPE_TO_FN_PREFIX:
+            fps_type[_TYPE_TO_FN_PREFIX[m.group(1)]].append(fp)
 
-    return list(filter(lambda p: re.fullmatch(rf"{pref}[0-9]+\.abc", p.name), all_fps))
+    return fps_type
+
+
+def _get_paths_type(typ: str) -> List[Path]:
+    return _paths_by_type()[typ]
+
+
+_ZIP_URL = "https://www.norbeck.nu/abc/hn202110.zip"
+"""All Norbeck, including non-Irish."""
 
 
 def download() -> None:
-    import io
+    """Download the Norbeck archive (zip) to :const:`SAVE_TO` and extract the ABC files.
+    If already downloaded, the archive is only transferred again if it has changed
+    (and only then re-extracted), and an interrupted download is resumed.
+    """
+    import shutil
     import zipfile
 
     import requests
 
-    # All Norbeck, including non-Irish
-    url = "https://www.norbeck.nu/abc/hn202110.zip"
+    from ._http import download as download_file
 
-    r = requests.get(url, timeout=5)
+    SAVE_TO.mkdir(exist_ok=True)
 
+    fp_zip = SAVE_TO / _ZIP_URL.rsplit("/", 1)[-1]
     try:
-        r.raise_for_status()
+        changed = download_file(_ZIP_URL, fp_zip)
     except requests.exceptions.HTTPError as e:  # pragma: no cover
         raise Exception("Norbeck file unable to be downloaded (check URL).") from e
 
-    SAVE_TO.mkdir(exist_ok=True)
+    if not changed and list(SAVE_TO.glob("*.abc")):
+        return
 
-    with zipfile.ZipFile(io.BytesIO(r.content)) as z:
+    with zipfile.ZipFile(fp_zip) as z:
         for info in z.infolist():
             fn0 = info.filename
             if fn0.startswith("i/") and not info.is_dir():
                 fn = Path(info.filename).name
                 with z.open(info) as zf, open(SAVE_TO / fn, "wb") as f:
-                    f.write(zf.read())
+                    shutil.copyfileobj(zf, f)
 
 
 def _maybe_download() -> None:
@@ -104,61 +130,76 @@ def _maybe_download() -> None:
         download()
 
 
-def _replace_escaped_diacritics(abc: str, *, ascii_only: bool = False) -> str:
-    """Load a Norbeck ABC, dealing with LaTeX-style diacritic escape codes."""
-    import re
+_ESCAPE_RE = re.compile(
+    r"\{?\\aa\}?|\{?\\o\}?|\\(?P<dcsym>(?!\\aa|\\o).)\{?(?P<letter>[a-zA-Z])\}?"
+)
+"""Diacritic escape codes: the `\\aa` (ring over a) and `\\o` (slashed o) commands,
+and accents added to letters, e.g. `\\'{e}`."""
 
-    # Special case: `\aa` command for ring over a
-    abc1 = abc
-    abc1 = re.sub(r"\{?\\aa\}?", "å", abc1)
 
-    # Special case: `\o` command for slashed o
-    abc1 = re.sub(r"\{?\\o\}?", "ø", abc1)
+@functools.lru_cache()
+def _escape_table(*, ascii_only: bool, normalize: bool) -> Dict[Tuple[str, str], str]:
+    """Replacement for each (symbol, letter) of the diacritic escape codes."""
+    import unicodedata
 
-    # Accents added to letters
-    abc2 = abc1
-    for m in re.finditer(r"\\(?P<dcsym>.)\{?(?P<letter>[a-zA-Z])\}?", abc1):
-        s = m.group(0)
+    table = {("a", "a"): "a\u030a", ("o", ""): "ø"}
+    if normalize:
+        table["a", "a"] = unicodedata.normalize("NFC", table["a", "a"])
 
-        gd = m.groupdict()
-        dcsym = gd["dcsym"]
-        letter = gd["letter"]
+    for dcsym, ca in _COMBINING_ACCENT_FROM_ASCII_SYM.items():
+        for letter in string.ascii_letters:
+            if ascii_only:
+                snew = letter
+            elif normalize:
+                snew = unicodedata.normalize("NFC", letter + ca)
+            else:
+                snew = letter + ca
+            table[dcsym, letter] = snew
+
+    return table
+
+
+def _replace_escaped_diacritics(
+    abc: str, *, ascii_only: bool = False, normalize: bool = False
+) -> str:
+    """Load a Norbeck ABC, dealing with LaTeX-style diacritic escape codes."""
+    table = _escape_table(ascii_only=ascii_only, normalize=normalize)
 
-        ca = _COMBINING_ACCENT_FROM_ASCII_SYM.get(dcsym)
-        if ca is None:
+    def repl(m: "re.Match[str]") -> str:
+        s = m.group(0)
+        if m.group("dcsym") is None:
+            key = ("a", "a") if "aa" in s else ("o", "")
+        else:
+            key = (m.group("dcsym"), m.group("letter"))
+
+        snew = table.get(key)
+        if snew is None:
             raise ValueError(
-                f"diacritic escape code `\\{dcsym}` not recognized "
+                f"diacritic escape code `\\{key[0]}` not recognized "
                 f"in this ABC:\n---\n{abc}\n---"
             )
 
-        if ascii_only:
-            snew = letter
-        else:
-            snew = letter + ca
-            # Note: could use unicodedata to apply a normalization
-            # to give single accented characters instead of two code points
-
-        abc2 = abc2.replace(s, snew)
+        return snew
 
-    return abc2
+    return _ESCAPE_RE.sub(repl, abc)
 
 
-def _load_one_file(fp: Path, *, ascii_only: bool = False) -> List[Tune]:
-    """Load one of the Norbeck archive files, which contain multiple tunes."""
+def _read_blocks(fp: Path) -> List[str]:
+    """Read the tune ABC blocks of one of the Norbeck archive files."""
 
     blocks = []
     with open(fp, "r") as f:
-        block = None
+        lines: Optional[List[str]] = None
         add = False
 
         for line in f:
             if line.startswith("X:"):
                 # Add (if not first X)
-                if block is not None:
-                    blocks.append(block.strip())
+                if lines is not None:
+                    blocks.append("".join(lines).strip())
 
                 # New tune, reset
-                block = line
+                lines = [line]
                 add = True
                 continue
 
@@ -167,24 +208,138 @@ def _load_one_file(fp: Path, *, ascii_only: bool = False) -> List[Tune]:
                 add = False
 
             if add:
-                assert block is not None
-                block += line
+                assert lines is not None
+                lines.append(line)
 
         # Add last block
-        if block is not None:
-            blocks.append(block.strip())
+        if lines is not None:
+            blocks.append("".join(lines).strip())
+
+    return blocks
+
+
+def _ref(abc0: str) -> str:
+    """Reference number (X) of a Norbeck ABC block."""
+    return abc0.split("\n", 1)[0].split(":", 1)[1].strip()
+
+
+def _source_stats() -> Dict[str, List[int]]:
+    """Size and modification time of each of the downloaded archive files."""
+    stats = {}
+    for fp in sorted(SAVE_TO.glob("*.abc")):
+        st = fp.stat()
+        stats[fp.name] = [st.st_size, st.st_mtime_ns]
+
+    return stats
+
+
+def preprocess() -> None:
+    """Read the downloaded archive files into an index of the tune ABCs
+    by tune type and file name (in file order),
+    saved to ``index.json`` in :const:`SAVE_TO`.
+
+    :func:`load` does this automatically
+    when the index is missing or out of date (archive files changed or different pyabc2 version).
+    """
+    _build_index()
+
+
+def _build_index() -> Dict[str, Any]:
+    import json
 
+    from .. import __version__
+
+    _maybe_download()
+
+    stats = _source_stats()
+    tunes: Dict[str, Dict[str, List[str]]] = {}
+    for typ, fps in _paths_by_type().items():
+        # All blocks are kept, even if a reference number is repeated within a file
+        tunes[typ] = {fp.name: _read_blocks(fp) for fp in fps}
+    index = {"version": _INDEX_VERSION, "pyabc2": __version__, "sources": stats, "tunes": tunes}
+
+    fp = SAVE_TO / _INDEX_FN
+    fp_tmp = fp.with_suffix(".tmp")
+    with open(fp_tmp, "w", encoding="utf-8") as f:
+        json.dump(index, f)
+    os.replace(fp_tmp, fp)
+
+    return index
+
+
+def _load_index() -> Dict[str, Any]:
+    """Load the index of the tune ABCs, (re)building it if necessary."""
+    import json
+
+    from .. import __version__
+
+    fp = SAVE_TO / _INDEX_FN
+    if fp.is_file():
+        try:
+            with open(fp, "r", encoding="utf-8") as f:
+                index = json.load(f)
+        except Exception as e:
+            logger.debug(f"Failed to read index {fp.name} ({e}).")
+        else:
+            if (
+                index.get("version") == _INDEX_VERSION
+                and index.get("pyabc2") == __version__
+                and index.get("sources") == _source_stats()
+            ):
+                return index
+
+    return _build_index()
+
+
+def _try_abc(
+    abc0: str, *, ascii_only: bool = False, normalize: bool = False
+) -> Union[str, Exception]:
+    try:
+        return _replace_escaped_diacritics(abc0, ascii_only=ascii_only, normalize=normalize)
+    except Exception as e:
+        return e
+
+
+_BLOCK_SEP = "\n\0\n"
+"""Separator for decoding the blocks of a file together (no escape code can span it)."""
+
+
+def _try_abcs(
+    blocks: List[str], *, ascii_only: bool = False, normalize: bool = False
+) -> List[Union[str, Exception]]:
+    """Replace the diacritic escape codes in the ABC blocks of one of the archive files,
+    in one pass over the whole file."""
+    if not blocks:
+        return []
+
+    try:
+        abcs = _replace_escaped_diacritics(
+            _BLOCK_SEP.join(blocks), ascii_only=ascii_only, normalize=normalize
+        ).split(_BLOCK_SEP)
+    except ValueError:
+        # Find the offending tune(s)
+        return [_try_abc(abc0, ascii_only=ascii_only, normalize=normalize) for abc0 in blocks]
+
+    assert len(abcs) == len(blocks)
+
+    return list(abcs)
+
+
+def _collect_file(
+    fn: str, blocks: List[str], results: Iterable[Union[Tune, Exception]]
+) -> Tuple[List[Tune], int]:
+    """Tunes from the parsing `results` for the `blocks` of one of the Norbeck archive files,
+    and the number of (unexpected) failures."""
     tunes: List[Tune] = []
     failed: int = 0
     expected_failures: List[int] = []
-    for abc0 in blocks:
+    for abc0, res in zip(blocks, results):
         assert abc0.startswith("X:")
-        try:
-            tune = Tune(_replace_escaped_diacritics(abc0, ascii_only=ascii_only))
-        except Exception as e:  # pragma: no cover
-            x = int(abc0.splitlines()[0].split(":")[1])
+        if isinstance(res, Exception):
+            e = res
+            x = int(_ref(abc0))
             if "chords" in str(e) and x in _EXPECTED_FAILURES["chords"].get(
-                _TYPE_TO_FN_PREFIX[fp.stem.rstrip(string.digits)], []
+                _TYPE_TO_FN_PREFIX[Path(fn).stem.rstrip(string.digits)], []
             ):
                 expected_failures.append(x)
                 continue
@@ -195,17 +350,11 @@ def _load_one_file(fp: Path, *, ascii_only: bool = False) -> List[Tune]:
             logger.debug(msg)
             failed += 1
         else:
-            tunes.append(tune)
-
-    if failed:
-        msg = f"{failed} out of {len(blocks)} Norbeck tune(s) in file {fp.name} failed to load."
-        if logger.level == logging.NOTSET or logger.level > logging.DEBUG:
-            msg += " Enable logging debug messages to see more info."
-        warnings.warn(msg)
+            tunes.append(res)
 
     if expected_failures:
         logger.debug(
-            f"{len(expected_failures)} expected failure(s) in file {fp.name}: {expected_failures}"
+            f"{len(expected_failures)} expected failure(s) in file {fn}: {expected_failures}"
         )
 
     # Add norbeck.nu/abc/ URLs
@@ -215,18 +364,177 @@ def _load_one_file(fp: Path, *, ascii_only: bool = False) -> List[Tune]:
         rhy = tune.type
         tune.url = f"https://www.norbeck.nu/abc/display.asp?rhythm={rhy}&ref={ref}"
 
-    return tunes
+    return tunes, failed
 
 
-# TODO: pre-process to json?
+def _warn_failed(fn: str, failed: int, total: int) -> None:
+    if failed:
+        msg = f"{failed} out of {total} Norbeck tune(s) in file {fn} failed to load."
+        if logger.level == logging.NOTSET or logger.level > logging.DEBUG:
+            msg += " Enable logging debug messages to see more info."
+        warnings.warn(msg)
+
+
+def _load_files(
+    file_blocks: List[Tuple[str, List[str]]],
+    *,
+    ascii_only: bool = False,
+    normalize: bool = False,
+    lazy: bool = False,
+    executor: Union[str, ParsePool] = "serial",
+    workers: Optional[int] = None,
+    chunksize: int = 64,
+    shared_memory: bool = False,
+) -> List[Tuple[List[Tune], int]]:
+    """Parse the tune ABC blocks of Norbeck archive files, which contain multiple tunes each.
+    Returns the tunes and number of failures for each file.
+    See :func:`pyabc2.parse.parse_many` for the parsing options."""
+    import itertools
+
+    pre = [
+        abc
+        for _, blocks in file_blocks
+        for abc in _try_abcs(blocks, ascii_only=ascii_only, normalize=normalize)
+    ]
+    parsed = parse_many(
+        (abc for abc in pre if not isinstance(abc, Exception)),
+        executor=executor,
+        workers=workers,
+        chunksize=chunksize,
+        on_error="return",
+        lazy=lazy,
+        shared_memory=shared_memory,
+    )
+    # (`parsed` is exhausted at the end so that any temporary pool is shut down)
+    results = [abc if isinstance(abc, Exception) else next(parsed) for abc in pre] + list(parsed)
+
+    it = iter(results)
+    return [
+        _collect_file(fn, blocks, itertools.islice(it, len(blocks))) for fn, blocks in file_blocks
+    ]
+
+
+def _block_meta(
+    abc0: str, *, ascii_only: bool = False, normalize: bool = False
+) -> Dict[str, Optional[str]]:
+    """Raw metadata for selection from the header lines of a Norbeck ABC block."""
+    h = _header_dict(_header_lines(abc0.split("\n"))[0])
+    title = h.get("tune title")
+    if title is not None:
+        try:
+            title = _replace_escaped_diacritics(title, ascii_only=ascii_only, normalize=normalize)
+        except ValueError:
+            pass
+
+    return {
+        "type": h.get("rhythm"),
+        "meter": h.get("meter"),
+        "key": h.get("key"),
+        "id": h.get("reference number"),
+        "name": title,
+    }
+
+
+def _select_blocks(
+    file_blocks: List[Tuple[str, str, List[str]]],
+    *,
+    ascii_only: bool = False,
+    normalize: bool = False,
+    **select,
+) -> List[Tuple[str, str, List[str]]]:
+    """Select blocks of the (type, file name, blocks) of the archive files
+    (see :func:`pyabc2.sources._select._select`), dropping files with none selected."""
+    selected = _select(
+        ((i, abc0) for i, (_, _, blocks) in enumerate(file_blocks) for abc0 in blocks),
+        lambda t: _block_meta(t[1], ascii_only=ascii_only, normalize=normalize),
+        **select,
+    )
+
+    by_file: Dict[int, List[str]] = {}
+    for i, abc0 in selected:
+        by_file.setdefault(i, []).append(abc0)
+
+    return [(typ, fn, by_file[i]) for i, (typ, fn, _) in enumerate(file_blocks) if i in by_file]
+
+
+_TypeTunes = Tuple[List[Tune], Dict[str, Tuple[int, int]]]
+"""Tunes of a type, and number failed and total number for each of its files."""
+
+
+def _cache_path(
+    typ: str, stats: Dict[str, List[int]], *, ascii_only: bool, normalize: bool, lazy: bool
+) -> Path:
+    """Path for the parsed-tunes cache of tune type `typ`,
+    corresponding to the stats of its archive files and the load settings."""
+    import hashlib
+    import json
+
+    from .. import __version__
+
+    h = hashlib.sha256(json.dumps(stats, sort_keys=True).encode())
+    h.update(
+        f"|pyabc2={__version__}|ascii_only={ascii_only}|normalize={normalize}|lazy={lazy}".encode()
+    )
+
+    return SAVE_TO / f"tunes.{_TYPE_PREFIX[typ]}.{h.hexdigest()[:16]}.pkl"
+
+
+def _read_cache(fp: Path) -> Optional[_TypeTunes]:
+    """Load (tunes, failures by file) from cache file `fp` if possible."""
+    import pickle
+
+    if not fp.is_file():
+        return None
+
+    try:
+        with open(fp, "rb") as f:
+            cached = pickle.load(f)
+    except Exception as e:
+        logger.debug(f"Failed to read cache {fp.name} ({e}).")
+        return None
+
+    return cached["tunes"], cached["failed"]
+
+
+def _write_cache(fp: Path, tunes: List[Tune], failed: Dict[str, Tuple[int, int]]) -> None:
+    """Write cache file `fp`, removing other (stale) caches of the same tune type."""
+    import pickle
+
+    pref = fp.name.split(".")[1]
+    for fp_old in SAVE_TO.glob(f"tunes.{pref}.*.pkl"):
+        if fp_old != fp:
+            fp_old.unlink()
+
+    fp_tmp = fp.with_suffix(".tmp")
+    with open(fp_tmp, "wb") as f:
+        pickle.dump({"tunes": tunes, "failed": failed}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(fp_tmp, fp)
 
 
 def load(
-    which: Union[str, List[str]] = "all", *, ascii_only: bool = False, debug: bool = False
+    which: Union[str, List[str]] = "all",
+    *,
+    ascii_only: bool = False,
+    normalize: bool = False,
+    debug: bool = False,
+    lazy: bool = False,
+    cache: bool = True,
+    num_workers: int = 1,
+    chunksize: int = 64,
+    shared_memory: bool = False,
+    pool: Optional[ParsePool] = None,
+    meter: Optional[Union[str, Collection[str]]] = None,
+    key: Optional[Union[str, Collection[str]]] = None,
+    ref: Optional[Container[int]] = None,
+    name: Optional[Union[str, Pattern[str]]] = None,
+    sample: Optional[int] = None,
+    seed: Optional[int] = None,
 ) -> List[Tune]:
     """
     Load a list of tunes, by type(s) or all of them.
 
+    The tune ABCs are read from the index built by :func:`preprocess`.
+
     Parameters
     ----------
     which
@@ -234,6 +542,39 @@ def load(
     ascii_only
         Whether to drop the implied diacritic symbols, e.g., `\'o` (`True`)
         or add the corresponding unicode characters (`False`).
+    normalize
+        Apply NFC normalization to the accented letters added,
+        giving single precomposed characters where possible
+        (otherwise the letter is followed by a combining accent).
+    lazy
+        Only parse the tune headers initially,
+        deferring parsing of the measures of each tune until first access.
+        Tunes that fail body parsing aren't detected as failures in this case.
+    cache
+        Cache the parsed tunes of each type to disk (in :const:`SAVE_TO`),
+        keyed by the archive files' stats and the load settings,
+        and load from this cache on subsequent calls.
+    num_workers
+        Parse the tunes in this many worker processes,
+        sending them `chunksize` tunes at a time.
+    shared_memory
+        With ``num_workers > 1``, have the workers write the parsed note data to shared memory
+        instead of pickling the tunes back.
+        The tunes' :attr:`~pyabc2.Tune.notes_array` columns are then read-only views of that memory.
+        Can't be used with `lazy`.
+    pool
+        Parse the tunes in the workers of this :class:`~pyabc2.parse.ParsePool`
+        instead of starting `num_workers` new ones.
+    meter, key, ref, name
+        Only load tunes with this meter (e.g. ``"6/8"``),
+        key (e.g. ``"D"`` or ``"Ador"``, matched as :class:`~pyabc2.Key`),
+        reference number (X) (e.g. ``range(1, 100)``),
+        or primary title matching this regex (searched, case ignored).
+        The tunes are selected from their header lines before any parsing.
+        Selected loads aren't cached.
+    sample, seed
+        Only load a random sample of `sample` tunes (of those selected),
+        which is reproducible with `seed`.
     """
     # TODO: allow Norbeck ID as arg as well to load an individual tune? or URL?
     if isinstance(which, str):
@@ -244,14 +585,9 @@ def load(
     else:
         logger.setLevel(logging.NOTSET)
 
-    _maybe_download()
-
-    fps: List[Path]
     if which == ["all"]:
-        fps = list(SAVE_TO.glob("*.abc"))
-
+        which = list(_TYPE_PREFIX)
     else:
-        fps = []
         for tune_type in which:
             if tune_type not in _TYPE_PREFIX:
                 raise ValueError(
@@ -259,39 +595,102 @@ def load(
                     f"Try one of {set(_TYPE_PREFIX)}."
                 )
 
-            fps.extend(_get_paths_type(tune_type))
+    select = dict(meter=meter, key=key, ids=ref, name=name, sample=sample)
+    selecting = any(v is not None for v in select.values())
+    if selecting:
+        cache = False
 
-    tunes = []
-    for fp in sorted(fps):
-        tunes.extend(_load_one_file(fp, ascii_only=ascii_only))
+    _maybe_download()
 
-    return tunes
+    # Tune types in archive file name order
+    types = sorted(which, key=_TYPE_PREFIX.__getitem__)
+
+    # The caches are identified from the archive files' stats,
+    # so the index is only loaded if there is parsing to do
+    source_stats = _source_stats()
+    paths_by_type = _paths_by_type()
+
+    by_type: Dict[str, _TypeTunes] = {}
+    fp_caches: Dict[str, Path] = {}
+    for typ in set(types):
+        if not paths_by_type[typ]:
+            by_type[typ] = ([], {})
+            continue
+        stats = {fp.name: source_stats[fp.name] for fp in paths_by_type[typ]}
+        fp_caches[typ] = _cache_path(
+            typ, stats, ascii_only=ascii_only, normalize=normalize, lazy=lazy
+        )
+        cached = _read_cache(fp_caches[typ]) if cache else None
+        if cached is not None:
+            logger.debug(f"Loaded parsed {typ} from cache {fp_caches[typ].name}.")
+            by_type[typ] = cached
+
+    to_parse = sorted(set(types) - set(by_type), key=_TYPE_PREFIX.__getitem__)
+    if to_parse:
+        executor: Union[str, ParsePool]
+        if pool is not None:
+            executor = pool
+        elif num_workers > 1:
+            executor = "process"
+        else:
+            executor = "serial"
 
+        index = _load_index()
 
-def load_url(url: str) -> Tune:
-    """Load tune from a specified ``norbeck.nu/abc/`` URL.
+        # All types are parsed together, so that the work is spread over the workers
+        file_blocks = [
+            (typ, fn, blocks) for typ in to_parse for fn, blocks in index["tunes"][typ].items()
+        ]
+        if selecting:
+            file_blocks = _select_blocks(
+                file_blocks, ascii_only=ascii_only, normalize=normalize, seed=seed, **select
+            )
+        results = _load_files(
+            [(fn, blocks) for _, fn, blocks in file_blocks],
+            ascii_only=ascii_only,
+            normalize=normalize,
+            lazy=lazy,
+            executor=executor,
+            workers=num_workers,
+            chunksize=chunksize,
+            shared_memory=shared_memory,
+        )
+        for (typ, fn, blocks), (tunes_fn, failed_fn) in zip(file_blocks, results):
+            tunes_typ, failed_typ = by_type.setdefault(typ, ([], {}))
+            tunes_typ.extend(tunes_fn)
+            failed_typ[fn] = (failed_fn, len(blocks))
 
-    For example:
-    - https://norbeck.nu/abc/display.asp?rhythm=slip+jig&ref=106
-    - https://www.norbeck.nu/abc/display.asp?rhythm=reel&ref=693
+        for typ in to_parse:
+            if cache:
+                _write_cache(fp_caches[typ], *by_type[typ])
 
-    Grabs the ABC from the HTML source.
-    """
-    import re
-    from html import unescape
-    from urllib.parse import urlsplit, urlunsplit
+    tunes = []
+    for typ in types:
+        tunes_typ, failed_typ = by_type.get(typ, ([], {}))
+        tunes.extend(tunes_typ)
+        for fn, (failed, total) in failed_typ.items():
+            _warn_failed(fn, failed, total)
 
-    import requests
+    return tunes
+
+
+def _page_url(url: str) -> str:
+    """URL of the tune page to request for a ``norbeck.nu/abc/`` URL."""
+    from urllib.parse import urlsplit, urlunsplit
 
     res = urlsplit(url)
     assert res.netloc in _URL_NETLOCS
     assert res.path.startswith("/abc")
 
-    r = requests.get(urlunsplit(res._replace(scheme="https")), timeout=5)
-    r.raise_for_status()
+    return urlunsplit(res._replace(scheme="https", fragment=""))
+
+
+def _page_to_tune(text: str) -> Tune:
+    """Tune from the HTML source of a tune page."""
+    from html import unescape
 
     m = re.search(
-        r'<div id="abc" class="monospace">X:[0-9]+<br/>\s*(.*?)\s*</div>', r.text, flags=re.DOTALL
+        r'<div id="abc" class="monospace">X:[0-9]+<br/>\s*(.*?)\s*</div>', text, flags=re.DOTALL
     )
     assert m is not None
     abc = unescape(m.group(1)).replace("<br/>", "")
@@ -299,6 +698,27 @@ def load_url(url: str) -> Tune:
     return Tune(abc)
 
 
+def load_url(url: str, *, session: Any = None, cache_ttl: Optional[float] = None) -> Tune:
+    """Load tune from a specified ``norbeck.nu/abc/`` URL.
+
+    For example:
+    - https://norbeck.nu/abc/display.asp?rhythm=slip+jig&ref=106
+    - https://www.norbeck.nu/abc/display.asp?rhythm=reel&ref=693
+
+    Grabs the ABC from the HTML source.
+    The page is requested with `session` if provided,
+    and, if `cache_ttl` is set, cached on disk for `cache_ttl` seconds
+    (in ``_http-cache`` in :const:`SAVE_TO`).
+    """
+    from ._http import get_text
+
+    text = get_text(
+        _page_url(url), session=session, ttl=cache_ttl, cache_dir=SAVE_TO / CACHE_DIRNAME
+    )
+
+    return _page_to_tune(text)
+
+
 if __name__ == "__main__":  # pragma: no cover
     tune = load_url("https://norbeck.nu/abc/display.asp?rhythm=slip+jig&ref=106")
     print(tune.title)
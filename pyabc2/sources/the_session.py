@@ -1,14 +1,33 @@
 """
 Load data from The Session (https://thesession.org)
 """
+import itertools
 import logging
 import os
 import warnings
 from pathlib import Path
-from typing import TYPE_CHECKING, List, Literal, Optional, Union
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Collection,
+    Container,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Pattern,
+    TextIO,
+    Tuple,
+    Union,
+)
 
 from .._util import get_logger as _get_logger
-from ..parse import Tune
+from ..parse import ParsePool, Tune, _maybe_pool, parse_many
+from ._http import CACHE_DIRNAME
+from ._select import _select
 
 if TYPE_CHECKING:  # pragma: no cover
     import pandas
@@ -61,15 +80,15 @@ K:{data['key']}
     return tune
 
 
-def _archive_data_to_tune(data: dict) -> Tune:
-    """The Session JSON archive entry -> Tune"""
+def _archive_data_to_abc(data: dict) -> str:
+    """The Session JSON archive entry -> ABC"""
     # Differences cf. to the web API data:
     # - don't know X
     # - don't need to convert `! ` to newline
     # - 'key' is 'mode'
     # - the archive data entries have 'tune_id' and 'setting_id' already
 
-    melody_abc = data["abc"]
+    melody_abc = data["abc"].replace("\r\n", "\n")
 
     abc = f"""\
 T:{data['name']}
@@ -80,24 +99,35 @@ K:{data['mode']}
 {melody_abc}
 """
 
-    tune = Tune(abc)
-    tune.url = f"https://thesession.org/tunes/{data['tune_id']}#setting{data['setting_id']}"
+    return abc
 
-    return tune
 
+def _archive_data_url(data: dict) -> str:
+    return f"https://thesession.org/tunes/{data['tune_id']}#setting{data['setting_id']}"
 
-def load_url(url: str) -> Tune:
-    """Load tune from a specified ``thesession.org`` URL.
 
-    For example:
-    - https://thesession.org/tunes/10000 (first setting assumed)
-    - https://thesession.org/tunes/10000#setting31601 (specific setting)
+def _archive_data_meta(data: dict) -> Dict[str, Optional[str]]:
+    """The Session JSON archive entry -> raw metadata for selection"""
+    return {
+        "type": data.get("type"),
+        "meter": data.get("meter"),
+        "key": data.get("mode"),
+        "id": data.get("tune_id"),
+        "name": data.get("name"),
+    }
 
-    Using the API: https://thesession.org/api
-    """
-    from urllib.parse import urlsplit, urlunsplit
 
-    import requests
+def _archive_data_to_tune(data: dict, *, lazy: bool = False) -> Tune:
+    """The Session JSON archive entry -> Tune"""
+    tune = Tune(_archive_data_to_abc(data), lazy=lazy)
+    tune.url = _archive_data_url(data)
+
+    return tune
+
+
+def _api_query(url: str) -> Tuple[str, Optional[int]]:
+    """API (JSON) URL and setting ID (None if not specified) for a ``thesession.org`` tune URL."""
+    from urllib.parse import urlsplit, urlunsplit
 
     res = urlsplit(url)
     assert res.netloc in _URL_NETLOCS
@@ -111,20 +141,12 @@ def load_url(url: str) -> Tune:
         setting = None
     to_query = urlunsplit(res._replace(scheme="https", fragment="", query="format=json"))
 
-    r = requests.get(to_query, timeout=5)
-    r.raise_for_status()
-    tune_data = r.json()
+    return to_query, setting
 
-    if setting is None:
-        # Use first
-        i = 0
-        setting_data = tune_data["settings"][i]
-    else:
-        for i, setting_data in enumerate(tune_data["settings"]):
-            if setting_data["id"] == setting:
-                break
-        else:  # pragma: no cover
-            raise ValueError(f"detected setting {setting} not found in {to_query}")
+
+def _api_setting_to_tune(tune_data: dict, i: int) -> Tune:
+    """Tune for setting `i` of The Session Web API tune data."""
+    setting_data = dict(tune_data["settings"][i])
 
     # Add non-setting-specific data
     assert "name" not in setting_data
@@ -144,105 +166,573 @@ def load_url(url: str) -> Tune:
     return _api_data_to_tune(setting_data)
 
 
+def _api_text_to_tune(text: str, setting: Optional[int] = None) -> Tune:
+    """Tune for setting ID `setting` (first if None) from The Session Web API tune response."""
+    import json
+
+    tune_data = json.loads(text)
+
+    if setting is None:
+        # Use first
+        i = 0
+    else:
+        for i, setting_data in enumerate(tune_data["settings"]):
+            if setting_data["id"] == setting:
+                break
+        else:  # pragma: no cover
+            raise ValueError(f"detected setting {setting} not found in tune {tune_data['id']}")
+
+    return _api_setting_to_tune(tune_data, i)
+
+
+def _api_text_to_tunes(text: str) -> List[Tune]:
+    """Tunes for all settings from The Session Web API tune response."""
+    import json
+
+    tune_data = json.loads(text)
+
+    return [_api_setting_to_tune(tune_data, i) for i in range(len(tune_data["settings"]))]
+
+
+def load_url(url: str, *, session: Any = None, cache_ttl: Optional[float] = None) -> Tune:
+    """Load tune from a specified ``thesession.org`` URL.
+
+    For example:
+    - https://thesession.org/tunes/10000 (first setting assumed)
+    - https://thesession.org/tunes/10000#setting31601 (specific setting)
+
+    Using the API: https://thesession.org/api
+
+    The API response is requested with `session` if provided,
+    and, if `cache_ttl` is set, cached on disk for `cache_ttl` seconds
+    (in ``_http-cache`` in :const:`SAVE_TO`).
+    """
+    from ._http import get_text
+
+    to_query, setting = _api_query(url)
+
+    text = get_text(to_query, session=session, ttl=cache_ttl, cache_dir=SAVE_TO / CACHE_DIRNAME)
+
+    return _api_text_to_tune(text, setting)
+
+
+def load_url_all_settings(
+    url: str, *, session: Any = None, cache_ttl: Optional[float] = None
+) -> List[Tune]:
+    """Load all settings of the tune of a ``thesession.org`` URL
+    (any setting specified is ignored), from a single API request.
+    See :func:`load_url`.
+    """
+    from ._http import get_text
+
+    to_query, _ = _api_query(url)
+
+    text = get_text(to_query, session=session, ttl=cache_ttl, cache_dir=SAVE_TO / CACHE_DIRNAME)
+
+    return _api_text_to_tunes(text)
+
+
+_ARCHIVE_BASE_URL = "https://github.com/adactio/TheSession-data/raw/main/json/"
+
+
 def download(which: Union[str, List[str]] = "tunes") -> None:
-    import requests
+    """Download archive files (JSON) from https://github.com/adactio/TheSession-data
+    to :const:`SAVE_TO`, concurrently.
+    Files already downloaded are only transferred again if they have changed,
+    and interrupted downloads are resumed.
+    """
+    from ._http import download_many
 
     if isinstance(which, str):
         which = [which]
 
-    SAVE_TO.mkdir(exist_ok=True)
-
-    base_url = "https://github.com/adactio/TheSession-data/raw/main/json/"
-    supported = ["tunes"]
+    supported = sorted(_META_ALLOWED)
 
     if not set(which) <= set(supported):
         raise ValueError(f"invalid `which`. Only these are supported: {supported}.")
 
-    for fstem in which:  # TODO: threaded
-        fn = f"{fstem}.json"
-        url = base_url + fn
-        r = requests.get(url, timeout=5)
-        r.raise_for_status()
-        with open(SAVE_TO / fn, "wb") as f:
-            f.write(r.content)
+    SAVE_TO.mkdir(exist_ok=True)
+
+    download_many(
+        [(f"{_ARCHIVE_BASE_URL}{fstem}.json", SAVE_TO / f"{fstem}.json") for fstem in which]
+    )
 
 
-def _maybe_load_one(d: dict) -> Optional[Tune]:
+def _maybe_load_one(d: dict, *, lazy: bool = False) -> Optional[Tune]:
     """Try to load tune from a The Session data entry, otherwise log debug messages
     and return None."""
-    from textwrap import indent
-
-    d["abc"] = d["abc"].replace("\r\n", "\n")
     try:
-        tune = _archive_data_to_tune(d)
+        tune = _archive_data_to_tune(d, lazy=lazy)
     except Exception as e:  # pragma: no cover
-        d_ = {k: v for k, v in d.items() if k in {"tune_id", "setting_id", "title"}}
-        msg = f"Failed to load ABC ({e}): {d_}"
-        if _DEBUG_SHOW_FULL_ABC:
-            abc_ = indent(d["abc"], "  ")
-            msg += f"\n{abc_}"
-        logger.debug(msg)
+        _log_failure(d, e)
         tune = None
 
     return tune
 
 
+def _log_failure(d: dict, e: Exception) -> None:
+    from textwrap import indent
+
+    d_ = {k: v for k, v in d.items() if k in {"tune_id", "setting_id", "title"}}
+    msg = f"Failed to load ABC ({e}): {d_}"
+    if _DEBUG_SHOW_FULL_ABC:
+        abc_ = indent(d["abc"], "  ")
+        msg += f"\n{abc_}"
+    logger.debug(msg)
+
+
+def _iter_json_array(f: TextIO, *, chunk_size: int = 2**16) -> Iterator[Any]:
+    """Incrementally decode the elements of the JSON array in text file `f`,
+    only keeping about `chunk_size` characters (or one element, if larger) in memory."""
+    import json
+
+    decoder = json.JSONDecoder()
+    ws = " \t\n\r"
+    buf = ""
+    pos = 0
+
+    def fill() -> bool:
+        nonlocal buf, pos
+        more = f.read(max(chunk_size, len(buf) - pos))
+        buf = buf[pos:] + more
+        pos = 0
+        return bool(more)
+
+    in_array = False
+    while True:
+        while pos < len(buf) and (buf[pos] in ws or (in_array and buf[pos] == ",")):
+            pos += 1
+        if pos == len(buf):
+            if not fill():
+                raise ValueError("unexpected end of JSON array")
+            continue
+
+        if not in_array:
+            if buf[pos] != "[":
+                raise ValueError(f"expected JSON array, found {buf[pos]!r}")
+            in_array = True
+            pos += 1
+            continue
+
+        if buf[pos] == "]":
+            return
+
+        try:
+            obj, end = decoder.raw_decode(buf, pos)
+        except json.JSONDecodeError:
+            # Element probably split across chunks
+            if not fill():
+                raise
+            continue
+
+        yield obj
+        pos = end
+
+
+def _iter_archive_entries(fp: Path, *, n: Optional[int] = None, **select) -> Iterator[dict]:
+    """Iterate over the (first `n`) entries of a The Session JSON archive file
+    that match the selection (see :func:`load`)."""
+    with open(fp, encoding="utf-8") as f:
+        yield from _select(_iter_json_array(f), _archive_data_meta, n=n, **select)
+
+
+def _ensure_archive(*, redownload: bool = False) -> Path:
+    """Path to the tunes archive, downloading it first if necessary
+    (or, with `redownload`, if it has changed)."""
+    fp = SAVE_TO / "tunes.json"
+    if not fp.is_file() or redownload:
+        download("tunes")
+
+    return fp
+
+
+def _iter_maybe_tunes(
+    data: Iterable[dict],
+    *,
+    lazy: bool = False,
+    num_workers: int = 1,
+    chunksize: int = 64,
+    ordered: bool = True,
+    shared_memory: bool = False,
+    pool: Optional[ParsePool] = None,
+) -> Iterator[Optional[Tune]]:
+    """Load tunes from archive entries, in worker processes if `num_workers` > 1 or `pool`,
+    yielding None for those that fail."""
+    import functools
+
+    if shared_memory and lazy:
+        raise ValueError("`shared_memory` can't be used with `lazy`")
+
+    executor: Union[str, ParsePool]
+    if pool is not None:
+        executor = pool
+    elif num_workers > 1:
+        executor = "process"
+    else:
+        executor = "serial"
+
+    if not ordered and executor != "serial" and not shared_memory:
+        # Tunes as they are ready -- so the URLs are added in the workers
+        load_one = functools.partial(_maybe_load_one, lazy=lazy)
+        with _maybe_pool(pool, num_workers) as pool_:
+            yield from pool_.imap(load_one, data, chunksize=chunksize, ordered=False)
+        return
+
+    data, data_ = itertools.tee(data)
+    for d, res in zip(
+        data_,
+        parse_many(
+            map(_archive_data_to_abc, data),
+            executor=executor,
+            workers=num_workers,
+            chunksize=chunksize,
+            on_error="return",
+            lazy=lazy,
+            shared_memory=shared_memory and executor != "serial",
+        ),
+    ):
+        if isinstance(res, Exception):
+            _log_failure(d, res)
+            yield None
+        else:
+            res.url = _archive_data_url(d)
+            yield res
+
+
+def iter_tunes(
+    *,
+    n: Optional[int] = None,
+    redownload: bool = False,
+    lazy: bool = False,
+    num_workers: int = 1,
+    chunksize: int = 64,
+    ordered: bool = True,
+    shared_memory: bool = False,
+    pool: Optional[ParsePool] = None,
+    type: Optional[Union[str, Collection[str]]] = None,
+    meter: Optional[Union[str, Collection[str]]] = None,
+    key: Optional[Union[str, Collection[str]]] = None,
+    tune_id: Optional[Container[int]] = None,
+    name: Optional[Union[str, Pattern[str]]] = None,
+    sample: Optional[int] = None,
+    seed: Optional[int] = None,
+) -> Iterator[Tune]:
+    """Iterate over tunes from https://github.com/adactio/TheSession-data,
+    parsing them as they are read from the archive file,
+    so memory usage doesn't depend on the archive size
+    and the first `n` tunes can be obtained without reading the whole file.
+
+    With ``num_workers > 1``, the tunes are parsed in worker processes,
+    `chunksize` archive entries at a time, with a bounded number of chunks in flight.
+    Use ``ordered=False`` to get tunes as soon as they are ready instead of in archive order.
+    With ``shared_memory=True``, the workers send the note data back through shared memory
+    (tunes are then always in archive order; see :func:`load`).
+    Pass a :class:`~pyabc2.parse.ParsePool` as `pool` to reuse its workers
+    instead of starting `num_workers` new ones.
+
+    Tunes that fail to load are skipped, with a warning at the end.
+    See :func:`load` for the other options, including selecting entries
+    (with sampling, the whole archive is read before the first tune is parsed).
+    """
+    fp = _ensure_archive(redownload=redownload)
+
+    total = failed = 0
+    for tune in _iter_maybe_tunes(
+        _iter_archive_entries(
+            fp,
+            n=n,
+            type=type,
+            meter=meter,
+            key=key,
+            ids=tune_id,
+            name=name,
+            sample=sample,
+            seed=seed,
+        ),
+        lazy=lazy,
+        num_workers=num_workers,
+        chunksize=chunksize,
+        ordered=ordered,
+        shared_memory=shared_memory,
+        pool=pool,
+    ):
+        total += 1
+        if tune is None:
+            failed += 1
+        else:
+            yield tune
+
+    _warn_failed(failed, total)
+
+
+def _cache_settings(*, n: Optional[int], lazy: bool) -> Dict[str, Any]:
+    from .. import __version__
+
+    return {"pyabc2": __version__, "n": n, "lazy": lazy}
+
+
+def _settings_id(*, n: Optional[int], lazy: bool) -> str:
+    """Hash of the load settings, identifying the caches made with them."""
+    import hashlib
+
+    settings = _cache_settings(n=n, lazy=lazy)
+    h = hashlib.sha256(f"pyabc2={settings['pyabc2']}|n={n}|lazy={lazy}".encode())
+
+    return h.hexdigest()[:8]
+
+
+def _cache_path(fp: Path, *, n: Optional[int], lazy: bool) -> Path:
+    """Path for the parsed-tunes cache corresponding to the version of archive file `fp`
+    and the load settings.
+
+    The version is identified by the file's size and modification time,
+    and ETag if downloaded, so the file isn't read.
+    """
+    import hashlib
+
+    from ._http import _read_meta
+
+    st = fp.stat()
+    etag = _read_meta(fp.parent).get(fp.name, {}).get("etag")
+    h = hashlib.sha256(f"{st.st_size}|{st.st_mtime_ns}|{etag}".encode())
+
+    return SAVE_TO / f"tunes.{h.hexdigest()[:16]}.{_settings_id(n=n, lazy=lazy)}.pkl"
+
+
+_EntryKey = Tuple[int, int, str]
+"""Tune ID, setting ID, and hash of the ABC, of an archive entry."""
+
+
+def _entry_key(d: dict) -> _EntryKey:
+    import hashlib
+
+    h = hashlib.blake2b(_archive_data_to_abc(d).encode(), digest_size=16)
+
+    return int(d["tune_id"]), int(d["setting_id"]), h.hexdigest()
+
+
+def _keyed(data: Iterable[dict], keys: List[_EntryKey]) -> Iterator[dict]:
+    """Pass through the archive entries, appending their keys to `keys`."""
+    for d in data:
+        keys.append(_entry_key(d))
+        yield d
+
+
+class _Cache(NamedTuple):
+    settings: Dict[str, Any]
+    keys: List[_EntryKey]
+    results: List[Optional[Tune]]
+    """Tune for each entry (None if failed)."""
+
+
+def _read_cache(fp: Path) -> Optional[_Cache]:
+    """Load cache file `fp` if possible."""
+    import pickle
+
+    if not fp.is_file():
+        return None
+
+    try:
+        with open(fp, "rb") as f:
+            cached = pickle.load(f)
+        return _Cache(cached["settings"], cached["keys"], cached["results"])
+    except Exception as e:
+        logger.debug(f"Failed to read cache {fp.name} ({e}).")
+        return None
+
+
+def _previous_cache(fp: Path, *, n: Optional[int], lazy: bool) -> Optional[_Cache]:
+    """Cache for a previous version of the archive file, with the same load settings,
+    if there is one."""
+    settings = _cache_settings(n=n, lazy=lazy)
+    for fp_old in SAVE_TO.glob(f"tunes.*.{_settings_id(n=n, lazy=lazy)}.pkl"):
+        if fp_old == fp:
+            continue
+        cached = _read_cache(fp_old)
+        if cached is not None and cached.settings == settings:
+            logger.debug(f"Updating from previous cache {fp_old.name}.")
+            return cached
+
+    return None
+
+
+def _write_cache(fp: Path, cached: _Cache) -> None:
+    """Write cache file `fp`, removing the stale caches (previous archive versions)
+    with the same settings. Caches with other settings are kept."""
+    import pickle
+
+    settings_id = fp.name.split(".")[2]
+    for fp_old in SAVE_TO.glob(f"tunes.*.{settings_id}.pkl"):
+        if fp_old != fp:
+            fp_old.unlink()
+
+    fp_tmp = fp.with_suffix(".tmp")
+    with open(fp_tmp, "wb") as f:
+        pickle.dump(cached._asdict(), f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(fp_tmp, fp)
+
+
+def _update(
+    fp: Path, previous: _Cache, *, n: Optional[int] = None, **kwargs
+) -> Tuple[List[Optional[Tune]], List[_EntryKey]]:
+    """Load the (first `n`) entries of archive file `fp`,
+    reusing the tunes of `previous` for the entries that haven't changed
+    (same tune and setting ID, and same ABC),
+    and only parsing those that were added or changed
+    (`kwargs` passed to :func:`_iter_maybe_tunes`)."""
+    old = dict(zip(previous.keys, previous.results))
+
+    keys: List[_EntryKey] = []
+    results: List[Optional[Tune]] = []
+    todo: List[Tuple[int, dict]] = []
+    for d in _iter_archive_entries(fp, n=n):
+        key = _entry_key(d)
+        keys.append(key)
+        if key in old:
+            results.append(old[key])
+        else:
+            todo.append((len(results), d))
+            results.append(None)
+
+    logger.debug(f"Parsing {len(todo)} new or changed entries (of {len(results)}).")
+    for (i, _), tune in zip(todo, _iter_maybe_tunes((d for _, d in todo), **kwargs)):
+        results[i] = tune
+
+    return results, keys
+
+
 def load(
-    *, n: Optional[int] = None, redownload: bool = False, debug: bool = False, num_workers: int = 1
+    *,
+    n: Optional[int] = None,
+    redownload: bool = False,
+    debug: bool = False,
+    num_workers: int = 1,
+    lazy: bool = False,
+    cache: bool = True,
+    incremental: bool = True,
+    chunksize: int = 64,
+    shared_memory: bool = False,
+    pool: Optional[ParsePool] = None,
+    type: Optional[Union[str, Collection[str]]] = None,
+    meter: Optional[Union[str, Collection[str]]] = None,
+    key: Optional[Union[str, Collection[str]]] = None,
+    tune_id: Optional[Container[int]] = None,
+    name: Optional[Union[str, Pattern[str]]] = None,
+    sample: Optional[int] = None,
+    seed: Optional[int] = None,
 ) -> List[Tune]:
     """Load tunes from https://github.com/adactio/TheSession-data
 
-    Use ``redownload=True`` to force re-download. Otherwise the file will only
+    Use ``redownload=True`` to re-download the archive file if it has changed
+    (a single request if it hasn't). Otherwise the file will only
     be downloaded if it hasn't already been.
 
+    Use ``lazy=True`` to only parse the tune headers (title, type, key, ...) initially.
+    The measures of each tune are then parsed on first access,
+    so tunes that fail body parsing aren't detected as failures here.
+
+    With ``cache=True`` (default), the parsed tunes are saved next to the archive file
+    and reused (no ABC parsing) on subsequent loads,
+    until the archive file or the PyABC2 version changes.
+    When the archive file has changed (e.g. after ``redownload=True``),
+    with ``incremental=True`` (default) only the entries that were added or changed
+    (by tune and setting ID and ABC content) are parsed,
+    and the others are taken from the previous cache.
+
+    With ``num_workers > 1``, archive entries are sent to the worker processes
+    in chunks of `chunksize`.
+    Use ``shared_memory=True`` to have the workers write the parsed note data
+    to shared memory instead of pickling the tunes back.
+    The tunes' :attr:`~pyabc2.Tune.notes_array` columns are then read-only views of that memory
+    (e.g., :meth:`~pyabc2.note.NoteArray.to_numpy` doesn't copy).
+
+    Pass a :class:`~pyabc2.parse.ParsePool` as `pool` to parse in its (already started) workers
+    instead of starting `num_workers` new ones, e.g. when loading repeatedly.
+
+    Archive entries can be selected by their metadata before any parsing:
+    `type` (e.g. ``"reel"``, case ignored), `meter` (e.g. ``"4/4"``),
+    `key` (e.g. ``"D"`` or ``"Ador"``, matched as :class:`~pyabc2.Key`),
+    `tune_id` (e.g. ``range(1, 1000)``), and `name` (regex searched, case ignored).
+    The first `n` of the matching entries are then taken (all if None),
+    and, with `sample`, a random sample of that many of them,
+    which is reproducible with `seed` (archive order is kept).
+    Selected loads aren't cached.
+
     @adactio (Jeremy) is the creator of The Session.
     """
-    import json
-
-    fp = SAVE_TO / "tunes.json"
-    parallel = num_workers > 1
-
     if debug:  # pragma: no cover
         logger.setLevel(logging.DEBUG)
     else:
         logger.setLevel(logging.NOTSET)
 
-    if not fp.is_file() or redownload:
-        download("tunes")
+    fp = _ensure_archive(redownload=redownload)
+
+    select = dict(type=type, meter=meter, key=key, ids=tune_id, name=name, sample=sample)
+    if any(v is not None for v in select.values()):
+        cache = False
+
+    if cache:
+        fp_cache = _cache_path(fp, n=n, lazy=lazy)
+        cached = _read_cache(fp_cache)
+        if cached is not None:
+            logger.debug(f"Loaded parsed tunes from cache {fp_cache.name}.")
+            tunes, failed, total = _collect(cached.results)
+            _warn_failed(failed, total)
+            return tunes
+
+    if (num_workers > 1 or pool is not None) and debug:  # pragma: no cover
+        warnings.warn("Multi-processing, detailed debug messages won't be shown.")
+
+    parse_kwargs: Dict[str, Any] = dict(
+        lazy=lazy,
+        num_workers=num_workers,
+        chunksize=chunksize,
+        shared_memory=shared_memory,
+        pool=pool,
+    )
 
-    with open(fp, encoding="utf-8") as f:
-        data = json.load(f)
+    previous = _previous_cache(fp_cache, n=n, lazy=lazy) if cache and incremental else None
+
+    keys: List[_EntryKey] = []
+    if previous is not None:
+        results, keys = _update(fp, previous, n=n, **parse_kwargs)
+    else:
+        # Entries are decoded incrementally, so the raw data is never all in memory at once
+        entries = _iter_archive_entries(fp, n=n, seed=seed, **select)
+        results = list(
+            _iter_maybe_tunes(_keyed(entries, keys) if cache else entries, **parse_kwargs)
+        )
 
-    if n is not None:
-        data = data[:n]
+    if cache:
+        _write_cache(fp_cache, _Cache(_cache_settings(n=n, lazy=lazy), keys, results))
 
-    if parallel:
-        import multiprocessing
+    tunes, failed, total = _collect(results)
+    _warn_failed(failed, total)
 
-        if debug:  # pragma: no cover
-            warnings.warn("Multi-processing, detailed debug messages won't be shown.")
+    return tunes
 
-        with multiprocessing.Pool(num_workers) as pool:
-            maybe_tunes = pool.map(_maybe_load_one, data)
-    else:
-        maybe_tunes = [_maybe_load_one(d) for d in data]
 
+def _collect(maybe_tunes: Iterable[Optional[Tune]]) -> Tuple[List[Tune], int, int]:
+    """Tunes, number failed (None), and total number."""
     tunes = []
-    failed = 0
+    failed = total = 0
     for maybe_tune in maybe_tunes:
+        total += 1
         if maybe_tune is None:
             failed += 1
         else:
             tunes.append(maybe_tune)
 
+    return tunes, failed, total
+
+
+def _warn_failed(failed: int, total: int) -> None:
     if failed:
-        msg = f"{failed} out of {len(data)} The Session tune(s) failed to load."
+        msg = f"{failed} out of {total} The Session tune(s) failed to load."
         if logger.level == logging.NOTSET or logger.level > logging.DEBUG:
             msg += " Enable logging debug messages to see more info."
         warnings.warn(msg)
 
-    return tunes
-
 
 def _choose_int_type(s, *, ext: bool = False):
     import numpy as np
@@ -287,6 +777,171 @@ def _choose_int_type(s, *, ext: bool = False):
 
 _META_ALLOWED = {"aliases", "events", "recordings", "sessions", "sets", "tune_popularity", "tunes"}
 
+_META_DATE_COLS = {
+    "events": ["dtstart", "dtend"],
+    "sessions": ["date"],
+    "sets": ["date"],
+    "tunes": ["date"],
+}
+"""Datetime columns of the metadata files."""
+
+_META_FLOAT_COLS = {"events": ["latitude", "longitude"]}
+"""Float columns (with missing values) of the metadata files."""
+
+_META_CAT_COLS = {"sets": ["type", "meter", "mode"], "tunes": ["type", "meter", "mode"]}
+"""Categorical columns of the metadata files."""
+
+_META_STORES = {"parquet", "feather"}
+"""Columnar formats that metadata files can be converted to."""
+
+
+def _meta_path(which: str, format: str, *, redownload: bool = False) -> Path:
+    """Local copy of a metadata file, downloaded to :const:`SAVE_TO` if necessary."""
+    from ._http import download as _download
+
+    fp = SAVE_TO / f"{which}.{format}"
+    if redownload or not fp.is_file():
+        SAVE_TO.mkdir(exist_ok=True)
+        url = _ARCHIVE_BASE_URL[: -len("json/")] + f"{format}/{which}.{format}"
+        _download(url, fp)
+
+    return fp
+
+
+def _meta_columns(fp: Path, format: str) -> List[str]:
+    """Column names of metadata file `fp`."""
+    import pandas as pd
+
+    if format == "json":
+        with open(fp, "r", encoding="utf-8") as f:
+            first: Dict[str, Any] = next(_iter_json_array(f), {})
+        return list(first)
+    else:
+        return pd.read_csv(fp, nrows=0).columns.tolist()
+
+
+def _json_column(values: List[Any]) -> "pandas.Series":
+    """Column from JSON values, with numeric strings converted (as :func:`pandas.read_json` does)."""
+    import numpy as np
+    import pandas as pd
+
+    s = pd.Series(values)
+    try:
+        num = s.astype(np.float64)
+    except (TypeError, ValueError):
+        return s
+
+    if num.notna().all() and (num == num.round()).all():
+        return num.astype(np.int64)
+
+    return num
+
+
+def _read_meta_file(
+    which: str,
+    fp: Path,
+    format: str,
+    columns: Optional[List[str]] = None,
+    *,
+    categorical: bool = False,
+) -> "pandas.DataFrame":
+    """Read metadata file `fp` (only `columns` if set), with the column dtypes set while reading:
+    dates and floats parsed, and, if `categorical`, the categorical columns as categories
+    (with ``''`` as null)."""
+    import numpy as np
+    import pandas as pd
+
+    if columns is None:
+        columns = _meta_columns(fp, format)
+    date_cols = [c for c in _META_DATE_COLS.get(which, []) if c in columns]
+    float_cols = [c for c in _META_FLOAT_COLS.get(which, []) if c in columns]
+    cat_cols = [c for c in _META_CAT_COLS.get(which, []) if c in columns] if categorical else []
+
+    if format == "json":
+        # Only keep the values of the requested columns while reading
+        data: Dict[str, List[Any]] = {c: [] for c in columns}
+        with open(fp, "r", encoding="utf-8") as f:
+            for i, d in enumerate(_iter_json_array(f)):
+                if i == 0:
+                    missing = [c for c in columns if c not in d]
+                    if missing:
+                        raise ValueError(f"columns {missing} not in {which!r} metadata.")
+                for c, values in data.items():
+                    values.append(d[c])
+        df_data: Dict[str, Any] = {}
+        for c in columns:
+            values = data.pop(c)
+            if c in cat_cols:
+                df_data[c] = pd.Categorical([v if v != "" else None for v in values])
+            elif c in float_cols:
+                df_data[c] = pd.Series(values).replace("", np.nan).astype(float)
+            elif c in date_cols:
+                df_data[c] = values
+            else:
+                df_data[c] = _json_column(values)
+        df = pd.DataFrame(df_data, columns=columns)
+    else:
+        df = pd.read_csv(
+            fp,
+            usecols=columns,
+            parse_dates=date_cols or False,
+            keep_default_na=False,
+            na_values={col: [""] for col in float_cols + cat_cols},
+            dtype={
+                **{col: "float64" for col in float_cols},
+                **{col: "category" for col in cat_cols},
+            },
+        )[columns]
+
+    for col in date_cols:
+        df[col] = pd.to_datetime(df[col])
+
+    return df
+
+
+def _store_path(which: str, fp: Path, format: str, store: str) -> Path:
+    """Directory of the columnar copy (a file per column) of metadata file `fp`,
+    corresponding to its current version."""
+    import hashlib
+
+    from .. import __version__
+
+    st = fp.stat()
+    h = hashlib.sha256(f"{st.st_size}|{st.st_mtime_ns}|pyabc2={__version__}".encode())
+
+    return SAVE_TO / f"{which}.{format}.{h.hexdigest()[:16]}.{store}"
+
+
+def _read_store(d: Path, store: str, columns: List[str]) -> "pandas.DataFrame":
+    import pandas as pd
+
+    read = pd.read_parquet if store == "parquet" else pd.read_feather
+
+    return pd.concat([read(d / f"{col}.{store}") for col in columns], axis=1)
+
+
+def _write_store(d: Path, store: str, df: "pandas.DataFrame") -> None:
+    """Add the columns of `df` to columnar copy `d`, removing the copies of previous versions."""
+    import shutil
+
+    stem = d.name.rsplit(".", 2)[0]
+    for d_old in SAVE_TO.glob(f"{stem}.*.{store}"):
+        if d_old != d:
+            if d_old.is_dir():
+                shutil.rmtree(d_old)
+            else:
+                d_old.unlink()
+
+    d.mkdir(exist_ok=True)
+    for col in df.columns:
+        fp = d / f"{col}.{store}"
+        fp_tmp = fp.with_suffix(".tmp")
+        if store == "parquet":
+            df[[col]].to_parquet(fp_tmp, index=False)
+        else:
+            df[[col]].to_feather(fp_tmp)
+        os.replace(fp_tmp, fp)
+
 
 def load_meta(
     which: str,
@@ -294,12 +949,25 @@ def load_meta(
     convert_dtypes: bool = False,
     downcast_ints: bool = False,
     format: Literal["json", "csv"] = "json",
+    columns: Optional[Iterable[str]] = None,
+    store: Optional[Literal["parquet", "feather"]] = None,
+    redownload: bool = False,
 ) -> "pandas.DataFrame":
     """Load metadata file from The Session archive as dataframe (requires pandas).
 
+    The file is downloaded to :const:`SAVE_TO` the first time (or if `redownload`),
+    and subsequently loaded from there.
+
     Parameters
     ----------
     which : {'aliases', 'events', 'recordings', 'sessions', 'sets', 'tune_popularity', 'tunes'}
+    columns
+        Only load these columns (in this order).
+        The other columns are not kept in memory (or even parsed, with ``format='csv'``).
+    store
+        Convert the loaded columns to this columnar format the first time (requires pyarrow),
+        and subsequently load them from the converted files instead,
+        with the column dtypes (dates, floats) already set.
 
     Notes
     -----
@@ -323,57 +991,30 @@ def load_meta(
     if format not in {"csv", "json"}:
         raise ValueError("`format` must be 'csv' or 'json'.")
 
-    base_url = f"https://raw.githubusercontent.com/adactio/TheSession-data/main/{format}/"
-    fn = f"{which}.{format}"
-    url = base_url + fn
+    if store is not None and store not in _META_STORES:
+        raise ValueError(f"`store` must be one of {sorted(_META_STORES)} or None.")
 
-    if format == "json":
-        df = pd.read_json(url)
+    cols = list(columns) if columns is not None else None
+
+    fp = _meta_path(which, format, redownload=redownload)
+
+    if store is not None:
+        d_store = _store_path(which, fp, format, store)
+        if cols is None:
+            cols = _meta_columns(fp, format)
+        to_convert = [col for col in cols if not (d_store / f"{col}.{store}").is_file()]
+        if to_convert:
+            _write_store(d_store, store, _read_meta_file(which, fp, format, to_convert))
+        df = _read_store(d_store, store, cols)
     else:
-        parse_dates: Union[bool, List[str]]
-        if which in {"sets", "sessions", "tunes"}:
-            parse_dates = ["date"]
-        elif which in {"events"}:
-            parse_dates = ["dtstart", "dtend"]
-        else:
-            parse_dates = False
-        df = pd.read_csv(url, parse_dates=parse_dates, keep_default_na=False)
-
-    cat_cols = []
-    if which == "aliases":
-        pass
-
-    elif which == "events":
-        df["dtstart"] = pd.to_datetime(df.dtstart)
-        df["dtend"] = pd.to_datetime(df.dtend)
-        df["latitude"] = df.latitude.replace("", np.nan).astype(float)
-        df["longitude"] = df.longitude.replace("", np.nan).astype(float)
-
-    elif which == "recordings":
-        # Note 'tune_id' can be missing, so is left as str
-        # To get int with missing val support: `.tune_id.replace("", np.nan).astype("UInt16")`
-        pass
-
-    elif which == "sessions":
-        pass
-
-    elif which == "sets":
-        # int cols: 'tuneset', 'member_id', 'settingorder', 'tune_id', 'setting_id'
-        cat_cols = ["type", "meter", "mode"]
-
-    elif which == "tune_popularity":
-        # str cols: 'name', 'tunebooks'
-        # int cols: 'tune_id'
-        # Currently min tunebook count ('tunebooks') is 10
-        # (https://github.com/adactio/TheSession-data/issues/14)
-        pass
-
-    elif which == "tunes":
-        # int cols: 'tune_id', 'setting_id'
-        cat_cols = ["type", "meter", "mode"]
+        df = _read_meta_file(which, fp, format, cols, categorical=convert_dtypes)
 
-    else:  # pragma: no cover
-        raise AssertionError("shouldn't reach here")
+    # Notes on the other columns:
+    # - recordings 'tune_id' can be missing, so is left as str
+    #   (to get int with missing val support: `.tune_id.replace("", np.nan).astype("UInt16")`)
+    # - tune_popularity 'tunebooks' min is currently 10
+    #   (https://github.com/adactio/TheSession-data/issues/14)
+    cat_cols = [col for col in _META_CAT_COLS.get(which, []) if col in df.columns]
 
     if downcast_ints:
         int_cols = df.dtypes[df.dtypes == np.int64].index.tolist()
@@ -384,7 +1025,7 @@ def load_meta(
         df = df.replace("", np.nan)
 
         # Special case for recordings 'tune_id'
-        if which == "recordings":
+        if which == "recordings" and "tune_id" in df.columns:
             df["tune_id"] = df["tune_id"].astype(
                 "Int64"
                 if not downcast_ints
@@ -0,0 +1,338 @@
+"""
+Random access to the tunes of multi-tune ABC files (tunebooks)
+"""
+import json
+import mmap
+import os
+import re
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+    overload,
+)
+
+from ._util import get_logger as _get_logger
+from .parse import Tune, _header_dict, _header_lines
+
+if TYPE_CHECKING:  # pragma: no cover
+    import pandas
+
+logger = _get_logger(__name__)
+
+_INDEX_VERSION = 3
+
+_X_RE = re.compile(rb"^X:", flags=re.MULTILINE)
+"""Reference number (X) lines, which start a tune (even without a number)."""
+
+_K_RE = re.compile(rb"^[ \t]*K:.*$", flags=re.MULTILINE)
+"""Key (K) lines, which end the tune header."""
+
+
+class _Entry(NamedTuple):
+    x: Optional[int]
+    start: int
+    stop: int
+    titles: List[str]
+
+
+class TunebookIndex:
+    """Index of the tunes in a multi-tune ABC file,
+    giving random access to the tunes by reference number (X) or title
+    without parsing the others.
+
+    The tune boundaries are found in one scan of the memory-mapped file,
+    and the resulting offsets are saved (by default next to it, ``<name>.index.json``)
+    for reuse until the file changes.
+    Each ``X:`` line starts a tune, and the titles are those in the tune header
+    (before ``K:``), read as for :func:`scan_headers`.
+
+    Parameters
+    ----------
+    path
+        ABC file.
+    encoding
+        Encoding of the ABC file.
+    persist
+        Save the index, for reuse.
+        If it can't be saved (e.g. directory not writable), it's just not reused.
+    index_path
+        Where to save the index (default: ``<name>.index.json`` next to the ABC file).
+    """
+
+    def __init__(
+        self,
+        path: Union[str, "os.PathLike[str]"],
+        *,
+        encoding: str = "utf-8",
+        persist: bool = True,
+        index_path: Optional[Union[str, "os.PathLike[str]"]] = None,
+    ):
+        self.path = Path(path)
+        """Path to the ABC file."""
+
+        self.encoding = encoding
+        """Encoding of the ABC file."""
+
+        self.index_path: Optional[Path]
+        """Path to the saved index (None if not saved)."""
+        if not persist:
+            self.index_path = None
+        elif index_path is not None:
+            self.index_path = Path(index_path)
+        else:
+            self.index_path = self.path.with_name(self.path.name + ".index.json")
+
+        self._entries: List[_Entry] = self._load()
+
+        self._by_x: Dict[int, _Entry] = {}
+        for entry in reversed(self._entries):
+            # First tune with the reference number if repeated
+            if entry.x is not None:
+                self._by_x[entry.x] = entry
+
+    def _stat(self) -> List[int]:
+        st = self.path.stat()
+        return [st.st_size, st.st_mtime_ns]
+
+    def _load(self) -> List[_Entry]:
+        """Load the saved index if up to date, otherwise scan the file (and save)."""
+        stat = self._stat()
+        if self.index_path is not None and self.index_path.is_file():
+            try:
+                with open(self.index_path, "r", encoding="utf-8") as f:
+                    d = json.load(f)
+            except Exception as e:
+                logger.debug(f"Failed to read index {self.index_path.name} ({e}).")
+            else:
+                if (
+                    d.get("version") == _INDEX_VERSION
+                    and d.get("stat") == stat
+                    and d.get("encoding") == self.encoding
+                ):
+                    return [_Entry(*entry) for entry in d["tunes"]]
+
+        entries = self._scan()
+
+        if self.index_path is not None:
+            d = {
+                "version": _INDEX_VERSION,
+                "stat": stat,
+                "encoding": self.encoding,
+                "tunes": entries,
+            }
+            fp_tmp = self.index_path.with_suffix(".tmp")
+            try:
+                with open(fp_tmp, "w", encoding="utf-8") as f:
+                    json.dump(d, f)
+                os.replace(fp_tmp, self.index_path)
+            except OSError as e:
+                logger.debug(f"Failed to save index {self.index_path.name} ({e}).")
+
+        return entries
+
+    def _scan(self) -> List[_Entry]:
+        """Find the tune boundaries and titles in one pass over the file."""
+        with open(self.path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return []
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                return [
+                    _Entry(_header_x(h), start, stop, _header_titles(h))
+                    for start, stop, h in _scan_buffer(mm, self.encoding)
+                ]
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, x: object) -> bool:
+        return x in self._by_x
+
+    def __iter__(self) -> Iterator[Tune]:
+        """Parse the tunes in file order."""
+        with open(self.path, "rb") as f:
+            for entry in self._entries:
+                yield Tune(self._read(f, entry))
+
+    def __getitem__(self, x: int) -> Tune:
+        """Parse the tune with reference number `x`."""
+        return Tune(self.abc(x))
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({str(self.path)!r}, tunes={len(self)})"
+
+    @property
+    def xs(self) -> List[Optional[int]]:
+        """Reference numbers (X) of the tunes, in file order (None if no number)."""
+        return [entry.x for entry in self._entries]
+
+    @property
+    def titles(self) -> List[str]:
+        """Primary titles of the tunes, in file order (empty string if none)."""
+        return [entry.titles[0] if entry.titles else "" for entry in self._entries]
+
+    def _read(self, f, entry: _Entry) -> str:
+        f.seek(entry.start)
+        return f.read(entry.stop - entry.start).decode(self.encoding).strip()
+
+    def abc(self, x: int) -> str:
+        """ABC of the tune with reference number `x` (the first one if repeated)."""
+        entry = self._by_x.get(x)
+        if entry is None:
+            raise KeyError(f"no tune with reference number (X) {x} in {self.path.name}")
+
+        with open(self.path, "rb") as f:
+            return self._read(f, entry)
+
+    def find(self, *, title: str) -> Tune:
+        """Parse the first tune with `title` as one of its titles (case ignored)."""
+        title_ = title.casefold()
+        for entry in self._entries:
+            if any(t.casefold() == title_ for t in entry.titles):
+                with open(self.path, "rb") as f:
+                    return Tune(self._read(f, entry))
+
+        raise KeyError(f"no tune with title {title!r} in {self.path.name}")
+
+
+_CATALOG_FIELDS = {
+    "title": "tune title",
+    "rhythm": "rhythm",
+    "meter": "meter",
+    "key": "key",
+    "composer": "composer",
+    "origin": "origin",
+}
+"""Catalog columns taken directly from the tune header."""
+
+
+def _scan_buffer(buf: Any, encoding: str) -> Iterator[Tuple[int, int, Dict[str, str]]]:
+    """Start and stop byte offsets and header of each tune in `buf`,
+    only decoding the header lines.
+    Anything before the first ``X:`` line (e.g. a file header) is skipped."""
+    starts = [m.start() for m in _X_RE.finditer(buf)]
+    if not starts:
+        # Single tune without reference number
+        starts = [0]
+    stops = starts[1:] + [len(buf)]
+
+    for start, stop in zip(starts, stops):
+        m = _K_RE.search(buf, start, stop)
+        end = m.end() if m is not None else stop
+        header_lines, _ = _header_lines(
+            buf[start:end].decode(encoding, errors="replace").split("\n")
+        )
+        yield start, stop, _header_dict(header_lines)
+
+
+def _header_x(h: Dict[str, str]) -> Optional[int]:
+    """Reference number from tune header info (None if missing or not a number)."""
+    x = h.get("reference number", "")
+    return int(x) if x.isdigit() else None
+
+
+def _header_titles(h: Dict[str, str]) -> List[str]:
+    """All titles from tune header info."""
+    return [v for k, v in h.items() if "tune title" in k]
+
+
+@overload
+def scan_headers(
+    sources: Union[str, "os.PathLike[str]", Iterable[Union[str, "os.PathLike[str]"]]],
+    *,
+    encoding: str = ...,
+    as_frame: Literal[False] = ...,
+) -> Dict[str, List[Any]]:
+    ...
+
+
+@overload
+def scan_headers(
+    sources: Union[str, "os.PathLike[str]", Iterable[Union[str, "os.PathLike[str]"]]],
+    *,
+    encoding: str = ...,
+    as_frame: Literal[True],
+) -> "pandas.DataFrame":
+    ...
+
+
+def scan_headers(
+    sources: Union[str, "os.PathLike[str]", Iterable[Union[str, "os.PathLike[str]"]]],
+    *,
+    encoding: str = "utf-8",
+    as_frame: bool = False,
+) -> Union[Dict[str, List[Any]], "pandas.DataFrame"]:
+    """Catalog the tunes in ABC files or strings from their headers only,
+    without parsing the tune bodies.
+
+    The header lines (up to ``K:``) are read following the same rules as :class:`~pyabc2.Tune`.
+
+    Parameters
+    ----------
+    sources
+        ABC file paths and/or ABC strings.
+        Strings without line breaks are taken to be file paths.
+        Each may contain multiple tunes, starting at the ``X:`` lines
+        (anything before the first one, e.g. a file header, is skipped).
+    encoding
+        Encoding of the ABC files.
+    as_frame
+        Return a :class:`pandas.DataFrame` (requires pandas).
+
+    Returns
+    -------
+    :
+        Columns (lists of equal length, one value per tune):
+        ``source`` (file path, or position of the ABC string in `sources`),
+        ``x`` (reference number, int or None),
+        ``title``, ``titles`` (list of all the titles),
+        ``rhythm``, ``meter``, ``key``, ``composer``, ``origin`` (None if not in the header),
+        and ``start``/``stop`` (byte offsets of the tune in the file or UTF-8 encoded string).
+    """
+    if isinstance(sources, (str, os.PathLike)):
+        sources = [sources]
+
+    cols: Dict[str, List[Any]] = {
+        name: []
+        for name in ["source", "x", "title", "titles"]
+        + list(_CATALOG_FIELDS)[1:]
+        + ["start", "stop"]
+    }
+
+    def add(source: Union[str, int], buf: Any) -> None:
+        for start, stop, h in _scan_buffer(buf, encoding):
+            cols["source"].append(source)
+            cols["x"].append(_header_x(h))
+            cols["titles"].append(_header_titles(h))
+            for name, field_name in _CATALOG_FIELDS.items():
+                cols[name].append(h.get(field_name))
+            cols["start"].append(start)
+            cols["stop"].append(stop)
+
+    for i, source in enumerate(sources):
+        if isinstance(source, str) and "\n" in source:
+            add(i, source.encode("utf-8"))
+            continue
+
+        with open(source, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                continue
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                add(os.fspath(source), mm)
+
+    if as_frame:
+        import pandas as pd
+
+        return pd.DataFrame(cols)
+
+    return cols
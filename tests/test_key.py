@@ -100,3 +100,34 @@ def test_scvs_consistency():
     scvs0 = key.scale_chromatic_values
     scvs = [pc.value_in(key) for pc in key.scale]
     assert scvs0 == scvs
+
+
+def test_key_interned():
+    import pickle
+
+    G = Key("G")
+    assert Key("Gmaj") is G
+    assert Key(tonic="G", mode="major") is G
+    assert Key("G ionian") is Key("Gion")
+    assert Key(tonic="G", mode="ionian") is Key("Gion")
+
+    # Equivalent modes are kept as written, but share the key tables
+    assert Key("Gion") == G and Key("Gion") is not G
+    assert Key("Gion").mode == "Ionian"
+    assert str(Key("Gion")) == "Gion"
+    assert Key("Gion")._get_tables() is G._get_tables()
+    assert Key("Aaeo")._get_tables() is Key("Am")._get_tables()
+    assert Key("Aaeo").key_signature == Key("Am").key_signature
+    assert Key("Em").relative_major is G
+    assert pickle.loads(pickle.dumps(G)) is G
+    assert len({Key("Am"), Key("Aaeo"), Key("C")}) == 2
+
+
+def test_key_immutable():
+    k = Key("D")
+    with pytest.raises(AttributeError):
+        k.tonic = Key("G").tonic  # type: ignore[misc]
+    with pytest.raises(TypeError):
+        k.accidentals["B"] = "b"  # type: ignore[index]
+    k.key_signature.append("G#")
+    assert k.key_signature == ["F#", "C#"]
@@ -2,12 +2,13 @@
 Test the pitch and note modules
 """
 import warnings
+from fractions import Fraction
 from functools import partial
 
 import pytest
 
 from pyabc2.key import Key
-from pyabc2.note import Note, _octave_from_abc_parts
+from pyabc2.note import Note, NoteArray, _octave_from_abc_parts
 from pyabc2.pitch import (
     Pitch,
     PitchClass,
@@ -601,3 +602,160 @@ class TestHelmholtz:
 def test_invalid_helmholtz(helmholtz):
     with pytest.raises(ValueError, match="invalid Helmholtz pitch"):
         Pitch.from_helmholtz(helmholtz)
+
+
+def test_note_array():
+    measures = [
+        [Note.from_abc("^f"), Note.from_abc("G2")],
+        [],
+        [Note.from_abc("a/"), Note.from_abc("_B,3/2", key=Key("G"))],
+    ]
+    na = NoteArray.from_measures(measures)
+
+    assert len(na) == 4
+    assert na.n_measures == 3
+    assert list(na.measure) == [0, 0, 2, 2]
+    assert list(na.measure_starts) == [0, 2, 2, 4]
+    assert na.durations == [Fraction(1, 8), Fraction(1, 4), Fraction(1, 16), Fraction(3, 16)]
+
+    assert list(na) == [n for m in measures for n in m]
+    assert na[-1].class_name == "Bb"
+    assert na[0].name == "F#5"
+    assert [na.measure_notes(i) for i in range(na.n_measures)] == measures
+
+    with pytest.raises(IndexError):
+        na[4]
+
+    # Repeat the first two measures (only the play order grows)
+    nbytes = na.nbytes
+    assert na._repeat_measures(0, 2) == 2
+    assert len(na) == 4
+    assert list(na.play_order) == [0, 1, 2, 0, 1]
+    assert na.n_played_measures == 5
+    assert na.nbytes == nbytes + 2 * na.play_order.itemsize
+    assert list(na.played_index()) == [0, 1, 2, 3, 0, 1]
+    assert list(na.iter_played()) == [n for m in measures + measures[:2] for n in m]
+
+
+def test_note_array_to_numpy():
+    pytest.importorskip("numpy")
+
+    na = NoteArray.from_measures([[Note.from_abc("C"), Note.from_abc("c2")]])
+    d = na.to_numpy()
+
+    assert d["value"].tolist() == [48, 60]
+    assert d["duration_num"].tolist() == [1, 1]
+    assert d["duration_den"].tolist() == [8, 4]
+    assert d["value"].base is not None  # shares memory
+
+
+def test_note_cache():
+    from pyabc2.note import clear_note_cache, note_cache_info
+    from pyabc2.parse import Tune
+
+    clear_note_cache()
+    abc = "K:{key}\nB B2 B | B ^B B |"
+
+    t = Tune(abc.format(key="G#m"))
+    info = note_cache_info()
+    assert info.misses == 3  # `B`, `B2`, `^B`
+    assert info.hits == 3
+
+    # Enharmonically equivalent keys compare equal but have different accidentals
+    assert Key("G#m") == Key("Abm")
+    t2 = Tune(abc.format(key="Abm"))
+    assert [n.class_name for n in t.iter_notes()][:3] == ["B", "B", "B"]
+    assert [n.class_name for n in t2.iter_notes()][:3] == ["Bb", "Bb", "Bb"]
+    assert note_cache_info().misses == 6
+
+
+def test_note_array_ticks():
+    from pyabc2.note import TICKS_PER_WHOLE
+    from pyabc2.parse import Tune
+
+    abc = "K:D\nd2 e/f/ | (3gfe d |"
+    t1 = Tune(abc)
+    t2 = Tune(abc, ticks_per_whole=TICKS_PER_WHOLE)
+    na1, na2 = t1.notes_array, t2.notes_array
+
+    assert list(na2.duration_ticks) == [480, 120, 120, 240, 240, 240, 240]
+    assert len(na2.duration_num) == len(na1.duration_ticks) == 0
+    assert t1.measures == t2.measures
+    assert na1.durations == na2.durations
+
+    assert na2.measure_ticks() == [720, 960]
+    assert na2.offset_ticks() == [0, 480, 600, 720, 960, 1200, 1440]
+    assert na1.measure_durations() == na2.measure_durations() == [Fraction(3, 8), Fraction(1, 2)]
+    assert na1.offsets() == na2.offsets()
+
+    with pytest.raises(ValueError, match="durations not stored as ticks"):
+        na1.measure_ticks()
+
+    with pytest.raises(ValueError, match="can't be represented with 8 ticks per whole note"):
+        _ = Tune(abc, ticks_per_whole=8).notes_array
+
+
+def test_flyweights():
+    assert PitchClass(0) is PitchClass(12)
+    assert Pitch(48) is Pitch.from_class_value(0, 4)
+    assert PitchClass.from_name("Db") is PitchClass.from_name("Db")
+
+    # Spelled or out-of-range instances are not shared
+    assert Pitch.from_name("Db4") is not Pitch.from_name("Db4")
+    assert Pitch(-1) is not Pitch(-1)
+    assert Note(60) is not Note(60)
+
+    # Spelling a shared pitch class doesn't affect the shared pitches
+    p = PitchClass.from_name("Db").to_pitch(4)
+    assert p.name == "Db4"
+    assert Pitch(p.value).name == "C#4"
+
+    # The spelling of a (shared) pitch can't be changed
+    with pytest.raises(AttributeError):
+        Pitch(60)._class_name = "B#"  # type: ignore[misc]
+    with pytest.raises(AttributeError):
+        Pitch(60)._octave = 3  # type: ignore[misc]
+    assert Pitch(60).name == "C5"
+
+    # Nor their value
+    with pytest.raises(AttributeError):
+        Pitch(60).value = 61  # type: ignore[misc]
+    with pytest.raises(AttributeError):
+        PitchClass(0).value = 1  # type: ignore[misc]
+    assert Pitch(60).value == 60 and PitchClass(0).value == 0
+
+    # Notes aren't shared, so can be changed
+    n = Note(60)
+    n.value = 61
+    assert n.value == 61 and n.name == "C#5"
+    assert Note(60).value == 60
+
+    # Bad arguments aren't ignored
+    with pytest.raises(TypeError):
+        Pitch(60, 4)  # type: ignore[call-arg]
+
+
+@pytest.mark.parametrize(
+    "x",
+    [
+        PitchClass(1),
+        PitchClass.from_name("Db"),
+        Pitch(61),
+        Pitch.from_name("Cb4"),
+        Note(61, duration=Fraction("3/8")),
+        Note.from_abc("_d", key=C),
+    ],
+)
+def test_slots_and_pickle(x):
+    import pickle
+
+    assert not hasattr(x, "__dict__")
+
+    x2 = pickle.loads(pickle.dumps(x))
+    assert type(x2) is type(x)
+    if type(x) in {Pitch, PitchClass} and x.name == type(x)(x.value).name:
+        assert x2 is x
+    assert x2 == x
+    assert x2.name == x.name
+    if isinstance(x, Note):
+        assert x2.duration == x.duration
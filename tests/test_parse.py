@@ -1,6 +1,8 @@
 """
 Test ABC parsing
 """
+import pytest
+
 from pyabc2.parse import INFO_FIELDS, Tune
 
 # Norbeck version
@@ -63,6 +65,42 @@ def test_repeats_with_endings():
     assert " ".join(n.to_abc() for n in t.iter_notes()) == "G A A G a a B C B c"
 
 
+def test_escaped_percent_not_comment():
+    abc = r"""
+    T:?
+    L:1
+    K:G
+    AB|cd\%e| % comment f
+    """
+    t = Tune(abc)
+
+    assert " ".join(n.to_abc() for n in t.iter_notes()) == "A B c d e"
+
+
+@pytest.mark.parametrize("ending", ["|[1,3", "|1,3", "|[1-3"])
+def test_ending_list(ending):
+    abc = f"""
+    T:?
+    L:1
+    K:G
+    |: G {ending} A :|2 a ||
+    """
+    t = Tune(abc)
+
+    assert " ".join(n.to_abc() for n in t.iter_notes()) == "G A G a"
+
+
+def test_third_ending_unsupported():
+    abc = """
+    T:?
+    L:1
+    K:G
+    |: G |1 A :|2 B :|3 c ||
+    """
+    with pytest.raises(ValueError, match="3 or more endings"):
+        Tune(abc)
+
+
 def test_header_multiple_field_instances():
     abc = """
     T: hi
@@ -75,3 +113,239 @@ def test_header_multiple_field_instances():
 
     assert t.titles == ["hi", "hii"]
     assert t.header["notes"] == "note1"
+
+
+def test_tokenize():
+    from pyabc2.parse import tokenize
+
+    body = '|:"Am"~A2B [CE]|1 ^c/d :|2 (3abc z2 [M:3/4] % hi'
+    tokens = list(tokenize(body))
+
+    assert "".join(t.text for t in tokens) == body
+    assert [t.kind for t in tokens if t.kind != "space"] == [
+        "repeat",
+        "annotation",
+        "decoration",
+        "note",
+        "note",
+        "chord",
+        "bar",
+        "ending",
+        "note",
+        "note",
+        "repeat",
+        "ending",
+        "tuplet",
+        "note",
+        "note",
+        "note",
+        "rest",
+        "field",
+        "comment",
+    ]
+
+
+def test_chord_raises():
+    import pytest
+
+    abc = """
+    K:G
+    GAB | [GB]2 |
+    """
+    with pytest.raises(ValueError, match="chords currently not supported"):
+        _ = Tune(abc)
+
+
+def test_annotations_and_decorations_not_notes():
+    abc = """
+    K:G
+    "G"G !trill!A "^Fine"B |
+    """
+    t = Tune(abc)
+
+    assert " ".join(n.class_name for n in t.iter_notes()) == "G A B"
+
+
+def test_measure_continues_across_lines():
+    abc = """
+    K:G
+    G A
+    B | c
+    """
+    t = Tune(abc)
+
+    assert [[n.to_abc() for n in m] for m in t.measures] == [["G", "A", "B"], ["c"]]
+
+
+def test_lazy():
+    import pytest
+
+    abc = """
+    T:Lazy
+    R:reel
+    K:G
+    GAB | [GB]2 |
+    """
+    t = Tune(abc, lazy=True)
+    assert t.title == "Lazy"
+    assert t.type == "reel"
+
+    # Body parsing error deferred until first access
+    with pytest.raises(ValueError, match="chords currently not supported"):
+        _ = t.measures
+
+    t1 = Tune(abc_have_a_drink, lazy=True)
+    t2 = Tune(abc_have_a_drink)
+    assert t1.measures == t2.measures
+    assert list(t1.iter_notes()) == list(t2.iter_notes())
+
+
+def test_measures_read_only():
+    abc = """
+    L:1
+    K:G
+    G A | B c ||
+    """
+    t = Tune(abc)
+
+    with pytest.raises(TypeError):
+        t.measures[0] = []  # type: ignore[index]
+
+    # Changes to the created notes aren't kept
+    t.measures[0][0].value += 1
+    t.measures[0].append(t.measures[1][0])
+    assert [[n.to_abc() for n in m] for m in t.measures] == [["G", "A"], ["B", "c"]]
+
+    # Copy to modify
+    measures = list(t.measures)
+    measures[0][0].value += 1
+    assert measures[0][0].value == t.measures[0][0].value + 1
+
+
+def test_written_measures():
+    abc = """
+    L:1
+    K:G
+    G |1 A | A :|2 a | a ||
+    |: B |1 C :|2 c ||
+    """
+    t = Tune(abc)
+
+    def fmt(measures):
+        return " ".join("".join(n.to_abc() for n in m) for m in measures)
+
+    assert fmt(t.written_measures) == "G A A a a B C c"
+    assert fmt(t.measures) == "G A A G a a B C B c"
+    assert list(t.notes_array.play_order) == [0, 1, 2, 0, 3, 4, 5, 6, 5, 7]
+    assert len(t.notes_array) == 8
+
+
+def test_parts():
+    from pyabc2.parse import _expand_parts
+
+    assert _expand_parts("(AB)2C") == ["A", "B", "A", "B", "C"]
+    assert _expand_parts("A2.B") == ["A", "A", "B"]
+    assert _expand_parts("((AB)2C)2") == list("ABABCABABC")
+
+    abc = """
+    L:1
+    P:ABAC
+    K:G
+    P:A
+    G | A :|
+    P:B
+    B |
+    [P:C] c | d |]
+    """
+    t = Tune(abc)
+
+    assert " ".join(n.class_name for n in t.iter_notes()) == "G A G A B G A G A C D"
+    assert len(t.written_measures) == 5
+
+    # Without the header field, the parts are played as written
+    t2 = Tune(abc.replace("P:ABAC", ""))
+    assert " ".join(n.class_name for n in t2.iter_notes()) == "G A G A B C D"
+
+
+def test_pickle():
+    import pickle
+
+    t = Tune(abc_have_a_drink, ticks_per_whole=1920)
+    t.url = "https://example.com"
+    t.extra = 1
+
+    t2 = pickle.loads(pickle.dumps(t))
+    assert t2 == t
+    assert t2.header == t.header
+    assert t2.titles == t.titles
+    assert t2.key is t.key
+    assert t2.url == t.url
+    assert t2.extra == 1
+    assert t2.notes_array == t.notes_array
+    assert list(t2.notes_array.measure) == list(t.notes_array.measure)
+    assert t2.notes_array.ticks_per_whole == 1920
+
+    # Lazy: body parsed after unpickling
+    t3 = pickle.loads(pickle.dumps(Tune(abc_have_a_drink, lazy=True)))
+    assert t3._notes is None
+    assert t3.measures == t.measures
+
+
+def test_parse_pool():
+    from pyabc2 import ParsePool
+    from pyabc2.note import clear_note_cache, note_cache_info
+    from pyabc2.parse import _warm_caches
+
+    clear_note_cache()
+    _warm_caches()
+    assert note_cache_info().currsize > 0
+
+    with ParsePool(2) as pool:
+        assert pool._pool is None  # started on first use
+        assert list(pool.imap(abs, range(-5, 0), chunksize=2)) == [5, 4, 3, 2, 1]
+        mp_pool = pool._pool
+        assert sorted(pool.imap(abs, range(-5, 0), ordered=False)) == [1, 2, 3, 4, 5]
+        assert pool._pool is mp_pool  # reused
+
+    assert pool._pool is None
+
+
+def test_parse_many():
+    import concurrent.futures
+
+    import pytest
+
+    from pyabc2 import ParsePool
+    from pyabc2.parse import parse_many
+    from pyabc2.sources import examples
+
+    bad = "K:G\n[GB]2 A|"
+    abcs = list(examples.values()) * 3 + [bad, abc_have_a_drink]
+    expected = [Tune(abc).measures for abc in abcs if abc != bad]
+
+    def check(**kwargs):
+        res = list(parse_many(iter(abcs), on_error="return", chunksize=2, **kwargs))
+        assert len(res) == len(abcs)
+        assert isinstance(res[-2], ValueError)
+        assert [t.measures for t in res if isinstance(t, Tune)] == expected
+
+    check()
+    check(executor="thread", workers=2)
+    check(executor="process", workers=2)
+    check(executor="process", workers=2, shared_memory=True)
+    with ParsePool(2) as pool:
+        check(executor=pool)
+        check(executor=pool, shared_memory=True)
+    with concurrent.futures.ThreadPoolExecutor(2) as ex:
+        check(executor=ex)
+
+    assert len(list(parse_many(abcs, on_error="skip"))) == len(abcs) - 1
+    with pytest.raises(ValueError, match="chords"):
+        list(parse_many(abcs))
+
+    with pytest.raises(ValueError, match="invalid `on_error`"):
+        parse_many(abcs, on_error="ignore")
+    with pytest.raises(ValueError, match="invalid `executor`"):
+        parse_many(abcs, executor="asdf")
+    with pytest.raises(ValueError, match="requires a process executor"):
+        parse_many(abcs, executor="thread", shared_memory=True)
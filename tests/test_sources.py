@@ -1,3 +1,6 @@
+import io
+import json
+import os
 import re
 import warnings
 
@@ -147,6 +150,455 @@ def test_the_session_load_archive():
     assert tunes1 == tunes2
 
 
+@pytest.fixture
+def the_session_archive(tmp_path, monkeypatch):
+    """Small local stand-in for the The Session tunes archive."""
+    import json
+
+    from pyabc2.sources import load_example_abc
+
+    entries = []
+    for i, title in enumerate(examples, start=1):
+        body = load_example_abc(title).split("K:G\n", 1)[1]
+        for j in range(1, 4):
+            entries.append(
+                {
+                    "tune_id": str(i),
+                    "setting_id": str(10 * i + j),
+                    "name": title.title(),
+                    "type": "jig",
+                    "meter": "6/8",
+                    "mode": "Gmajor",
+                    "abc": body,
+                    "date": "2022-01-01 00:00:00",
+                    "username": "someone",
+                }
+            )
+    # One that fails to load (has a chord)
+    entries.append(dict(entries[0], tune_id="99", setting_id="999", abc="[GB]2 A|"))
+
+    monkeypatch.setattr(the_session, "SAVE_TO", tmp_path)
+    with open(tmp_path / "tunes.json", "w", encoding="utf-8") as f:
+        json.dump(entries, f)
+
+    return entries
+
+
+def test_the_session_load_local_archive(the_session_archive):
+    with pytest.warns(UserWarning, match=r"1 out of 7 The Session tune\(s\) failed to load"):
+        tunes = the_session.load()
+    assert len(tunes) == len(the_session_archive) - 1
+    assert tunes[0].url == "https://thesession.org/tunes/1#setting11"
+
+    tunes_lazy = the_session.load(lazy=True)
+    assert len(tunes_lazy) == len(the_session_archive)
+    assert [t.title for t in tunes_lazy[:-1]] == [t.title for t in tunes]
+    assert all(t._notes is None for t in tunes_lazy)
+    assert [t.measures for t in tunes_lazy[:-1]] == [t.measures for t in tunes]
+
+
+def test_the_session_load_cache(the_session_archive, monkeypatch):
+    import json
+
+    with pytest.warns(UserWarning, match="1 out of 7"):
+        tunes = the_session.load()
+    (fp_cache,) = the_session.SAVE_TO.glob("tunes.*.pkl")
+
+    # Warm load doesn't parse, but still warns about the failures
+    def fail(*args, **kwargs):
+        raise AssertionError("should be loaded from cache")
+
+    with monkeypatch.context() as m:
+        m.setattr(the_session, "_maybe_load_one", fail)
+        m.setattr(the_session, "parse_many", fail)
+        with pytest.warns(UserWarning, match="1 out of 7"):
+            tunes_cached = the_session.load()
+
+    assert tunes_cached == tunes
+    assert [t.url for t in tunes_cached] == [t.url for t in tunes]
+    assert [t.measures for t in tunes_cached] == [t.measures for t in tunes]
+
+    # Changed archive -> cache invalidated and replaced
+    with open(the_session.SAVE_TO / "tunes.json", "w", encoding="utf-8") as f:
+        json.dump(the_session_archive[:2], f)
+    tunes2 = the_session.load()
+    assert len(tunes2) == 2
+    (fp_cache2,) = the_session.SAVE_TO.glob("tunes.*.pkl")
+    assert fp_cache2 != fp_cache
+
+    # Opting out
+    fp_cache2.unlink()
+    the_session.load(cache=False)
+    assert not list(the_session.SAVE_TO.glob("tunes.*.pkl"))
+
+    # Only the entries needed are read, for the cache too
+    with open(the_session.SAVE_TO / "tunes.json", "a", encoding="utf-8") as f:
+        f.write("garbage")
+    assert len(the_session.load(n=1)) == 1
+    assert len(the_session.load(n=1)) == 1
+    with open(the_session.SAVE_TO / "tunes.json", "w", encoding="utf-8") as f:
+        json.dump(the_session_archive[:2], f)
+
+    # Caches for different settings are kept side by side
+    the_session.load()
+    the_session.load(n=1)
+    assert len(list(the_session.SAVE_TO.glob("tunes.*.pkl"))) == 2
+    with monkeypatch.context() as m:
+        m.setattr(the_session, "parse_many", fail)
+        assert len(the_session.load()) == 2
+        assert len(the_session.load(n=1)) == 1
+
+
+def test_the_session_load_incremental(the_session_archive, monkeypatch):
+    import json
+
+    with pytest.warns(UserWarning, match="1 out of 7"):
+        tunes = the_session.load()
+
+    # One setting changed, one added, one removed
+    entries = [dict(d) for d in the_session_archive[1:]]
+    entries[0]["abc"] = entries[0]["abc"].replace("|", "|\n", 1)
+    entries.insert(2, dict(entries[1], setting_id="77", name="New"))
+    with open(the_session.SAVE_TO / "tunes.json", "w", encoding="utf-8") as f:
+        json.dump(entries, f)
+
+    parsed = []
+    parse_many = the_session.parse_many
+
+    def parse_many_spy(abcs, **kwargs):
+        abcs = list(abcs)
+        parsed.extend(abcs)
+        return parse_many(abcs, **kwargs)
+
+    monkeypatch.setattr(the_session, "parse_many", parse_many_spy)
+    with pytest.warns(UserWarning, match="1 out of 7"):
+        tunes2 = the_session.load()
+
+    assert len(parsed) == 2
+    assert [t.url for t in tunes2] == [
+        the_session._archive_data_url(d) for d in entries if d["tune_id"] != "99"
+    ]
+    assert tunes2[2].title == "New"
+    assert tunes2[3] is not tunes[3]  # (unpickled)
+    assert tunes2[3] == tunes[3]
+    assert tunes2[0].abc != tunes[1].abc
+    assert len(list(the_session.SAVE_TO.glob("tunes.*.pkl"))) == 1
+
+    # Matches a full load
+    parsed.clear()
+    with pytest.warns(UserWarning, match="1 out of 7"):
+        tunes3 = the_session.load(cache=False)
+    assert len(parsed) == 7
+    assert [t.abc for t in tunes3] == [t.abc for t in tunes2]
+
+    # Different settings, so not updated from the cache
+    parsed.clear()
+    the_session.load(n=3, incremental=True)
+    assert len(parsed) == 3
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 2**16])
+def test_iter_json_array(chunk_size):
+    import io
+    import json
+
+    from pyabc2.sources.the_session import _iter_json_array
+
+    data = [{"a": "[1, 2]", "b": [1, {"c": None}]}, 2, "x,]", [], {}]
+    s = " \n" + json.dumps(data, indent=1) + "\n"
+    assert list(_iter_json_array(io.StringIO(s), chunk_size=chunk_size)) == data
+    assert list(_iter_json_array(io.StringIO("[]"), chunk_size=chunk_size)) == []
+
+    with pytest.raises(ValueError):
+        list(_iter_json_array(io.StringIO('{"a": 1}'), chunk_size=chunk_size))
+
+    with pytest.raises(ValueError):
+        list(_iter_json_array(io.StringIO(s[:-5]), chunk_size=chunk_size))
+
+
+def test_the_session_iter_tunes(the_session_archive):
+    import json
+
+    with pytest.warns(UserWarning, match="1 out of 7"):
+        tunes = list(the_session.iter_tunes())
+    with pytest.warns(UserWarning, match="1 out of 7"):
+        tunes_loaded = the_session.load(cache=False)
+    assert [t.url for t in tunes] == [t.url for t in tunes_loaded]
+
+    # Only the first `n` entries are read (the rest of the file here is invalid)
+    s = json.dumps(the_session_archive)
+    with open(the_session.SAVE_TO / "tunes.json", "w", encoding="utf-8") as f:
+        f.write(s[: len(s) // 2])
+    assert [t.url for t in the_session.iter_tunes(n=2)] == [t.url for t in tunes[:2]]
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+@pytest.mark.parametrize("chunksize", [1, 3, 100])
+def test_imap_chunked(ordered, chunksize):
+    import multiprocessing
+
+    from pyabc2._util import imap_chunked
+
+    consumed = []
+
+    def gen():
+        for i in range(-10, 10):
+            consumed.append(i)
+            yield i
+
+    with multiprocessing.Pool(2) as pool:
+        it = imap_chunked(pool, abs, gen(), chunksize=chunksize, ordered=ordered, max_in_flight=2)
+
+        # Input consumed lazily
+        first = next(it)
+        assert len(consumed) <= 2 * chunksize
+
+        res = [first] + list(it)
+        if ordered:
+            assert res == [abs(i) for i in range(-10, 10)]
+        else:
+            assert sorted(res) == sorted(abs(i) for i in range(-10, 10))
+
+        with pytest.raises(ValueError, match="invalid literal"):
+            list(imap_chunked(pool, int, ["1", "x"], chunksize=chunksize, ordered=ordered))
+
+
+def test_the_session_iter_tunes_parallel(the_session_archive):
+    with pytest.warns(UserWarning, match="1 out of 7"):
+        tunes = list(the_session.iter_tunes())
+    with pytest.warns(UserWarning, match="1 out of 7"):
+        tunes_p = list(the_session.iter_tunes(num_workers=2, chunksize=2))
+    with pytest.warns(UserWarning, match="1 out of 7"):
+        tunes_pu = list(the_session.iter_tunes(num_workers=2, chunksize=1, ordered=False))
+
+    assert [t.url for t in tunes_p] == [t.url for t in tunes]
+    assert sorted(t.url for t in tunes_pu) == sorted(t.url for t in tunes)
+    assert [t.measures for t in tunes_p] == [t.measures for t in tunes]
+
+
+@pytest.mark.parametrize(
+    "abc,kwargs,expected",
+    [
+        ("T:Caf\\'e", {}, "T:Cafe\u0301"),
+        ("T:Caf\\'{e}", dict(normalize=True), "T:Caf\u00e9"),
+        ('T:Gr\\"un \\`a', dict(ascii_only=True), "T:Grun a"),
+        ("T:{\\aa}sen \\o", {}, "T:a\u030asen \u00f8"),
+        ("T:{\\aa}sen", dict(normalize=True), "T:\u00e5sen"),
+    ],
+)
+def test_norbeck_diacritics(abc, kwargs, expected):
+    assert norbeck._replace_escaped_diacritics(abc, **kwargs) == expected
+
+    # Whole file at once
+    blocks = [f"X:{x}\n{abc}" for x in range(1, 4)]
+    assert norbeck._try_abcs(blocks, **kwargs) == [f"X:{x}\n{expected}" for x in range(1, 4)]
+
+
+def test_norbeck_diacritics_unknown():
+    with pytest.raises(ValueError, match=r"escape code `\\q` not recognized"):
+        norbeck._replace_escaped_diacritics("T:\\qa")
+
+    res = norbeck._try_abcs(["X:1\nT:\\qa", "X:2\nT:\\'a"])
+    assert isinstance(res[0], ValueError)
+    assert res[1] == "X:2\nT:a\u0301"
+
+
+@pytest.fixture
+def norbeck_archive(tmp_path, monkeypatch):
+    """Small local stand-in for the Norbeck archive files."""
+    from pyabc2.sources import load_example_abc
+
+    abcs = [load_example_abc(title) for title in examples]
+    jigs = "\n".join(
+        f"X:{x}\nT:Caf\\'e {x}\nR:jig\n" + abc.split("R:slip jig\n")[-1].split("R:jig\n")[-1]
+        for x, abc in enumerate(abcs * 3, start=1)
+    )
+    reels = "X:1\nT:Bad\nR:reel\nK:G\n[GB]2 A|\n\nX:2\nT:Good\nR:reel\nK:G\nGAB|\n"
+    (tmp_path / "hnj1.abc").write_text(jigs)
+    (tmp_path / "hnr1.abc").write_text(reels)
+
+    monkeypatch.setattr(norbeck, "SAVE_TO", tmp_path)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [dict(num_workers=2, chunksize=2), dict(num_workers=2, chunksize=4, shared_memory=True)],
+)
+def test_norbeck_load_parallel_local(norbeck_archive, kwargs):
+    with pytest.warns(UserWarning, match="1 out of 2 Norbeck tune"):
+        tunes = norbeck.load()
+    assert len(tunes) == 7
+    assert tunes[0].title == "Cafe\u0301 1"
+
+    with pytest.warns(UserWarning, match="1 out of 2 Norbeck tune"):
+        tunes_p = norbeck.load(cache=False, **kwargs)
+
+    assert [t.url for t in tunes_p] == [t.url for t in tunes]
+    assert [t.title for t in tunes_p] == [t.title for t in tunes]
+    assert [t.measures for t in tunes_p] == [t.measures for t in tunes]
+
+
+def test_norbeck_load_index_cache(norbeck_archive, tmp_path):
+    with pytest.warns(UserWarning, match="1 out of 2 Norbeck tune"):
+        tunes = norbeck.load()
+    assert len(tunes) == 7
+
+    index = json.loads((tmp_path / "index.json").read_text())
+    assert [norbeck._ref(b) for b in index["tunes"]["jigs"]["hnj1.abc"]] == [
+        str(x) for x in range(1, 7)
+    ]
+    assert index["tunes"]["reels"]["hnr1.abc"][1].startswith("X:2\nT:Good")
+    assert len(list(tmp_path.glob("tunes.*.pkl"))) == 2
+
+    # Warm: from the per-type caches (index not needed), still warning about the failures
+    (tmp_path / "index.json").write_text("not read")
+    with pytest.warns(UserWarning, match="1 out of 2 Norbeck tune"):
+        tunes_c = norbeck.load()
+    assert (tmp_path / "index.json").read_text() == "not read"
+    assert tunes_c == tunes
+    assert [t.url for t in tunes_c] == [t.url for t in tunes]
+    assert norbeck.load("jigs") == tunes[:6]
+
+    # Different settings, different cache
+    jigs_ascii = norbeck.load("jigs", ascii_only=True)
+    assert jigs_ascii[0].title == "Cafe 1"
+    assert len(list(tmp_path.glob("tunes.hnj.*.pkl"))) == 1
+
+    # Changed file, index and cache rebuilt
+    fp = tmp_path / "hnr1.abc"
+    fp.write_text(fp.read_text().replace("T:Good", "T:Better"))
+    with pytest.warns(UserWarning, match="1 out of 2 Norbeck tune"):
+        reels = norbeck.load("reels")
+    assert [t.title for t in reels] == ["Better"]
+    index = json.loads((tmp_path / "index.json").read_text())
+    assert index["tunes"]["reels"]["hnr1.abc"][1].startswith("X:2\nT:Better")
+
+    # Repeated reference number within a file, all kept
+    fp.write_text(fp.read_text() + "\nX:2\nT:Again\nR:reel\nK:G\nGAB|\n")
+    with pytest.warns(UserWarning, match="1 out of 3 Norbeck tune"):
+        reels = norbeck.load("reels")
+    assert [t.title for t in reels] == ["Better", "Again"]
+
+
+def test_the_session_load_select(the_session_archive, tmp_path):
+    tunes = the_session.load(tune_id=range(2, 10))
+    assert [t.url for t in tunes] == [
+        f"https://thesession.org/tunes/2#setting{i}" for i in [21, 22, 23]
+    ]
+    assert not list(tmp_path.glob("tunes.*.pkl"))
+
+    assert len(the_session.load(name="^tell", type="JIG", meter=["6/8", "9/8"])) == 3
+    assert len(the_session.load(key="G", n=2)) == 2
+    assert the_session.load(key=["D", "Ador"]) == []
+    assert list(the_session.iter_tunes(type="reel")) == []
+
+    with pytest.warns(UserWarning, match="1 out of 1"):
+        assert the_session.load(tune_id=[99]) == []
+
+    all_urls = [the_session._archive_data_url(d) for d in the_session_archive]
+    for seed in range(5):
+        urls = [t.url for t in the_session.load(tune_id=range(1, 3), sample=4, seed=seed)]
+        assert len(urls) == 4
+        assert urls == [url for url in all_urls if url in urls]  # archive order
+        assert [t.url for t in the_session.load(tune_id=range(1, 3), sample=4, seed=seed)] == urls
+
+
+def test_norbeck_load_select(norbeck_archive, tmp_path):
+    tunes = norbeck.load(ref=range(2, 3))
+    assert [t.title for t in tunes] == ["Cafe\u0301 2", "Good"]
+    assert not list(tmp_path.glob("tunes.*.pkl"))
+
+    assert [t.title for t in norbeck.load("jigs", name="E\u0301 [12]$")] == [
+        "Cafe\u0301 1",
+        "Cafe\u0301 2",
+    ]
+    assert [t.title for t in norbeck.load(name="^cafe 3", ascii_only=True)] == ["Cafe 3"]
+    assert len(norbeck.load(meter="9/8")) == 3
+    assert [t.title for t in norbeck.load(key="G", meter="6/8", ref=[1, 2, 3])] == ["Cafe\u0301 2"]
+    assert norbeck.load("reels", key="D") == []
+
+    sample = norbeck.load("jigs", sample=3, seed=1)
+    assert len(sample) == 3
+    assert norbeck.load("jigs", sample=3, seed=1) == sample
+
+
+def test_loaders_with_parse_pool(the_session_archive, norbeck_archive):
+    from pyabc2 import ParsePool
+
+    with pytest.warns(UserWarning, match="1 out of 7"):
+        tunes = the_session.load(cache=False)
+    with pytest.warns(UserWarning, match="1 out of 2 Norbeck tune"):
+        tunes_n = norbeck.load()
+
+    with ParsePool(2) as pool:
+        for shared_memory in [False, True]:
+            with pytest.warns(UserWarning, match="1 out of 7"):
+                tunes_p = the_session.load(pool=pool, cache=False, shared_memory=shared_memory)
+            assert [t.measures for t in tunes_p] == [t.measures for t in tunes]
+
+            with pytest.warns(UserWarning, match="1 out of 2 Norbeck tune"):
+                tunes_np = norbeck.load(pool=pool, cache=False, shared_memory=shared_memory)
+            assert [t.measures for t in tunes_np] == [t.measures for t in tunes_n]
+
+
+def test_the_session_load_shared_memory(the_session_archive):
+    np = pytest.importorskip("numpy")
+
+    with pytest.warns(UserWarning, match="1 out of 7"):
+        tunes = the_session.load(cache=False)
+    with pytest.warns(UserWarning, match="1 out of 7"):
+        tunes_shm = the_session.load(num_workers=2, chunksize=2, shared_memory=True)
+
+    assert [t.url for t in tunes_shm] == [t.url for t in tunes]
+    assert [t.measures for t in tunes_shm] == [t.measures for t in tunes]
+    assert [t.notes_array for t in tunes_shm] == [t.notes_array for t in tunes]
+
+    # Zero-copy, read-only views
+    na = tunes_shm[0].notes_array
+    assert isinstance(na.value, memoryview)
+    d = na.to_numpy()
+    assert not d["value"].flags.writeable
+    assert np.array_equal(d["value"], tunes[0].notes_array.to_numpy()["value"])
+
+    # Loaded from the cache written by the shared-memory load
+    with pytest.warns(UserWarning, match="1 out of 7"):
+        tunes_cached = the_session.load(num_workers=2, shared_memory=True)
+    assert [t.measures for t in tunes_cached] == [t.measures for t in tunes]
+
+    with pytest.raises(ValueError, match="can't be used with `lazy`"):
+        the_session.load(num_workers=2, shared_memory=True, lazy=True, cache=False)
+
+
+@pytest.mark.skipif(not os.path.isdir("/proc/self/fd"), reason="needs /proc/self/fd")
+@pytest.mark.parametrize("take_mapping", [True, False])
+def test_parse_shared_fds_released(take_mapping, monkeypatch):
+    import gc
+
+    from pyabc2.parse import ParsePool
+    from pyabc2.sources import _shm
+    from pyabc2.sources._shm import parse_shared
+
+    if not take_mapping:
+        # Public API only (data copied)
+        monkeypatch.setattr(_shm, "_take_mapping", lambda shm: None)
+
+    abcs = [load_example_abc(title) for title in examples] * 10
+
+    n_fds = []
+    with ParsePool(2) as pool:
+        for _ in range(2):
+            tunes = list(parse_shared(abcs, chunksize=2, pool=pool))
+            assert len(tunes) == len(abcs)
+            assert [t.measures for t in tunes[: len(examples)]] == [
+                Tune(abc).measures for abc in abcs[: len(examples)]
+            ]
+            del tunes
+            gc.collect()
+            n_fds.append(len(os.listdir("/proc/self/fd")))
+
+    assert n_fds[1] == n_fds[0]
+
+
 def test_the_session_download_invalid():
     with pytest.raises(ValueError):
         _ = the_session.download("asdf")
@@ -187,6 +639,88 @@ def test_the_session_load_meta(which):
         # in df3, `pd.Float64Dtype()`
 
 
+def test_the_session_load_meta_local(http_server, tmp_path, monkeypatch):
+    import numpy as np
+    import pandas as pd
+
+    monkeypatch.setattr(the_session, "SAVE_TO", tmp_path)
+    monkeypatch.setattr(the_session, "_ARCHIVE_BASE_URL", http_server.url + "/json/")
+    sets = [
+        {
+            "tuneset": "1",
+            "date": "2020-01-01 00:00:00",
+            "tune_id": str(i),
+            "type": "reel",
+            "meter": "4/4",
+            "mode": "Gmajor",
+            "name": "",
+        }
+        for i in [5, 3000]
+    ]
+    http_server.files["/json/sets.json"] = json.dumps(sets).encode()
+    http_server.files["/csv/sets.csv"] = pd.DataFrame(sets).to_csv(index=False).encode()
+    events = [
+        {
+            "event": "a",
+            "dtstart": "2020-01-01 19:00:00",
+            "dtend": "2020-01-01 23:00:00",
+            "latitude": "",
+            "longitude": "1.5",
+        }
+    ]
+    http_server.files["/json/events.json"] = json.dumps(events).encode()
+    http_server.files["/csv/events.csv"] = pd.DataFrame(events).to_csv(index=False).encode()
+
+    df = df_all = the_session.load_meta("sets")
+    assert df.tune_id.tolist() == [5, 3000]
+    assert df.date.dtype.kind == "M"
+    pd.testing.assert_frame_equal(df, pd.read_json(io.StringIO(json.dumps(sets))))
+    assert (tmp_path / "sets.json").is_file()
+    assert len(http_server.requests) == 1
+
+    # Local copy used, and only the requested columns loaded
+    for format in ["json", "csv"]:
+        df = the_session.load_meta(
+            "sets", format=format, columns=["tune_id", "tuneset"], downcast_ints=True
+        )
+        assert df.columns.tolist() == ["tune_id", "tuneset"]
+        assert df.dtypes.tolist() == [np.uint16, np.uint8]
+    assert len(http_server.requests) == 2
+
+    cols = ["name", "date", "tune_id"]
+    pd.testing.assert_frame_equal(the_session.load_meta("sets", columns=cols), df_all[cols])
+
+    for format in ["json", "csv"]:
+        df = the_session.load_meta("sets", format=format, columns=["type"], convert_dtypes=True)
+        assert isinstance(df.type.dtype, pd.CategoricalDtype)
+        assert df.type.cat.categories.tolist() == ["reel"]
+
+    for format in ["json", "csv"]:
+        df = the_session.load_meta("events", format=format)
+        assert df.latitude.dtype == df.longitude.dtype == np.float64
+        assert df.latitude.isna().all()
+        assert df.dtstart.dtype.kind == "M"
+
+    with pytest.raises(ValueError):
+        the_session.load_meta("sets", columns=["asdf"])
+
+    with pytest.raises(ValueError):
+        the_session.load_meta("sets", store="hdf")
+
+    # Columnar copy, of the loaded columns only
+    pytest.importorskip("pyarrow")
+    df = the_session.load_meta("sets", store="parquet", columns=["date", "type"])
+    pd.testing.assert_frame_equal(df, df_all[["date", "type"]])
+    (d,) = tmp_path.glob("sets.json.*.parquet")
+    assert sorted(fp.name for fp in d.iterdir()) == ["date.parquet", "type.parquet"]
+    df = the_session.load_meta("sets", store="parquet")
+    pd.testing.assert_frame_equal(df, df_all)
+    assert len(list(d.iterdir())) == len(df_all.columns)
+    df = the_session.load_meta("sets", store="feather", columns=["tune_id"], downcast_ints=True)
+    assert df.tune_id.dtype == np.uint16
+    assert list(tmp_path.glob("sets.json.*.parquet")) == [d]
+
+
 def test_the_session_load_meta_invalid():
     with pytest.raises(ValueError):
         _ = the_session.load_meta("asdf")
@@ -249,3 +783,549 @@ def test_load_url_norbeck():
 def test_load_url_invalid_domain():
     with pytest.raises(NotImplementedError):
         _ = load_url("https://www.google.com")
+
+
+@pytest.fixture
+def http_server():
+    """Local HTTP server for files set in ``server.files``,
+    supporting ETag validation and range requests,
+    redirects set in ``server.redirects``,
+    other statuses (with a short body) set in ``server.statuses``,
+    chunked responses (``server.chunked``),
+    bodies cut short after ``server.truncate`` bytes,
+    responding after ``server.delays[path]`` seconds,
+    and closing the connection without a response for the paths in ``server.dropped``,
+    and recording the request headers in ``server.requests``."""
+    import hashlib
+    import threading
+    import time
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            server.requests.append((self.path, dict(self.headers)))
+            time.sleep(server.delays.get(self.path, 0))
+            if self.path in server.dropped:
+                return
+
+            status = server.statuses.get(self.path)
+            if status is not None:
+                self.send_response(status)
+                self.send_header("Content-Length", "4")
+                self.end_headers()
+                self.wfile.write(b"oops")
+                return
+
+            location = server.redirects.get(self.path)
+            if location is not None:
+                self.send_response(302)
+                self.send_header("Location", location)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return
+
+            data = server.files.get(self.path)
+            if data is None:
+                self.send_error(404)
+                return
+
+            etag = f'"{hashlib.md5(data).hexdigest()}"'
+            if self.headers.get("If-None-Match") == etag:
+                self.send_response(304)
+                self.end_headers()
+                return
+
+            start = 0
+            rng = self.headers.get("Range")
+            if rng is not None and self.headers.get("If-Range") == etag:
+                start = int(rng.split("=")[1].rstrip("-"))
+                if start >= len(data):
+                    self.send_response(416)
+                    self.send_header("Content-Range", f"bytes */{len(data)}")
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+                self.send_response(206)
+                self.send_header("Content-Range", f"bytes {start}-{len(data) - 1}/{len(data)}")
+            elif server.chunked:
+                self.protocol_version = "HTTP/1.1"
+                self.send_response(200)
+                self.send_header("Transfer-Encoding", "chunked")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                for i in range(0, len(data), 1000):
+                    chunk = data[i : i + 1000]
+                    self.wfile.write(f"{len(chunk):x}\r\n".encode() + chunk + b"\r\n")
+                self.wfile.write(b"0\r\n\r\n")
+                self.close_connection = True
+                return
+            else:
+                self.send_response(200)
+            self.send_header("ETag", etag)
+            self.send_header("Content-Length", str(len(data) - start))
+            self.end_headers()
+            self.wfile.write(data[start:][: server.truncate])
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.files = {}
+    server.redirects = {}
+    server.statuses = {}
+    server.chunked = False
+    server.truncate = None
+    server.delays = {}
+    server.dropped = set()
+    server.requests = []
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    yield server
+
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_download(http_server, tmp_path):
+    from pyabc2.sources import _http
+
+    data = bytes(range(256)) * 10_000
+    http_server.files["/a.json"] = data
+    url = http_server.url + "/a.json"
+    fp = tmp_path / "a.json"
+
+    assert _http.download(url, fp) is True
+    assert fp.read_bytes() == data
+    assert not (tmp_path / "a.json.part").exists()
+    info = _http._read_meta(tmp_path)["a.json"]
+    assert info["complete"] and info["url"] == url and info["etag"]
+
+    # Unchanged, one conditional request
+    assert _http.download(url, fp) is False
+    assert http_server.requests[-1][1]["If-None-Match"] == info["etag"]
+    assert len(http_server.requests) == 2
+
+    # Changed
+    data = data[::-1]
+    http_server.files["/a.json"] = data
+    assert _http.download(url, fp) is True
+    assert fp.read_bytes() == data
+
+    # Interrupted, resumed
+    info = _http._read_meta(tmp_path)["a.json"]
+    _http._update_meta(tmp_path, "a.json", dict(info, complete=False))
+    (tmp_path / "a.json.part").write_bytes(data[:1000])
+    fp.unlink()
+    assert _http.download(url, fp) is True
+    assert http_server.requests[-1][1]["Range"] == "bytes=1000-"
+    assert fp.read_bytes() == data
+
+    # Interrupted after the last byte, finished without transferring
+    (tmp_path / "a.json.part").write_bytes(data)
+    _http._update_meta(tmp_path, "a.json", {**info, "complete": False})
+    assert _http.download(url, fp) is True
+    assert http_server.requests[-1][1]["Range"] == f"bytes={len(data)}-"
+    assert fp.read_bytes() == data
+    assert not (tmp_path / "a.json.part").exists()
+    assert _http._read_meta(tmp_path)["a.json"]["complete"]
+
+    # Range not satisfiable (bad .part file), restarted
+    (tmp_path / "a.json.part").write_bytes(data + b"extra")
+    _http._update_meta(tmp_path, "a.json", {**info, "complete": False})
+    n = len(http_server.requests)
+    assert _http.download(url, fp) is True
+    assert fp.read_bytes() == data
+    assert "Range" not in http_server.requests[-1][1]
+    assert len(http_server.requests) == n + 2
+
+    # Interrupted, but changed since, so restarted
+    _http._update_meta(tmp_path, "a.json", dict(info, complete=False))
+    (tmp_path / "a.json.part").write_bytes(data[:1000])
+    http_server.files["/a.json"] = data = b"new"
+    assert _http.download(url, fp) is True
+    assert fp.read_bytes() == b"new"
+
+    with pytest.raises(Exception, match="404"):
+        _http.download(http_server.url + "/b.json", tmp_path / "b.json")
+
+
+def test_the_session_download_local(http_server, tmp_path, monkeypatch):
+    monkeypatch.setattr(the_session, "SAVE_TO", tmp_path)
+    monkeypatch.setattr(the_session, "_ARCHIVE_BASE_URL", http_server.url + "/json/")
+    http_server.files["/json/tunes.json"] = b"[]"
+    http_server.files["/json/sets.json"] = b"[{}]"
+
+    the_session.download(["tunes", "sets"])
+    assert (tmp_path / "tunes.json").read_bytes() == b"[]"
+    assert (tmp_path / "sets.json").read_bytes() == b"[{}]"
+
+    the_session.download(["tunes", "sets"])
+    assert len(http_server.requests) == 4
+    assert all("If-None-Match" in headers for _, headers in http_server.requests[2:])
+
+    with pytest.raises(ValueError):
+        the_session.download("asdf")
+
+
+def test_norbeck_download_local(http_server, tmp_path, monkeypatch):
+    import io
+    import zipfile
+
+    monkeypatch.setattr(norbeck, "SAVE_TO", tmp_path)
+    monkeypatch.setattr(norbeck, "_ZIP_URL", http_server.url + "/abc/hn.zip")
+    buf = io.BytesIO()
+    with zipfile.ZipFile(buf, "w") as z:
+        z.writestr("i/hnj1.abc", "X:1\nT:A\nR:jig\nK:G\nGAB|\n")
+        z.writestr("o/hnx1.abc", "X:1\nT:Other\nK:G\nGAB|\n")
+    http_server.files["/abc/hn.zip"] = buf.getvalue()
+
+    norbeck.download()
+    fp = tmp_path / "hnj1.abc"
+    assert fp.read_text().startswith("X:1\nT:A")
+    assert sorted(p.name for p in tmp_path.glob("*.abc")) == ["hnj1.abc"]
+
+    # Unchanged, not re-extracted
+    fp.write_text("X:1\nT:B\nR:jig\nK:G\nGAB|\n")
+    norbeck.download()
+    assert fp.read_text().startswith("X:1\nT:B")
+    assert len(http_server.requests) == 2
+    assert [t.title for t in norbeck.load("jigs")] == ["B"]
+
+
+def _url_responses():
+    """Canned The Session API and Norbeck responses, by URL."""
+    body = load_example_abc("tell her i am").split("K:G\n", 1)[1].replace("\n", "! ")
+    api = {
+        "id": 156,
+        "name": "Tell Her I Am",
+        "type": "jig",
+        "settings": [{"id": 1000 + i, "key": "Gmajor", "abc": body} for i in range(3)],
+    }
+    norbeck_html = (
+        '<div id="abc" class="monospace">X:106<br/>\n'
+        + load_example_abc("for the love of music").replace("\n", "<br/>\n")
+        + "</div>"
+    )
+    responses = {
+        "https://thesession.org/tunes/156?format=json": json.dumps(api),
+        "https://norbeck.nu/abc/display.asp?rhythm=slip+jig&ref=106": norbeck_html,
+    }
+
+    return responses
+
+
+@pytest.fixture
+def url_session(tmp_path, monkeypatch):
+    """Session serving canned The Session API and Norbeck responses in-process,
+    recording the requested URLs in ``session.calls``, with the response cache in `tmp_path`."""
+    import threading
+
+    import requests
+    from requests.adapters import BaseAdapter
+
+    monkeypatch.setattr(the_session, "SAVE_TO", tmp_path / "the-session")
+    monkeypatch.setattr(norbeck, "SAVE_TO", tmp_path / "norbeck")
+
+    responses = _url_responses()
+
+    class Adapter(BaseAdapter):
+        def send(self, request, **kwargs):
+            with lock:
+                session.calls.append(request.url)
+            r = requests.Response()
+            r.request = request
+            r.url = request.url
+            r.encoding = "utf-8"
+            text = responses.get(request.url)
+            if text is None:
+                r.status_code = 404
+                r._content = b""
+            else:
+                r.status_code = 200
+                r._content = text.encode()
+            return r
+
+        def close(self):
+            pass
+
+    lock = threading.Lock()
+    session = requests.Session()
+    session.mount("https://", Adapter())
+    session.calls = []
+
+    yield session
+
+    session.close()
+
+
+def test_load_url_cache(url_session, tmp_path):
+    url = "https://thesession.org/tunes/156#setting1001"
+    tune = the_session.load_url(url, session=url_session, cache_ttl=3600)
+    assert tune.title == "Tell Her I Am"
+    assert tune.url == url
+    assert tune.header["reference number"] == "2"
+    assert len(list((tmp_path / "the-session" / "_http-cache").glob("*.json"))) == 1
+
+    # From the cache
+    url_2 = url.replace("1001", "1002")
+    assert load_url(url_2, session=url_session, cache_ttl=3600).url.endswith("1002")
+    assert len(url_session.calls) == 1
+
+    # Not cached by default
+    assert the_session.load_url(url, session=url_session, cache_ttl=0).url == url
+    assert the_session.load_url(url, session=url_session).url == url
+    assert len(url_session.calls) == 3
+
+    tunes = the_session.load_url_all_settings(url, session=url_session, cache_ttl=3600)
+    assert [t.url for t in tunes] == [
+        f"https://thesession.org/tunes/156#setting{1000 + i}" for i in range(3)
+    ]
+    assert len(url_session.calls) == 3
+
+    url_n = "https://norbeck.nu/abc/display.asp?rhythm=slip+jig&ref=106"
+    assert load_url(url_n, session=url_session, cache_ttl=3600).title == "For The Love Of Music"
+    assert load_url(url_n, session=url_session, cache_ttl=3600).title == "For The Love Of Music"
+    assert len(url_session.calls) == 4
+    assert len(list((tmp_path / "norbeck" / "_http-cache").glob("*.json"))) == 1
+
+
+def test_load_urls(url_session):
+    from pyabc2.sources import load_urls
+
+    urls = [f"https://thesession.org/tunes/156#setting{1000 + i}" for i in [2, 0, 1, 0]]
+    urls.append("https://norbeck.nu/abc/display.asp?rhythm=slip+jig&ref=106")
+    tunes = load_urls(urls, concurrency=4, session=url_session, cache_ttl=3600)
+    assert [t.url for t in tunes[:4]] == urls[:4]
+    assert tunes[1] is tunes[3]
+    assert tunes[4].title == "For The Love Of Music"
+    assert sorted(set(url_session.calls)) == sorted(url_session.calls)  # one request each
+
+    bad = "https://thesession.org/tunes/157"
+    with pytest.raises(Exception, match="404"):
+        load_urls([bad, *urls], session=url_session)
+
+    res = load_urls([bad, urls[0]], session=url_session, on_error="return")
+    assert isinstance(res[0], Exception)
+    assert res[1].url == urls[0]
+
+    with pytest.raises(ValueError):
+        load_urls(urls, on_error="skip")
+
+
+@pytest.fixture
+def aio_server(http_server, tmp_path, monkeypatch):
+    """`http_server` serving the canned The Session API and Norbeck responses,
+    with the URL loaders pointed at it, and the response cache in `tmp_path`."""
+    monkeypatch.setattr(the_session, "SAVE_TO", tmp_path / "the-session")
+    monkeypatch.setattr(norbeck, "SAVE_TO", tmp_path / "norbeck")
+
+    for url, text in _url_responses().items():
+        http_server.files[url.replace("https://", "/")] = text.encode()
+
+    def local(url):
+        return url.replace("https://", http_server.url + "/")
+
+    api_query, page_url = the_session._api_query, norbeck._page_url
+    monkeypatch.setattr(
+        the_session, "_api_query", lambda url: (local(api_query(url)[0]), api_query(url)[1])
+    )
+    monkeypatch.setattr(norbeck, "_page_url", lambda url: local(page_url(url)))
+
+    return http_server
+
+
+def test_aio_load_urls(aio_server):
+    import asyncio
+
+    from pyabc2.sources import aio
+
+    urls = [f"https://thesession.org/tunes/156#setting{1000 + i}" for i in [2, 0, 1, 0]]
+    urls.append("https://norbeck.nu/abc/display.asp?rhythm=slip+jig&ref=106")
+
+    tune = asyncio.run(aio.load_url(urls[0], cache_ttl=3600))
+    assert tune.title == "Tell Her I Am"
+    assert tune.url == urls[0]
+    assert len(aio_server.requests) == 1
+
+    # Settings of the same tune share one request (in flight, not cached)
+    tunes = asyncio.run(aio.load_urls(urls, concurrency=4))
+    assert [t.url for t in tunes[:4]] == urls[:4]
+    assert tunes[1] is tunes[3]
+    assert tunes[4].title == "For The Love Of Music"
+    assert len(aio_server.requests) == 3
+
+    # From the (shared) cache
+    assert load_url(urls[1], cache_ttl=3600).url == urls[1]
+    assert asyncio.run(aio.load_urls(urls, cache_ttl=3600)) is not None
+    assert len(aio_server.requests) == 4
+
+    bad = "https://thesession.org/tunes/157"
+    with pytest.raises(aio.HTTPError, match="404"):
+        asyncio.run(aio.load_urls([bad, *urls]))
+
+    res = asyncio.run(aio.load_urls([bad, urls[0]], on_error="return"))
+    assert isinstance(res[0], aio.HTTPError) and res[0].status == 404
+    assert res[1].url == urls[0]
+
+    with pytest.raises(NotImplementedError):
+        asyncio.run(aio.load_url("https://www.google.com"))
+
+    with pytest.raises(ValueError):
+        asyncio.run(aio.load_urls(urls, on_error="skip"))
+
+
+def test_aio_load_urls_error_while_pending(aio_server):
+    import asyncio
+
+    from pyabc2.sources import aio
+
+    slow = "https://norbeck.nu/abc/display.asp?rhythm=slip+jig&ref=106"
+    aio_server.delays[norbeck._page_url(slow)[len(aio_server.url) :]] = 0.5
+    bad = "https://thesession.org/tunes/157"
+
+    with pytest.raises(aio.HTTPError, match="404"):
+        asyncio.run(aio.load_urls([slow, bad]))
+
+
+@pytest.mark.parametrize("status", [199, 300, 302])
+def test_aio_unexpected_status(http_server, tmp_path, status):
+    import asyncio
+
+    from pyabc2.sources import aio
+
+    http_server.statuses["/a.json"] = status
+    url = http_server.url + "/a.json"
+
+    with pytest.raises(aio.HTTPError, match=str(status)):
+        asyncio.run(aio.download(url, tmp_path / "a.json"))
+    assert not (tmp_path / "a.json").exists()
+
+    with pytest.raises(aio.HTTPError, match=str(status)):
+        asyncio.run(aio.get_text(url))
+
+
+def test_aio_proxy_warning(http_server, monkeypatch):
+    import asyncio
+
+    from pyabc2.sources import aio
+
+    http_server.files["/a.txt"] = b"a"
+    url = http_server.url + "/a.txt"
+    monkeypatch.setenv("HTTP_PROXY", "http://proxy.invalid:3128")
+    monkeypatch.delenv("NO_PROXY", raising=False)
+    monkeypatch.delenv("no_proxy", raising=False)
+
+    with pytest.warns(UserWarning, match="HTTP_PROXY"):
+        assert asyncio.run(aio.get_text(url)) == "a"
+
+    monkeypatch.setenv("NO_PROXY", "127.0.0.1")
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert asyncio.run(aio.get_text(url)) == "a"
+
+
+def test_aio_download(http_server, tmp_path):
+    import asyncio
+
+    from pyabc2.sources import _http, aio
+
+    data = bytes(range(256)) * 10_000
+    http_server.files["/a.json"] = data
+    http_server.files["/b.json"] = b"b"
+    http_server.redirects["/c.json"] = "/b.json"
+    items = [(http_server.url + f"/{name}.json", tmp_path / f"{name}.json") for name in "abc"]
+
+    assert asyncio.run(aio.download_many(items)) == [True, True, True]
+    assert [fp.read_bytes() for _, fp in items] == [data, b"b", b"b"]
+    assert _http._read_meta(tmp_path)["a.json"]["complete"]
+
+    # Unchanged (also for the blocking download)
+    assert asyncio.run(aio.download(*items[0])) is False
+    assert _http.download(*items[0]) is False
+
+    # Resumed
+    (tmp_path / "a.json.part").write_bytes(data[:1000])
+    info = _http._read_meta(tmp_path)["a.json"]
+    _http._update_meta(tmp_path, "a.json", {**info, "complete": False})
+    assert asyncio.run(aio.download(*items[0])) is True
+    assert http_server.requests[-1][1]["Range"] == "bytes=1000-"
+    assert (tmp_path / "a.json").read_bytes() == data
+
+    # Chunked
+    http_server.chunked = True
+    http_server.files["/a.json"] = data = data[::-1]
+    assert asyncio.run(aio.download(*items[0])) is True
+    assert (tmp_path / "a.json").read_bytes() == data
+
+    with pytest.raises(aio.HTTPError):
+        asyncio.run(aio.download(http_server.url + "/d.json", tmp_path / "d.json"))
+
+
+def test_aio_download_truncated(http_server, tmp_path):
+    import asyncio
+
+    from pyabc2.sources import _http, aio
+
+    data = bytes(range(256)) * 10_000
+    http_server.files["/a.json"] = data
+    url, fp = http_server.url + "/a.json", tmp_path / "a.json"
+
+    http_server.truncate = 10
+    with pytest.raises(ConnectionError):
+        asyncio.run(aio.download(url, fp))
+    assert not fp.exists()
+    assert (tmp_path / "a.json.part").read_bytes() == data[:10]
+    assert not _http._read_meta(tmp_path)["a.json"]["complete"]
+
+    # Resumed
+    http_server.truncate = None
+    assert asyncio.run(aio.download(url, fp)) is True
+    assert http_server.requests[-1][1]["Range"] == "bytes=10-"
+    assert fp.read_bytes() == data
+
+    # .part file already complete
+    info = _http._read_meta(tmp_path)["a.json"]
+    (tmp_path / "a.json.part").write_bytes(data)
+    _http._update_meta(tmp_path, "a.json", {**info, "complete": False})
+    assert asyncio.run(aio.download(url, fp)) is True
+    assert fp.read_bytes() == data
+    assert _http._read_meta(tmp_path)["a.json"]["complete"]
+
+
+def test_aio_get_text(http_server):
+    import asyncio
+
+    from pyabc2.sources import aio
+
+    http_server.files["/a.txt"] = b"a"
+    http_server.delays["/a.txt"] = 0.2
+    url = http_server.url + "/a.txt"
+
+    async def main():
+        # Cancelling one of the callers doesn't cancel the shared request
+        t1 = asyncio.ensure_future(aio.get_text(url))
+        t2 = asyncio.ensure_future(aio.get_text(url))
+        await asyncio.sleep(0.05)
+        t1.cancel()
+        assert await t2 == "a"
+        assert t1.cancelled()
+        assert len(http_server.requests) == 1
+
+        # Cancelling all of them does
+        t3 = asyncio.ensure_future(aio.get_text(url))
+        await asyncio.sleep(0.05)
+        t3.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await t3
+        await asyncio.sleep(0.05)
+        assert not aio._inflight[asyncio.get_running_loop()]
+
+    asyncio.run(main())
+
+    # No response
+    http_server.delays.clear()
+    http_server.dropped.add("/a.txt")
+    with pytest.raises(ConnectionError):
+        asyncio.run(aio.get_text(url))
@@ -0,0 +1,159 @@
+import json
+
+import pytest
+
+from pyabc2 import Tune
+from pyabc2.sources import examples, load_example_abc
+from pyabc2.tunebook import TunebookIndex
+
+
+@pytest.fixture
+def tunebook(tmp_path):
+    abcs = [load_example_abc(title) for title in examples]
+    s = "%abc-2.1\nT:Book title\n\n"
+    s += "\n".join(f"X:{x}\n{abc}" for x, abc in enumerate(abcs, start=1))
+    s += "\nX:10\r\nT:Other Title\r\nT:Alt Title\r\nK:D\r\nDEF|\r\n"
+    fp = tmp_path / "book.abc"
+    fp.write_bytes(s.encode())
+
+    return fp
+
+
+def test_tunebook_index(tunebook):
+    index = TunebookIndex(tunebook)
+    assert len(index) == 3
+    assert index.xs == [1, 2, 10]
+    assert index.titles == ["For The Love Of Music", "Tell Her I Am", "Other Title"]
+    assert 2 in index and 3 not in index
+
+    tune = index[2]
+    assert type(tune) is Tune
+    assert tune.title == "Tell Her I Am"
+    assert tune.header["reference number"] == "2"
+    assert index.abc(1) == "X:1\n" + load_example_abc("for the love of music").strip()
+
+    assert index.find(title="alt title").title == "Other Title"
+    assert [t.title for t in index] == index.titles
+
+    with pytest.raises(KeyError):
+        index[3]
+    with pytest.raises(KeyError):
+        index.find(title="Book title")
+
+
+def test_tunebook_index_persist(tunebook):
+    index = TunebookIndex(tunebook)
+    assert index.index_path is not None and index.index_path.is_file()
+
+    d = json.loads(index.index_path.read_text())
+    assert [entry[0] for entry in d["tunes"]] == [1, 2, 10]
+
+    # Loaded from the saved index (not rescanned)
+    d["tunes"][0][3] = ["Saved"]
+    index.index_path.write_text(json.dumps(d))
+    assert TunebookIndex(tunebook).titles[0] == "Saved"
+
+    # File changed, rescanned
+    tunebook.write_text(tunebook.read_text() + "\nX:11\nT:New\nK:G\nGAB|\n")
+    index = TunebookIndex(tunebook)
+    assert index.xs == [1, 2, 10, 11]
+    assert index.titles[0] == "For The Love Of Music"
+    assert index[11].title == "New"
+
+    index = TunebookIndex(tunebook, persist=False)
+    assert index.index_path is None
+    assert len(index) == 4
+
+
+def test_tunebook_index_boundaries(tmp_path):
+    fp = tmp_path / "book.abc"
+    fp.write_text(
+        "X:1\nT:One\nK:G\nGAB|\nT:Part B\nBAG|\n"
+        "X:\nT:No Number\nK:D\nDEF|\n"
+        "X:3\nT:Three % comment\nK:A\nABc|\n"
+    )
+    index = TunebookIndex(fp, persist=False)
+    assert index.xs == [1, None, 3]
+    assert index.titles == ["One", "No Number", "Three"]
+    assert index.find(title="Three").title == "Three"
+
+    # Same titles as the header scan and full parsing
+    from pyabc2 import scan_headers
+
+    assert scan_headers(fp)["titles"] == [[t] for t in index.titles]
+    assert [t.title for t in index] == index.titles
+    assert index.abc(1).endswith("BAG|")
+    assert index.find(title="No Number").title == "No Number"
+    with pytest.raises(KeyError):
+        index.find(title="Part B")
+
+
+def test_tunebook_index_path(tunebook, tmp_path):
+    index_path = tmp_path / "indexes" / "book.json"
+    index_path.parent.mkdir()
+    index = TunebookIndex(tunebook, index_path=index_path)
+    assert index.index_path == index_path
+    assert index_path.is_file()
+    assert not tunebook.with_name(tunebook.name + ".index.json").exists()
+    assert TunebookIndex(tunebook, index_path=index_path).xs == [1, 2, 10]
+
+    # Not writable, just not saved
+    index = TunebookIndex(tunebook, index_path=tmp_path / "missing" / "book.json")
+    assert len(index) == 3
+
+
+def test_tunebook_index_empty(tmp_path):
+    fp = tmp_path / "empty.abc"
+    fp.write_text("")
+    assert len(TunebookIndex(fp)) == 0
+
+
+def test_scan_headers(tunebook):
+    from pyabc2 import scan_headers
+
+    abcs = [load_example_abc(title) for title in examples]
+    cat = scan_headers([tunebook, *abcs])
+    assert cat["source"] == [str(tunebook)] * 3 + [1, 2]
+    assert cat["x"] == [1, 2, 10, None, None]
+    assert cat["titles"][2] == ["Other Title", "Alt Title"]
+    assert cat["composer"][0] == "Liz Carroll"
+    assert cat["origin"] == [None] * 5
+
+    # Same header info as full parsing
+    index = TunebookIndex(tunebook, persist=False)
+    tunes = list(index) + [Tune(abc) for abc in abcs]
+    assert cat["title"] == [t.title for t in tunes]
+    assert cat["rhythm"] == [t.header.get("rhythm") for t in tunes]
+    assert cat["meter"] == [t.header.get("meter") for t in tunes]
+    assert cat["key"] == [t.header["key"] for t in tunes]
+
+    # Offsets
+    data = tunebook.read_bytes()
+    for start, stop, x in zip(cat["start"][:3], cat["stop"][:3], cat["x"]):
+        assert data[start:stop].decode().strip() == index.abc(x)
+    assert cat["stop"][3] == len(abcs[0].encode())
+
+    # Single source, path as string
+    assert scan_headers(str(tunebook))["x"] == [1, 2, 10]
+
+
+def test_scan_headers_frame(tunebook):
+    pytest.importorskip("pandas")
+    from pyabc2 import scan_headers
+
+    df = scan_headers(tunebook, as_frame=True)
+    assert df.columns.tolist() == [
+        "source",
+        "x",
+        "title",
+        "titles",
+        "rhythm",
+        "meter",
+        "key",
+        "composer",
+        "origin",
+        "start",
+        "stop",
+    ]
+    assert df.x.tolist() == [1, 2, 10]
+    assert df.title.tolist() == ["For The Love Of Music", "Tell Her I Am", "Other Title"]